@@ -1,9 +1,92 @@
 import re
-from typing import Dict, List, Any
+from functools import cached_property, lru_cache
+from typing import Dict, List, Any, Optional
+from skill_matcher import SkillMatcher, SkillOccurrences
+from sections import ResumeSections, segment_sections
+
+# Comprehensive multilingual skill database
+SKILLS_DATABASE = [
+    # Programming Languages
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "PHP", "Ruby", "Go", "Rust", "Swift", "Kotlin", "Scala", "R", "MATLAB", "Perl", "Dart", "Lua", "Objective-C", "C", "Assembly", "Fortran", "COBOL", "Haskell", "Clojure", "Erlang", "F#", "VB.NET", "Julia", "Groovy", "Elixir",
+
+    # Web Frontend
+    "React", "Angular", "Vue.js", "Vue", "Svelte", "Next.js", "Nuxt.js", "Gatsby", "Ember.js", "jQuery", "HTML", "HTML5", "CSS", "CSS3", "SASS", "SCSS", "LESS", "Bootstrap", "Tailwind CSS", "Tailwind", "Material-UI", "Ant Design", "Webpack", "Vite", "Babel", "ESLint", "Prettier",
+
+    # Web Backend
+    "Node.js", "Express", "Koa", "Fastify", "NestJS", "Django", "Flask", "FastAPI", "Spring", "Spring Boot", "Hibernate", "Laravel", "Symfony", "CodeIgniter", "Rails", "Ruby on Rails", "ASP.NET", "ASP.NET Core", ".NET", ".NET Core", "Gin", "Echo", "Fiber",
+
+    # Databases
+    "MySQL", "PostgreSQL", "SQLite", "Oracle", "SQL Server", "MariaDB", "MongoDB", "CouchDB", "Redis", "Memcached", "Cassandra", "HBase", "Neo4j", "InfluxDB", "DynamoDB", "Firebase", "Firestore", "SQL", "NoSQL", "GraphQL",
+
+    # Cloud Platforms
+    "AWS", "Amazon Web Services", "Azure", "Microsoft Azure", "Google Cloud", "GCP", "Google Cloud Platform", "IBM Cloud", "DigitalOcean", "Heroku", "Netlify", "Vercel",
+
+    # DevOps & Infrastructure
+    "Docker", "Kubernetes", "K8s", "Jenkins", "GitLab CI", "GitHub Actions", "CircleCI", "Travis CI", "Terraform", "CloudFormation", "Ansible", "Chef", "Puppet", "Vagrant", "NGINX", "Apache",
+
+    # Version Control
+    "Git", "GitHub", "GitLab", "Bitbucket", "SVN", "Mercurial",
+
+    # AI/ML/Data Science
+    "Machine Learning", "Deep Learning", "Neural Networks", "Artificial Intelligence", "Data Science", "Data Analysis", "Statistics", "TensorFlow", "PyTorch", "Keras", "Scikit-learn", "XGBoost", "Pandas", "NumPy", "SciPy", "Matplotlib", "Seaborn", "OpenCV", "NLTK", "spaCy", "Computer Vision", "NLP", "Natural Language Processing", "Jupyter", "Apache Spark", "Hadoop", "Kafka", "Airflow",
+
+    # Mobile Development
+    "iOS", "Android", "React Native", "Flutter", "Xamarin", "Ionic", "Unity", "Xcode", "Android Studio", "SwiftUI", "UIKit",
+
+    # Testing
+    "Jest", "Mocha", "Chai", "Jasmine", "Cypress", "Selenium", "TestNG", "JUnit", "PyTest", "RSpec", "PHPUnit", "Postman", "JMeter",
+
+    # Operating Systems
+    "Linux", "Ubuntu", "CentOS", "RHEL", "Debian", "Unix", "macOS", "Windows", "Windows Server",
+
+    # Shells & Scripting
+    "Bash", "PowerShell", "Shell Scripting", "AWK", "Sed",
+
+    # IDEs & Editors
+    "VS Code", "Visual Studio", "IntelliJ IDEA", "PyCharm", "WebStorm", "Eclipse", "NetBeans", "Atom", "Sublime Text", "Vim", "Emacs",
+
+    # Design & UI/UX
+    "Figma", "Sketch", "Adobe XD", "Photoshop", "Illustrator", "UI/UX", "User Experience", "User Interface", "Wireframing", "Prototyping",
+
+    # Project Management
+    "Agile", "Scrum", "Kanban", "JIRA", "Trello", "Asana", "Slack", "Microsoft Teams",
+
+    # Security
+    "Cybersecurity", "Information Security", "OWASP", "Penetration Testing", "OAuth", "JWT", "SSL/TLS",
+
+    # Other Technologies
+    "REST API", "REST", "API", "Microservices", "SOA", "WebSocket", "Blockchain", "IoT", "AR", "VR", "PWA", "SPA", "Serverless", "Lambda", "Event-Driven Architecture", "Message Queues", "RabbitMQ", "WebRTC", "Apollo", "Prisma"
+]
+
+# Common variations of canonical skill names
+SKILL_VARIATIONS = {
+    'javascript': ['js', 'ecmascript'],
+    'typescript': ['ts'],
+    'react': ['reactjs', 'react.js'],
+    'vue': ['vuejs', 'vue.js'],
+    'node.js': ['nodejs', 'node'],
+    'postgresql': ['postgres'],
+    'mongodb': ['mongo'],
+    'kubernetes': ['k8s'],
+    'machine learning': ['ml'],
+    'artificial intelligence': ['ai'],
+    'natural language processing': ['nlp'],
+    'user interface': ['ui'],
+    'user experience': ['ux'],
+    'amazon web services': ['aws'],
+    'google cloud platform': ['gcp'],
+    'microsoft azure': ['azure']
+}
+
+@lru_cache(maxsize=None)
+def skill_matcher() -> SkillMatcher:
+    """Matcher that finds every skill and alias in a single pass, compiled on first use"""
+    return SkillMatcher(SKILLS_DATABASE, SKILL_VARIATIONS)
 
 class AIHRAnalyser:
-    def __init__(self):
-        self.job_profiles = {
+    @cached_property
+    def job_profiles(self) -> Dict[str, Dict[str, Any]]:
+        return {
             # Software Engineering
             "Senior Software Engineer": {
                 "core_skills": ["Python", "Java", "JavaScript", "C++", "C#", "Go", "Rust"],
@@ -215,21 +298,27 @@ class AIHRAnalyser:
             }
         }
     
-    def extract_all_skills_comprehensive(self, text: str) -> Dict[str, List[str]]:
+    @cached_property
+    def profile_matrix(self):
+        """Profiles compiled once into weight matrices so job fit scores all of them in one pass"""
+        from profile_matrix import ProfileMatrix
+        return ProfileMatrix(self.job_profiles, self._are_similar_skills)
+    
+    def extract_all_skills_comprehensive(self, text: str, sections: Optional[ResumeSections] = None,
+                                         occurrences: Optional[SkillOccurrences] = None) -> Dict[str, List[str]]:
         """Extract skills comprehensively from entire resume text"""
         
-        # Extract from entire text first for maximum coverage
-        all_text_skills = self._extract_skills_from_text(text)
+        # One scan of the entire text for maximum coverage (reuse the caller's if it has one)
+        occurrences = occurrences or self.locate_skills(text)
+        all_text_skills = occurrences.all()
         
-        # Find specific sections for detailed analysis
-        skills_section = self._find_section(text, ["skills", "technical skills", "competencies", "technologies", "expertise", "proficiencies", "core competencies"])
-        projects_section = self._find_section(text, ["projects", "project experience", "portfolio", "work samples", "personal projects"])
-        experience_section = self._find_section(text, ["experience", "work experience", "professional experience", "employment", "career history"])
+        # Specific sections for detailed analysis, from the caller's segmentation if it has one
+        sections = sections or segment_sections(text)
         
-        # Extract from specific sections
-        skills_from_section = self._extract_skills_from_text(skills_section) if skills_section else []
-        skills_from_projects = self._extract_skills_from_text(projects_section) if projects_section else []
-        skills_from_experience = self._extract_skills_from_text(experience_section) if experience_section else []
+        # Section skills are the occurrences inside each section's span
+        skills_from_section = occurrences.within(sections.bounds("skills"))
+        skills_from_projects = occurrences.within(sections.bounds("projects"))
+        skills_from_experience = occurrences.within(sections.bounds("experience"))
         
         # Combine all sources for maximum skill detection
         combined_skills = list(set(all_text_skills + skills_from_section + skills_from_projects + skills_from_experience))
@@ -242,244 +331,91 @@ class AIHRAnalyser:
             "total_count": len(combined_skills)
         }
     
-    def _find_section(self, text: str, keywords: List[str]) -> str:
-        """Find specific section in resume with improved detection"""
-        lines = text.split('\n')
-        start_idx = -1
+    def _extract_skills_from_text(self, text: str) -> List[str]:
+        """Extract technical skills comprehensively from any language"""
+        return skill_matcher().find(text)
+    
+    def locate_skills(self, text: str) -> SkillOccurrences:
+        """Every skill occurrence in the text with its offsets, for per-section lookups"""
+        return skill_matcher().locate(text)
+    
+    def analyse_job_fit_like_hr(self, text: str, extracted_skills: Dict[str, List[str]],
+                                indicator_hits=None) -> List[Dict[str, Any]]:
+        """Analyse job fit like an experienced HR professional (indicator_hits: the text's project
+        indicators when the caller already has them, see ProfileMatrix.indicator_hits)"""
+        import numpy as np
         
-        # Look for section headers
-        for i, line in enumerate(lines):
-            line_clean = line.strip().lower()
-            if len(line_clean) == 0:
-                continue
-                
-            for keyword in keywords:
-                # Check if line contains keyword and looks like a header
-                if (keyword.lower() in line_clean and 
-                    (len(line_clean) < 80 or  # Short lines are likely headers
-                     line_clean.endswith(':') or  # Lines ending with colon
-                     line.isupper() or  # All caps headers
-                     re.match(r'^[A-Z][^a-z]*$', line.strip()) or  # Title case headers
-                     re.match(r'^\s*[-=*]{2,}', line))):
-                    start_idx = i
-                    break
-            if start_idx != -1:
-                break
+        all_skills = [skill.lower() for skill in extracted_skills["all_skills"]]
+        skills_section_skills = [skill.lower() for skill in extracted_skills["skills_section"]]
+        project_skills = [skill.lower() for skill in extracted_skills["project_skills"]]
         
-        if start_idx == -1:
-            return ""
+        matrix = self.profile_matrix
         
-        # Find next section or end of text
-        end_idx = len(lines)
-        section_keywords = ['experience', 'education', 'projects', 'skills', 'certifications', 'awards', 'achievements', 'qualifications', 'summary', 'objective', 'contact']
+        # Calculate skill matches across categories for every profile at once
+        skill_hits = matrix.candidate_hits(all_skills)
+        core_matches, framework_matches, database_matches, tools_matches = matrix.skill_matches(skill_hits)
         
-        for i in range(start_idx + 1, len(lines)):
-            line = lines[i].strip().lower()
-            if len(line) == 0:
-                continue
-                
-            # Check if this looks like a new section header
-            is_header = (len(line) < 80 or line.endswith(':') or 
-                        lines[i].isupper() or 
-                        re.match(r'^[A-Z][^a-z]*$', lines[i].strip()) or
-                        re.match(r'^\s*[-=*]{2,}', lines[i]))
-            
-            if is_header:
-                for section_kw in section_keywords:
-                    if section_kw in line and not any(kw in line for kw in keywords):
-                        end_idx = i
-                        break
-                if end_idx != len(lines):
-                    break
+        # Project relevance analysis
+        project_relevance = matrix.project_relevance(text, indicator_hits)
         
-        return '\n'.join(lines[start_idx:end_idx])
-    
-    def _extract_skills_from_text(self, text: str) -> List[str]:
-        """Extract technical skills comprehensively from any language"""
+        # Calculate weighted scores
+        skill_score = (core_matches * 3 + framework_matches * 2 + database_matches * 2 + tools_matches * 1) / 8
+        project_score = project_relevance / 10
         
-        # Comprehensive multilingual skill database
-        skills_database = [
-            # Programming Languages
-            "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "PHP", "Ruby", "Go", "Rust", "Swift", "Kotlin", "Scala", "R", "MATLAB", "Perl", "Dart", "Lua", "Objective-C", "C", "Assembly", "Fortran", "COBOL", "Haskell", "Clojure", "Erlang", "F#", "VB.NET", "Julia", "Groovy", "Elixir",
-            
-            # Web Frontend
-            "React", "Angular", "Vue.js", "Vue", "Svelte", "Next.js", "Nuxt.js", "Gatsby", "Ember.js", "jQuery", "HTML", "HTML5", "CSS", "CSS3", "SASS", "SCSS", "LESS", "Bootstrap", "Tailwind CSS", "Tailwind", "Material-UI", "Ant Design", "Webpack", "Vite", "Babel", "ESLint", "Prettier",
-            
-            # Web Backend
-            "Node.js", "Express", "Koa", "Fastify", "NestJS", "Django", "Flask", "FastAPI", "Spring", "Spring Boot", "Hibernate", "Laravel", "Symfony", "CodeIgniter", "Rails", "Ruby on Rails", "ASP.NET", "ASP.NET Core", ".NET", ".NET Core", "Gin", "Echo", "Fiber",
-            
-            # Databases
-            "MySQL", "PostgreSQL", "SQLite", "Oracle", "SQL Server", "MariaDB", "MongoDB", "CouchDB", "Redis", "Memcached", "Cassandra", "HBase", "Neo4j", "InfluxDB", "DynamoDB", "Firebase", "Firestore", "SQL", "NoSQL", "GraphQL",
-            
-            # Cloud Platforms
-            "AWS", "Amazon Web Services", "Azure", "Microsoft Azure", "Google Cloud", "GCP", "Google Cloud Platform", "IBM Cloud", "DigitalOcean", "Heroku", "Netlify", "Vercel",
-            
-            # DevOps & Infrastructure
-            "Docker", "Kubernetes", "K8s", "Jenkins", "GitLab CI", "GitHub Actions", "CircleCI", "Travis CI", "Terraform", "CloudFormation", "Ansible", "Chef", "Puppet", "Vagrant", "NGINX", "Apache",
-            
-            # Version Control
-            "Git", "GitHub", "GitLab", "Bitbucket", "SVN", "Mercurial",
-            
-            # AI/ML/Data Science
-            "Machine Learning", "Deep Learning", "Neural Networks", "Artificial Intelligence", "Data Science", "Data Analysis", "Statistics", "TensorFlow", "PyTorch", "Keras", "Scikit-learn", "XGBoost", "Pandas", "NumPy", "SciPy", "Matplotlib", "Seaborn", "OpenCV", "NLTK", "spaCy", "Computer Vision", "NLP", "Natural Language Processing", "Jupyter", "Apache Spark", "Hadoop", "Kafka", "Airflow",
-            
-            # Mobile Development
-            "iOS", "Android", "React Native", "Flutter", "Xamarin", "Ionic", "Unity", "Xcode", "Android Studio", "SwiftUI", "UIKit",
-            
-            # Testing
-            "Jest", "Mocha", "Chai", "Jasmine", "Cypress", "Selenium", "TestNG", "JUnit", "PyTest", "RSpec", "PHPUnit", "Postman", "JMeter",
-            
-            # Operating Systems
-            "Linux", "Ubuntu", "CentOS", "RHEL", "Debian", "Unix", "macOS", "Windows", "Windows Server",
-            
-            # Shells & Scripting
-            "Bash", "PowerShell", "Shell Scripting", "AWK", "Sed",
-            
-            # IDEs & Editors
-            "VS Code", "Visual Studio", "IntelliJ IDEA", "PyCharm", "WebStorm", "Eclipse", "NetBeans", "Atom", "Sublime Text", "Vim", "Emacs",
-            
-            # Design & UI/UX
-            "Figma", "Sketch", "Adobe XD", "Photoshop", "Illustrator", "UI/UX", "User Experience", "User Interface", "Wireframing", "Prototyping",
-            
-            # Project Management
-            "Agile", "Scrum", "Kanban", "JIRA", "Trello", "Asana", "Slack", "Microsoft Teams",
-            
-            # Security
-            "Cybersecurity", "Information Security", "OWASP", "Penetration Testing", "OAuth", "JWT", "SSL/TLS",
-            
-            # Other Technologies
-            "REST API", "REST", "API", "Microservices", "SOA", "WebSocket", "Blockchain", "IoT", "AR", "VR", "PWA", "SPA", "Serverless", "Lambda", "Event-Driven Architecture", "Message Queues", "RabbitMQ", "WebRTC", "Apollo", "Prisma"
-        ]
+        # Experience level assessment (depends only on the seniority level)
+        experience_by_seniority = {seniority: self._assess_experience_level(text, seniority)
+                                   for seniority in set(matrix.seniority)}
+        experience_score = np.array([experience_by_seniority[seniority] for seniority in matrix.seniority])
         
-        found_skills = []
-        text_lower = text.lower()
+        # Final weighted score
+        final_score = (
+            skill_score * matrix.skills_weight +
+            project_score * matrix.projects_weight +
+            experience_score * matrix.experience_weight
+        ) * 100
         
-        # Direct skill matching with fuzzy logic
-        for skill in skills_database:
-            skill_lower = skill.lower()
-            
-            # Exact match
-            if re.search(r'\b' + re.escape(skill_lower) + r'\b', text_lower):
-                found_skills.append(skill)
-                continue
-            
-            # Common variations
-            variations = {
-                'javascript': ['js', 'ecmascript'],
-                'typescript': ['ts'],
-                'react': ['reactjs', 'react.js'],
-                'vue': ['vuejs', 'vue.js'],
-                'node.js': ['nodejs', 'node'],
-                'postgresql': ['postgres'],
-                'mongodb': ['mongo'],
-                'kubernetes': ['k8s'],
-                'machine learning': ['ml'],
-                'artificial intelligence': ['ai'],
-                'natural language processing': ['nlp'],
-                'user interface': ['ui'],
-                'user experience': ['ux'],
-                'amazon web services': ['aws'],
-                'google cloud platform': ['gcp'],
-                'microsoft azure': ['azure']
-            }
-            
-            if skill_lower in variations:
-                for variation in variations[skill_lower]:
-                    if re.search(r'\b' + re.escape(variation) + r'\b', text_lower):
-                        found_skills.append(skill)
-                        break
+        # HR-like minimum requirements check
+        total_skill_matches = core_matches + framework_matches + database_matches + tools_matches
+        final_score = np.where(total_skill_matches < matrix.min_skills, np.maximum(final_score - 20, 0), final_score)
         
-        # Clean and deduplicate
-        cleaned_skills = []
-        for skill in found_skills:
-            skill = skill.strip()
-            if len(skill) > 1 and skill not in cleaned_skills:
-                cleaned_skills.append(skill)
+        # Bonus for skills diversity
+        if len(set(all_skills)) > 10:
+            final_score = final_score + 5
         
-        return cleaned_skills
-    
-    def analyse_job_fit_like_hr(self, text: str, extracted_skills: Dict[str, List[str]]) -> List[Dict[str, Any]]:
-        """Analyse job fit like an experienced HR professional"""
+        # Project skills bonus
+        if len(project_skills) > 3:
+            final_score = final_score + 5
         
-        all_skills = [skill.lower() for skill in extracted_skills["all_skills"]]
-        skills_section_skills = [skill.lower() for skill in extracted_skills["skills_section"]]
-        project_skills = [skill.lower() for skill in extracted_skills["project_skills"]]
+        final_scores = np.minimum(final_score.astype(np.int64), 100)
         
+        # Only the top 3 are returned like HR would prioritize, so only they get a full write-up
         job_matches = []
-        
-        for job_title, profile in self.job_profiles.items():
-            # Calculate skill matches across categories
-            core_matches = self._count_skill_matches(all_skills, profile["core_skills"])
-            framework_matches = self._count_skill_matches(all_skills, profile["framework_skills"])
-            database_matches = self._count_skill_matches(all_skills, profile["database_skills"])
-            tools_matches = self._count_skill_matches(all_skills, profile["tools_skills"])
-            
-            # Project relevance analysis
-            project_relevance = self._analyse_project_relevance(text, profile["project_indicators"])
-            
-            # Calculate weighted scores
-            skill_score = (core_matches * 3 + framework_matches * 2 + database_matches * 2 + tools_matches * 1) / 8
-            project_score = project_relevance / 10
-            
-            # Experience level assessment
-            experience_score = self._assess_experience_level(text, profile["seniority"])
-            
-            # Final weighted score
-            final_score = (
-                skill_score * profile["skills_weight"] +
-                project_score * profile["projects_weight"] +
-                experience_score * profile["experience_weight"]
-            ) * 100
-            
-            # HR-like minimum requirements check
-            total_skill_matches = core_matches + framework_matches + database_matches + tools_matches
-            if total_skill_matches < profile["min_skills"]:
-                final_score = max(final_score - 20, 0)
-            
-            # Bonus for skills diversity
-            if len(set(all_skills)) > 10:
-                final_score += 5
-            
-            # Project skills bonus
-            if len(project_skills) > 3:
-                final_score += 5
-            
-            final_score = min(int(final_score), 100)
+        for index in matrix.top_k(final_scores, 3):
+            job_title = matrix.titles[index]
+            profile = matrix.profiles[index]
+            score = int(final_scores[index])
             
             # Generate HR-like assessment
-            matching_skills = self._get_matching_skills(all_skills, profile)
-            missing_critical = self._get_missing_critical_skills(all_skills, profile)
-            hr_assessment = self._generate_hr_assessment(final_score, total_skill_matches, project_relevance, job_title, matching_skills)
+            matching_skills = matrix.matching_skills(index, skill_hits)
+            missing_critical = matrix.missing_critical_skills(index, skill_hits)
+            hr_assessment = self._generate_hr_assessment(score, int(total_skill_matches[index]), int(project_relevance[index]), job_title, matching_skills)
             
             job_matches.append({
                 "job_title": job_title,
-                "match_percentage": final_score,
+                "match_percentage": score,
                 "matching_skills": matching_skills,
                 "missing_skills": missing_critical,
                 "match_reasons": hr_assessment,
                 "skill_breakdown": {
-                    "core": f"{core_matches}/{len(profile['core_skills'])}",
-                    "frameworks": f"{framework_matches}/{len(profile['framework_skills'])}",
-                    "databases": f"{database_matches}/{len(profile['database_skills'])}",
-                    "tools": f"{tools_matches}/{len(profile['tools_skills'])}"
+                    "core": f"{core_matches[index]}/{len(profile['core_skills'])}",
+                    "frameworks": f"{framework_matches[index]}/{len(profile['framework_skills'])}",
+                    "databases": f"{database_matches[index]}/{len(profile['database_skills'])}",
+                    "tools": f"{tools_matches[index]}/{len(profile['tools_skills'])}"
                 },
-                "hr_recommendation": self._get_hr_recommendation(final_score, job_title)
+                "hr_recommendation": self._get_hr_recommendation(score, job_title)
             })
         
-        # Sort and return top 3 like HR would prioritize
-        job_matches.sort(key=lambda x: x["match_percentage"], reverse=True)
-        return job_matches[:3]
-    
-    def _count_skill_matches(self, candidate_skills: List[str], required_skills: List[str]) -> int:
-        """Count skill matches with fuzzy matching"""
-        matches = 0
-        for req_skill in required_skills:
-            for cand_skill in candidate_skills:
-                if (req_skill.lower() in cand_skill or cand_skill in req_skill.lower() or
-                    self._are_similar_skills(req_skill.lower(), cand_skill)):
-                    matches += 1
-                    break
-        return matches
+        return job_matches
     
     def _are_similar_skills(self, skill1: str, skill2: str) -> bool:
         """Check if skills are similar (e.g., React and React.js)"""
@@ -521,38 +457,6 @@ class AIHRAnalyser:
         
         return 0.7  # Default
     
-    def _get_matching_skills(self, candidate_skills: List[str], profile: Dict) -> List[str]:
-        """Get all matching skills"""
-        all_required = (profile["core_skills"] + profile["framework_skills"] + 
-                       profile["database_skills"] + profile["tools_skills"])
-        
-        matching = []
-        for req_skill in all_required:
-            for cand_skill in candidate_skills:
-                if (req_skill.lower() in cand_skill or cand_skill in req_skill.lower() or
-                    self._are_similar_skills(req_skill.lower(), cand_skill)):
-                    matching.append(req_skill)
-                    break
-        
-        return list(set(matching))
-    
-    def _get_missing_critical_skills(self, candidate_skills: List[str], profile: Dict) -> List[str]:
-        """Get missing critical skills"""
-        critical_skills = profile["core_skills"] + profile["framework_skills"][:2]
-        
-        missing = []
-        for skill in critical_skills:
-            found = False
-            for cand_skill in candidate_skills:
-                if (skill.lower() in cand_skill or cand_skill in skill.lower() or
-                    self._are_similar_skills(skill.lower(), cand_skill)):
-                    found = True
-                    break
-            if not found:
-                missing.append(skill)
-        
-        return missing[:5]
-    
     def _generate_hr_assessment(self, score: int, skill_matches: int, project_relevance: int, job_title: str, matching_skills: List[str]) -> List[str]:
         """Generate AI-powered personalized assessment for each job role"""
         assessment = []
@@ -0,0 +1,186 @@
+"""
+Content-addressed, multi-level cache for resume analysis results
+
+Level 1: file bytes hash -> extracted text
+Level 2: text hash -> extracted features (skills, contact, sections, job fit, ATS)
+Level 3: text hash + request parameters -> final response
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+def content_hash(data) -> str:
+    """SHA-256 hex digest of bytes or text"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a cached value in bytes"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 1024
+
+class LRUCache:
+    """Thread-safe LRU cache bounded by total byte size, with per-entry TTL and hit/miss counters"""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, size: Optional[int] = None):
+        if size is None:
+            size = estimate_size(value)
+        # Values larger than the whole budget are not worth caching
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + self.ttl_seconds)
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _remove(self, key: Hashable):
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
+
+class AnalysisCache:
+    def __init__(self, max_bytes: Optional[int] = None, ttl_seconds: Optional[float] = None,
+                 persistent: Optional[bool] = None):
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get("ANALYSIS_CACHE_MAX_MB", 64)) * 1024 * 1024)
+        if ttl_seconds is None:
+            ttl_seconds = float(os.environ.get("ANALYSIS_CACHE_TTL", 3600))
+        if persistent is None:
+            persistent = os.environ.get("ANALYSIS_CACHE_PERSIST", "0").lower() in ("1", "true", "yes")
+
+        self.ttl_seconds = ttl_seconds
+        self.persistent = persistent
+        self.persistent_hits = 0
+        self.persistent_misses = 0
+        self._db_ready = False
+
+        # Split the memory budget across the three levels
+        level_bytes = max(max_bytes // 3, 1)
+        self.texts = LRUCache(level_bytes, ttl_seconds)        # file hash -> (text hash, text)
+        self.features = LRUCache(level_bytes, ttl_seconds)     # text hash -> features
+        self.responses = LRUCache(level_bytes, ttl_seconds)    # (text hash, translate_to) -> response
+
+    def lookup(self, file_key: str, translate_to: Optional[str]) -> Tuple[Optional[str], Optional[dict], Optional[dict]]:
+        """Return the cached (text, features, response) for a file; any of them may be None"""
+        cached_text = self.texts.get(file_key)
+        if cached_text is None:
+            return None, None, None
+
+        text_key, text = cached_text
+        response = self.responses.get((text_key, translate_to or ""))
+        if response is not None:
+            return text, None, response
+        return text, self.features.get(text_key), None
+
+    def store(self, file_key: str, stages: Dict[str, Any], translate_to: Optional[str]):
+        """Populate all three levels from the output of run_analysis_stages"""
+        text = stages["text"]
+        text_key = content_hash(text)
+        self.texts.set(file_key, (text_key, text), size=estimate_size(text))
+        self.features.set(text_key, stages["features"])
+        self.responses.set((text_key, translate_to or ""), stages["response"])
+
+    def load_persisted(self, file_key: str, translate_to: Optional[str]) -> Optional[dict]:
+        """Look up a response in the persistent tier (analysis_history table)"""
+        if not self.persistent:
+            return None
+        from database.models import get_cached_analysis
+        self._ensure_db()
+        response = get_cached_analysis(file_key, translate_to or "", self.ttl_seconds)
+        if response is None:
+            self.persistent_misses += 1
+        else:
+            self.persistent_hits += 1
+        return response
+
+    def persist(self, file_key: str, filename: str, translate_to: Optional[str], response: dict):
+        if not self.persistent:
+            return
+        from database.models import save_analysis_result
+        self._ensure_db()
+        save_analysis_result(filename, file_key, translate_to or "", response)
+
+    def _ensure_db(self):
+        if not self._db_ready:
+            from database.models import init_db
+            init_db()
+            self._db_ready = True
+
+    def clear(self):
+        self.texts.clear()
+        self.features.clear()
+        self.responses.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "text": self.texts.stats(),
+            "features": self.features.stats(),
+            "response": self.responses.stats(),
+            "persistent": {
+                "enabled": self.persistent,
+                "hits": self.persistent_hits,
+                "misses": self.persistent_misses
+            },
+            "ttl_seconds": self.ttl_seconds
+        }
@@ -2,8 +2,16 @@
 ATS (Applicant Tracking System) AI Analyzer for precision resume matching
 """
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from ai_hr_analyser import AIHRAnalyser
+from job_match import JobDescription, ResumeMatchProfile, score_job_descriptions
+
+# Common high-value keywords often missing
+IMPORTANT_KEYWORDS = [
+    'leadership', 'management', 'project management', 'team lead',
+    'problem solving', 'analytical', 'communication', 'collaboration',
+    'agile', 'scrum', 'ci/cd', 'devops', 'cloud', 'api'
+]
 
 class ATSAnalyser:
     def __init__(self):
@@ -30,20 +38,18 @@ class ATSAnalyser:
             }
         }
     
-    def analyse_ats_compatibility(self, resume_text: str, job_description: str = "") -> Dict:
-        """Comprehensive ATS analysis with AI precision"""
-        
-        # Extract resume data
-        skills = self.hr_analyser._extract_skills_from_text(resume_text)
+    def analyse_ats_compatibility(self, resume_text: str, job_description: str = "", text_stats: Optional[Dict] = None) -> Dict:
+        """Comprehensive ATS analysis with AI precision (text_stats: the resume's, when already computed)"""
+        stats = text_stats or self.text_stats(resume_text)
         
         # ATS keyword matching
-        keyword_matches = self._match_ats_keywords(resume_text)
+        keyword_matches = self._match_ats_keywords(stats)
         
         # Format analysis
-        format_score = self._analyse_format(resume_text)
+        format_score = self._analyse_format(stats)
         
         # Readability score
-        readability_score = self._calculate_readability(resume_text)
+        readability_score = self._calculate_readability(stats)
         
         # Job matching if job description provided
         job_match_score = 0
@@ -60,20 +66,60 @@ class ATSAnalyser:
             'readability_score': readability_score,
             'job_match_score': job_match_score,
             'recommendations': self._generate_ats_recommendations(ats_score, keyword_matches, format_score),
-            'missing_keywords': self._find_missing_keywords(resume_text),
+            'missing_keywords': self._find_missing_keywords(stats),
             'ats_friendly': ats_score >= 70
         }
     
-    def _match_ats_keywords(self, text: str) -> Dict:
+    def text_stats(self, text: str) -> Dict:
+        """Keyword presence and character counts every ATS score is computed from
+        
+        Nothing counted here spans a line break, so the stats of a text are merge_text_stats
+        of the stats of its sections when it is cut at line breaks.
+        """
+        text_lower = text.lower()
+        return {
+            'keywords': [keyword for keywords in self.ats_keywords.values() for keyword in keywords
+                         if keyword.lower() in text_lower],
+            'important_keywords': [keyword for keyword in IMPORTANT_KEYWORDS if keyword in text_lower],
+            'section_words': any(section in text_lower for section in ['experience', 'education', 'skills']),
+            'has_year': re.search(r'\d{4}', text) is not None,
+            'has_email': re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text) is not None,
+            'has_phone': re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', text) is not None,
+            'line_breaks': text.count('\n'),
+            'tabs': text.count('\t'),
+            'pipes': text.count('|'),
+            'non_ascii': len(re.findall(r'[^\x00-\x7F]', text)),
+            'special_chars': len(re.findall(r'[^\w\s\-.,()@/:]', text)),
+            'words': len(text.split()),
+            'sentences': len(re.findall(r'[.!?]+', text))
+        }
+    
+    @staticmethod
+    def merge_text_stats(parts: Sequence[Dict]) -> Dict:
+        """Stats of a text from the stats of consecutive sections of it (see text_stats)"""
+        merged: Dict = {}
+        for stats in parts:
+            for name, value in stats.items():
+                if name not in merged:
+                    merged[name] = list(value) if isinstance(value, list) else value
+                elif isinstance(value, bool):
+                    merged[name] = merged[name] or value
+                elif isinstance(value, list):
+                    merged[name] += [item for item in value if item not in merged[name]]
+                else:
+                    merged[name] += value
+        return merged
+    
+    def _match_ats_keywords(self, stats: Dict) -> Dict:
         """Match ATS keywords with weighted scoring"""
         matches = {'technical': [], 'soft_skills': [], 'experience': [], 'education': []}
         scores = {'technical': 0, 'soft_skills': 0, 'experience': 0, 'education': 0}
         
-        text_lower = text.lower()
+        found = set(stats['keywords'])
         
         for category, keywords in self.ats_keywords.items():
             for keyword, weight in keywords.items():
-                if keyword.lower() in text_lower:
+                if keyword in found:
                     matches[category].append(keyword)
                     scores[category] += weight
         
@@ -83,33 +129,33 @@ class ATSAnalyser:
             'total_score': sum(scores.values())
         }
     
-    def _analyse_format(self, text: str) -> int:
+    def _analyse_format(self, stats: Dict) -> int:
         """Analyse resume format for ATS compatibility"""
         score = 100
         
         # Check for problematic formatting
-        if len(re.findall(r'[^\x00-\x7F]', text)) > 50:  # Too many special characters
+        if stats['non_ascii'] > 50:  # Too many special characters
             score -= 10
         
-        if len(text.split('\n')) < 10:  # Too few line breaks
+        if stats['line_breaks'] + 1 < 10:  # Too few line breaks
             score -= 15
         
-        if len(re.findall(r'\t', text)) > 20:  # Too many tabs
+        if stats['tabs'] > 20:  # Too many tabs
             score -= 10
         
         # Check for good structure
-        if any(section in text.lower() for section in ['experience', 'education', 'skills']):
+        if stats['section_words']:
             score += 10
         
-        if re.search(r'\d{4}', text):  # Has years
+        if stats['has_year']:  # Has years
             score += 5
         
         return max(0, min(100, score))
     
-    def _calculate_readability(self, text: str) -> int:
+    def _calculate_readability(self, stats: Dict) -> int:
         """Calculate readability score for ATS"""
-        words = len(text.split())
-        sentences = len(re.findall(r'[.!?]+', text))
+        words = stats['words']
+        sentences = stats['sentences']
         
         if sentences == 0:
             return 50
@@ -125,21 +171,30 @@ class ATSAnalyser:
             return 60
     
     def _match_job_description(self, resume_text: str, job_description: str) -> int:
-        """Match resume against job description"""
-        resume_words = set(resume_text.lower().split())
-        job_words = set(job_description.lower().split())
-        
-        # Filter meaningful words (length > 3)
-        resume_words = {word for word in resume_words if len(word) > 3}
-        job_words = {word for word in job_words if len(word) > 3}
-        
-        if not job_words:
-            return 0
-        
-        matches = resume_words.intersection(job_words)
-        match_percentage = (len(matches) / len(job_words)) * 100
+        """Match resume against job description (required skills and normalized keywords)"""
+        return score_job_descriptions(ResumeMatchProfile(resume_text), [JobDescription(job_description)])[0]["score"]
+    
+    def match_job_descriptions(self, resume_text: str, jobs: Sequence[JobDescription]) -> Dict:
+        """Score one resume against many job descriptions; the resume is analysed only once"""
+        resume = ResumeMatchProfile(resume_text)
+        stats = self.text_stats(resume_text)
+        keyword_matches = self._match_ats_keywords(stats)
+        format_score = self._analyse_format(stats)
+        readability_score = self._calculate_readability(stats)
+        
+        matches = score_job_descriptions(resume, jobs)
+        for index, (job, match) in enumerate(zip(jobs, matches)):
+            match["index"] = index
+            match["job_key"] = job.key
+            match["ats_score"] = self._calculate_ats_score(keyword_matches, format_score, readability_score, match["score"])
         
-        return min(100, int(match_percentage))
+        return {
+            "resume_skills": resume.skills,
+            "ats_score": self._calculate_ats_score(keyword_matches, format_score, readability_score, 0),
+            "format_score": format_score,
+            "readability_score": readability_score,
+            "matches": matches
+        }
     
     def _calculate_ats_score(self, keyword_matches: Dict, format_score: int, readability_score: int, job_match_score: int) -> int:
         """Calculate overall ATS compatibility score"""
@@ -183,46 +238,35 @@ class ATSAnalyser:
         
         return recommendations
     
-    def _find_missing_keywords(self, text: str) -> List[str]:
+    def _find_missing_keywords(self, stats: Dict) -> List[str]:
         """Find commonly missing ATS keywords"""
-        text_lower = text.lower()
-        missing = []
-        
-        # Common high-value keywords often missing
-        important_keywords = [
-            'leadership', 'management', 'project management', 'team lead',
-            'problem solving', 'analytical', 'communication', 'collaboration',
-            'agile', 'scrum', 'ci/cd', 'devops', 'cloud', 'api'
-        ]
-        
-        for keyword in important_keywords:
-            if keyword not in text_lower:
-                missing.append(keyword)
+        found = set(stats['important_keywords'])
+        missing = [keyword for keyword in IMPORTANT_KEYWORDS if keyword not in found]
         
         return missing[:10]  # Return top 10 missing keywords
     
-    def scan_for_ats_issues(self, text: str) -> Dict:
+    def scan_for_ats_issues(self, text: str, text_stats: Optional[Dict] = None) -> Dict:
         """Scan for specific ATS parsing issues"""
+        stats = text_stats or self.text_stats(text)
         issues = []
         
         # Check for graphics/tables
-        if '|' in text and text.count('|') > 10:
+        if stats['pipes'] > 10:
             issues.append("Contains table formatting that may not parse correctly")
         
         # Check for special characters
-        special_chars = len(re.findall(r'[^\w\s\-.,()@/:]', text))
-        if special_chars > 20:
+        if stats['special_chars'] > 20:
             issues.append("Contains many special characters that may cause parsing errors")
         
         # Check for contact info
-        if not re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
+        if not stats['has_email']:
             issues.append("Missing email address")
         
-        if not re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', text):
+        if not stats['has_phone']:
             issues.append("Missing phone number")
         
         return {
             'issues_found': len(issues),
             'issues': issues,
             'ats_friendly': len(issues) < 3
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,93 @@
+"""
+Input handling for batch resume analysis: limits and expansion of uploads and ZIP archives
+
+Entries are listed up front from the declared sizes (multipart file sizes, ZIP headers)
+but their content is only read, or decompressed, when the entry is analysed, so a batch
+never holds more than the in-flight entries in memory. BatchBudget caps the bytes a
+whole batch reads and decompresses, which the per-entry limit alone does not bound.
+"""
+import os
+import threading
+import zipfile
+from typing import Any, Dict, List, Optional, Tuple
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+
+# Limits for POST /api/analyse-resumes
+BATCH_MAX_FILES = int(os.environ.get("BATCH_MAX_FILES", 500))
+BATCH_MAX_ENTRY_BYTES = int(float(os.environ.get("BATCH_MAX_ENTRY_MB", 10)) * 1024 * 1024)
+BATCH_MAX_ARCHIVE_BYTES = int(float(os.environ.get("BATCH_MAX_ARCHIVE_MB", 200)) * 1024 * 1024)
+BATCH_MAX_TOTAL_BYTES = int(float(os.environ.get("BATCH_MAX_TOTAL_MB", 200)) * 1024 * 1024)
+
+class EntryError(ValueError):
+    """An entry that cannot be analysed; the message is reported in its NDJSON record"""
+
+class BatchBudget:
+    """Bytes a batch may still read or decompress, shared by its entries (thread-safe)"""
+
+    def __init__(self, max_bytes: int = BATCH_MAX_TOTAL_BYTES):
+        self.max_bytes = max_bytes
+        self.remaining = max_bytes
+        self._lock = threading.Lock()
+
+    def charge(self, size: int):
+        with self._lock:
+            if size > self.remaining:
+                raise EntryError(batch_too_large(self.max_bytes))
+            self.remaining -= size
+
+def batch_too_large(max_bytes: int = BATCH_MAX_TOTAL_BYTES) -> str:
+    return f"Batch too large. Maximum {max_bytes // (1024 * 1024)}MB of resumes per batch"
+
+def batch_entry(filename: str, source: Any = None, error: str = None, size: int = 0) -> Dict[str, Any]:
+    """One resume of a batch: its source (an UploadFile, or (archive, member) of a ZIP) and
+    declared size; entries with an error are reported without being read"""
+    return {"filename": filename, "source": source, "error": error, "size": size}
+
+def check_entry(filename: str, size: int) -> str:
+    """Reason an entry is rejected before reading it, or None"""
+    if not filename.lower().endswith(SUPPORTED_EXTENSIONS):
+        return "Only PDF and DOCX files supported"
+    if size > BATCH_MAX_ENTRY_BYTES:
+        return f"File size too large. Maximum {BATCH_MAX_ENTRY_BYTES // (1024 * 1024)}MB allowed"
+    return None
+
+def expand_archive(source, archive_name: str, max_entries: int) -> Tuple[Optional[zipfile.ZipFile], List[Dict[str, Any]]]:
+    """Open a ZIP archive (bytes-like file or path) and list its resumes as batch entries
+
+    Nothing is decompressed here: read_member does it when the entry is analysed. The
+    archive stays open until the batch is done.
+    """
+    try:
+        archive = zipfile.ZipFile(source)
+    except (zipfile.BadZipFile, OSError):
+        return None, [batch_entry(archive_name, error="Invalid ZIP archive")]
+
+    entries = []
+    for info in archive.infolist():
+        name = info.filename
+        base_name = os.path.basename(name)
+        # Skip folders and OS metadata such as __MACOSX/ and .DS_Store
+        if info.is_dir() or not base_name or base_name.startswith('.') or name.startswith('__MACOSX/'):
+            continue
+        if len(entries) >= max_entries:
+            break
+        entries.append(batch_entry(name, (archive, info), check_entry(name, info.file_size), info.file_size))
+
+    return archive, entries
+
+def read_member(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+    """Decompress one archive entry, never past the per-entry limit"""
+    try:
+        with archive.open(info) as member:
+            # The header size can lie, so never decompress more than the limit allows
+            content = member.read(BATCH_MAX_ENTRY_BYTES + 1)
+    except (zipfile.BadZipFile, RuntimeError, NotImplementedError, OSError):
+        raise EntryError("Unable to read archive entry")
+    check_size(info.filename, len(content))
+    return content
+
+def check_size(filename: str, size: int):
+    """EntryError if the bytes actually read exceed the per-entry limit"""
+    if size > BATCH_MAX_ENTRY_BYTES:
+        raise EntryError(check_entry(filename, size))
@@ -0,0 +1,68 @@
+"""
+Benchmark: one resume against many job descriptions
+
+Scores each long resume of benchmarks.resume_corpus against JOBS synthetic job
+descriptions three ways: ATSAnalyser.analyse_ats_compatibility once per job description
+(the only way to pass one before /api/ats-match), match_job_descriptions with the job
+description features computed on the spot (a cold cache), and match_job_descriptions
+with cached features (the steady state of re-scoring open requisitions). Fails if the
+cached path is not faster than the per-job-description loop.
+
+    python -m benchmarks.bench_ats_match
+Run from the backend directory.
+"""
+import random
+import sys
+import time
+from typing import Callable
+
+from benchmarks.resume_corpus import generate_resume, LANGUAGES
+
+JOBS = 500
+REPEATS = 3
+
+def job_descriptions(count: int, seed: int = 0):
+    from ai_hr_analyser import SKILLS_DATABASE
+    rng = random.Random(seed)
+    return [
+        f"Requisition {index}: {rng.choice(['Senior', 'Junior', 'Lead', 'Staff'])} engineer. "
+        f"Required: {', '.join(rng.sample(SKILLS_DATABASE, 6))}. Nice to have: {', '.join(rng.sample(SKILLS_DATABASE, 3))}. "
+        "You will design, build and operate distributed services, mentor colleagues and review code."
+        for index in range(count)
+    ]
+
+def best_ms(call: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    from ats_analyser import ATSAnalyser
+    from job_match import JobDescriptionCache
+
+    analyser = ATSAnalyser()
+    texts = job_descriptions(JOBS)
+    cache = JobDescriptionCache()
+    cache.get_many(texts)
+
+    print(f"{'resume':<10} {'per-JD loop ms':>15} {'cold ms':>10} {'cached ms':>10} {'speedup':>8}")
+    totals = [0.0, 0.0, 0.0]
+    for language in LANGUAGES:
+        resume = generate_resume(language, "long")
+        loop_ms = best_ms(lambda: [analyser.analyse_ats_compatibility(resume, text) for text in texts])
+        cold_ms = best_ms(lambda: analyser.match_job_descriptions(resume, JobDescriptionCache().get_many(texts)))
+        cached_ms = best_ms(lambda: analyser.match_job_descriptions(resume, cache.get_many(texts)))
+        for slot, value in enumerate((loop_ms, cold_ms, cached_ms)):
+            totals[slot] += value
+        print(f"{language + '/long':<10} {loop_ms:>15.1f} {cold_ms:>10.1f} {cached_ms:>10.1f} {loop_ms / cached_ms:>7.0f}x")
+    print(f"{'total':<10} {totals[0]:>15.1f} {totals[1]:>10.1f} {totals[2]:>10.1f} {totals[0] / totals[2]:>7.0f}x")
+
+    if totals[2] >= totals[0]:
+        print("FAIL cached matching is not faster than scoring job descriptions one by one")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
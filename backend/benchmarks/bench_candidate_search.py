@@ -0,0 +1,94 @@
+"""
+Benchmark: WAND top-k candidate search against scoring every matching candidate
+
+Fills a temporary database with synthetic candidates whose skills follow a Zipf-like
+popularity curve (a few skills on most resumes, a long tail on few), then runs the same
+job-description-like queries through CandidateIndex.search (WAND) and
+CandidateIndex.exhaustive_search at growing pool sizes. Prints the mean latency and the
+share of candidates WAND actually scored, and fails if any WAND top-k differs from the
+exhaustive one.
+
+    python -m benchmarks.bench_candidate_search
+Run from the backend directory.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+POOL_SIZES = (5000, 20000, 80000)
+QUERIES = 30
+TOP_K = 10
+SKILLS_PER_CANDIDATE = (8, 25)
+
+def fill(count: int, skills: List[str], rng: random.Random):
+    from database.models import get_connection, INSERT_CANDIDATE, INSERT_CANDIDATE_SKILL
+    popularity = [1 / (rank + 1) ** 0.9 for rank in range(len(skills))]
+    conn = get_connection()
+    with conn:
+        for number in range(count):
+            cursor = conn.execute(INSERT_CANDIDATE, (f"bench-{number}", f"resume-{number}.pdf", f"Candidate {number}",
+                                                     "Software Engineer", rng.randint(30, 100), rng.randint(40, 95)))
+            chosen = set(rng.choices(skills, popularity, k=rng.randint(*SKILLS_PER_CANDIDATE)))
+            conn.executemany(INSERT_CANDIDATE_SKILL, [
+                (skill, cursor.lastrowid, rng.choice((1.0, 1.0, 1.5, 2.0, 2.5))) for skill in chosen
+            ])
+
+def queries(skills: List[str], rng: random.Random) -> List[Dict[str, float]]:
+    # A job description names a few common skills and a few rarer ones
+    return [
+        {skill.lower(): rng.choice((1.0, 1.0, 2.0)) for skill in rng.sample(skills[:20], 3) + rng.sample(skills[20:120], 3)}
+        for _ in range(QUERIES)
+    ]
+
+def mean_ms(call, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        call(item)
+    return (time.perf_counter() - start) * 1000 / len(items)
+
+def main():
+    import database.models
+    from ai_hr_analyser import SKILLS_DATABASE
+    from candidate_index import CandidateIndex
+
+    rng = random.Random(7)
+    skills = list(dict.fromkeys(SKILLS_DATABASE))
+    rng.shuffle(skills)
+    workload = queries(skills, rng)
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        database.models.DATABASE_PATH = os.path.join(directory, "bench.db")
+        database.models.init_db()
+        index = CandidateIndex()
+        stored = 0
+        print(f"{'candidates':>10} {'exhaustive ms':>14} {'WAND ms':>9} {'speedup':>8} {'scored':>8}")
+        for size in POOL_SIZES:
+            fill(size - stored, skills, rng)
+            stored = size
+            index.refresh()
+
+            scored = []
+            for query in workload:
+                result = index.search(query, k=TOP_K)
+                scored.append(result.evaluated / result.total)
+                expected = index.exhaustive_search(query, k=TOP_K)
+                got = [(candidate_id, score) for candidate_id, score, _ in result.hits]
+                # Same candidates and scores; float summation order may differ in the last bits
+                if len(got) != len(expected) or any(
+                    abs(score - expected_score) > 1e-9 for (_, score), (_, expected_score) in zip(got, expected)
+                ):
+                    failures.append(f"{size} candidates: WAND top-{TOP_K} differs for {sorted(query)}")
+
+            exhaustive = mean_ms(lambda query: index.exhaustive_search(query, k=TOP_K), workload)
+            wand = mean_ms(lambda query: index.search(query, k=TOP_K), workload)
+            print(f"{size:>10} {exhaustive:>14.2f} {wand:>9.2f} {exhaustive / wand:>7.1f}x {sum(scored) / len(scored):>8.1%}")
+
+    for failure in failures:
+        print("FAIL", failure)
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
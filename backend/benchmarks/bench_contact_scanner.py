@@ -0,0 +1,221 @@
+"""
+Benchmark and worst-case latency check for the contact scanner
+
+Times scan_contacts against the original regex cascade on regular resumes and on
+adversarial inputs (very long lines, handle-like tokens, label words with no URL,
+digit runs, '@' floods). The scanner must stay linear: the check fails when a 10x
+larger input costs much more than 10x the time, or when 100 KB (the most text the
+pipeline analyses) takes longer than the latency budget.
+
+Run from the backend directory:
+    python -m benchmarks.bench_contact_scanner
+"""
+import re
+import sys
+import time
+
+from contact_scanner import scan_contacts
+
+LATENCY_BUDGET_MS = 100       # for 100 KB, the most text the pipeline analyses
+MAX_GROWTH = 20               # allowed time ratio for a 10x larger input (linear is ~10)
+LEGACY_MAX_SIZE = 2000        # the original cascade is super-linear; keep its runs short
+
+def legacy_extract_contact(text: str) -> dict:
+    """The original pattern cascade, kept as the reference for timing"""
+    contact = {}
+    
+    email_patterns = [
+        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+        r'email[:\s]*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})',
+        r'e-mail[:\s]*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})'
+    ]
+    
+    for pattern in email_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            contact['email'] = match.group(1) if match.groups() else match.group()
+            break
+    
+    phone_patterns = [
+        r'(\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9})',
+        r'(\(\d{3}\)\s?\d{3}[-.\s]?\d{4})',
+        r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})',
+        r'phone[:\s]*(\+?\d[\d\s\-\(\)]{7,})'
+    ]
+    
+    for pattern in phone_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            contact['phone'] = match.group(1)
+            break
+    
+    # Aggressive LinkedIn detection - finds any LinkedIn reference
+    linkedin_patterns = [
+        # Any LinkedIn URL format
+        r'(?:https?://)?(?:www\.)?linkedin\.com/in/([^\s\)\]\|;,]+)',
+        r'(?:https?://)?(?:www\.)?linkedin\.com/pub/([^\s\)\]\|;,]+)',
+        r'(?:https?://)?(?:www\.)?linkedin\.com/profile/([^\s\)\]\|;,]+)',
+        # LinkedIn anywhere in text
+        r'linkedin\.com/in/([^\s\)\]\|;,]+)',
+        r'linkedin\.com/pub/([^\s\)\]\|;,]+)',
+        # LinkedIn with any separator
+        r'(?:linkedin|LinkedIn|LINKEDIN)\s*[:\-/|\s]*([a-zA-Z][a-zA-Z0-9._-]{2,50})',
+        # Any line containing linkedin
+        r'.*linkedin.*?([a-zA-Z][a-zA-Z0-9._-]{3,30}).*',
+        # Standalone usernames near linkedin
+        r'([a-zA-Z][a-zA-Z0-9._-]{3,30}).*linkedin',
+        r'linkedin.*?([a-zA-Z][a-zA-Z0-9._-]{3,30})',
+        # Simple patterns
+        r'(?:^|\s)([a-zA-Z][a-zA-Z0-9._-]{3,30})(?=.*linkedin)',
+        r'(?:linkedin)(?:[^a-zA-Z0-9]*?)([a-zA-Z][a-zA-Z0-9._-]{3,30})'
+    ]
+    
+    # Try each pattern and take first valid match
+    for pattern in linkedin_patterns:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        for match in matches:
+            username = match.strip().rstrip('/')
+            # Minimal validation - just check it's reasonable
+            if (username and 
+                len(username) >= 3 and len(username) <= 50 and
+                username[0].isalpha() and
+                not username.lower() in ['linkedin', 'github', 'twitter', 'facebook'] and
+                not username.startswith(('http', 'www')) and
+                not username.endswith(('.com', '.net', '.org'))):
+                contact['linkedin'] = f"https://linkedin.com/in/{username}"
+                break
+        if 'linkedin' in contact:
+            break
+    
+    # Aggressive GitHub detection - finds any GitHub reference
+    github_patterns = [
+        # Any GitHub URL format
+        r'(?:https?://)?(?:www\.)?github\.com/([^\s\)\]\|;,]+)',
+        r'(?:https?://)?([^\s\)\]\|;,]+)\.github\.io',
+        # GitHub anywhere in text
+        r'github\.com/([^\s\)\]\|;,]+)',
+        # GitHub with any separator
+        r'(?:github|GitHub|GITHUB)\s*[:\-/|\s]*([a-zA-Z][a-zA-Z0-9._-]{2,40})',
+        # Any line containing github
+        r'.*github.*?([a-zA-Z][a-zA-Z0-9._-]{3,30}).*',
+        # Standalone usernames near github
+        r'([a-zA-Z][a-zA-Z0-9._-]{3,30}).*github',
+        r'github.*?([a-zA-Z][a-zA-Z0-9._-]{3,30})',
+        # Simple patterns
+        r'(?:^|\s)([a-zA-Z][a-zA-Z0-9._-]{3,30})(?=.*github)',
+        r'(?:github)(?:[^a-zA-Z0-9]*?)([a-zA-Z][a-zA-Z0-9._-]{3,30})'
+    ]
+    
+    # Try each pattern and take first valid match
+    for pattern in github_patterns:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        for match in matches:
+            username = match.strip().rstrip('/')
+            # Minimal validation - just check it's reasonable
+            if (username and 
+                len(username) >= 3 and len(username) <= 40 and
+                username[0].isalpha() and
+                not username.lower() in ['github', 'linkedin', 'twitter', 'facebook'] and
+                not username.startswith(('http', 'www')) and
+                not username.endswith(('.com', '.net', '.org'))):
+                contact['github'] = f"https://github.com/{username}"
+                break
+        if 'github' in contact:
+            break
+    
+    # Portfolio/Website patterns
+    website_patterns = [
+        r'(?:portfolio|website|personal site|site)[:\s]*(?:https?://)?([\w.-]+\.[a-z]{2,})/?',
+        r'(?:https?://)([\w.-]+\.[a-z]{2,})(?=\s|$|\n)',
+        r'(?:www\.)([\w.-]+\.[a-z]{2,})(?=\s|$|\n)',
+        r'([\w-]+\.[a-z]{2,})(?=\s|$|\n)'
+    ]
+    
+    for pattern in website_patterns:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        for match in matches:
+            website = match.strip()
+            if (not any(domain in website.lower() for domain in ['linkedin', 'github', 'gmail', 'yahoo', 'hotmail', 'outlook']) and
+                '.' in website and len(website) > 4):
+                if not website.startswith('http'):
+                    website = f"https://{website}"
+                contact['website'] = website
+                break
+        if 'website' in contact:
+            break
+    
+    # Additional social media detection
+    social_patterns = {
+        'twitter': r'(?:twitter|@)[:\s]*([\w]+)',
+        'instagram': r'(?:instagram)[:\s]*([\w.]+)',
+        'behance': r'(?:behance)[:\s]*([\w.]+)'
+    }
+    
+    for platform, pattern in social_patterns.items():
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            username = match.group(1)
+            if len(username) > 2 and len(username) < 30:
+                contact[platform] = f"https://{platform}.com/{username}"
+    
+    return contact
+
+
+REGULAR_RESUME = """John Smith
+john.smith@example.com | +1 555-123-4567 | linkedin.com/in/johnsmith | github.com/jsmith
+Portfolio: johnsmith.dev
+
+Senior engineer with 7 years of experience building scalable services in Python and Go.
+"""
+
+def adversarial_inputs(size: int) -> dict:
+    return {
+        "one long line of words": ("abcd efgh " * size)[:size],
+        "words then linkedin": ("abcd " * size)[:size - 8] + "linkedin",
+        "label words, no URL": ("linkedin github " * size)[:size],
+        "one huge handle token": ("a" + "b._-" * size)[:size],
+        "digit runs": ("1 2-3 (4) 5. " * size)[:size],
+        "at-sign flood": ("a@" * size)[:size],
+        "dotted tokens": ("a.b.c.d.e.f " * size)[:size],
+        "regular resume repeated": (REGULAR_RESUME * (size // len(REGULAR_RESUME) + 1))[:size]
+    }
+
+def time_call(func, text: str) -> float:
+    # The original cascade takes seconds on some inputs, so it runs once
+    repeat = 1 if func is legacy_extract_contact else 3
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main() -> int:
+    assert scan_contacts(REGULAR_RESUME) == {
+        "email": "john.smith@example.com",
+        "phone": "+1 555-123-4567",
+        "linkedin": "https://linkedin.com/in/johnsmith",
+        "github": "https://github.com/jsmith",
+        "website": "https://johnsmith.dev"
+    }
+
+    print(f"{'input':<26} {'legacy 2KB ms':>15} {'100KB ms':>10} {'1MB ms':>10} {'growth':>8}")
+    failures = []
+    small, medium, large = adversarial_inputs(LEGACY_MAX_SIZE), adversarial_inputs(100000), adversarial_inputs(1000000)
+    for name in small:
+        legacy_ms = time_call(legacy_extract_contact, small[name])
+        medium_ms = time_call(scan_contacts, medium[name])
+        large_ms = time_call(scan_contacts, large[name])
+        growth = large_ms / max(medium_ms, 0.01)
+        print(f"{name:<26} {legacy_ms:>15.1f} {medium_ms:>10.2f} {large_ms:>10.2f} {growth:>7.1f}x")
+        if medium_ms > LATENCY_BUDGET_MS:
+            failures.append(f"{name}: {medium_ms:.1f} ms for 100 KB exceeds {LATENCY_BUDGET_MS} ms")
+        if growth > MAX_GROWTH:
+            failures.append(f"{name}: 10x input took {growth:.1f}x longer (not linear)")
+
+    for failure in failures:
+        print("FAIL", failure)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Benchmark: streaming DOCX extractor (docx_text) against the python-docx object model
+
+Runs both over the DOCX files of benchmarks.resume_corpus and over "template" variants of
+the long resumes laid out the way resume templates often are: contact details in the page
+header, skills in a table, a summary in a text box and an embedded photo. Prints the best
+time per document and how much of the resume text each extractor recovered, and fails
+if the streaming extractor is slower or recovers less.
+
+    python -m benchmarks.bench_docx
+Run from the backend directory.
+"""
+import io
+import random
+import sys
+import time
+import zipfile
+from typing import Callable, List, Tuple
+from xml.sax.saxutils import escape
+
+from benchmarks.resume_corpus import build_corpus, generate_resume, LANGUAGES
+
+REPEATS = 20
+PHOTO_BYTES = 2 * 1024 * 1024
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+    'xmlns:v="urn:schemas-microsoft-com:vml"'
+)
+
+def _paragraph(text: str) -> str:
+    return f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+def _text_box(lines: List[str]) -> str:
+    # The way Word saves a text box: DrawingML choice plus a VML fallback with the same text
+    content = "".join(_paragraph(line) for line in lines)
+    return (
+        '<w:p><w:r><mc:AlternateContent>'
+        f'<mc:Choice Requires="wps"><w:drawing><wps:txbx><w:txbxContent>{content}</w:txbxContent></wps:txbx></w:drawing></mc:Choice>'
+        f'<mc:Fallback><w:pict><v:textbox><w:txbxContent>{content}</w:txbxContent></v:textbox></w:pict></mc:Fallback>'
+        '</mc:AlternateContent></w:r></w:p>'
+    )
+
+def _table(rows: List[List[str]]) -> str:
+    cells = "".join(
+        "<w:tr>" + "".join(f"<w:tc>{_paragraph(cell)}</w:tc>" for cell in row) + "</w:tr>" for row in rows
+    )
+    return f"<w:tbl>{cells}</w:tbl>"
+
+def to_template_docx(text: str, seed: int = 0) -> bytes:
+    """The resume as a templated DOCX: header, text box, table and an embedded photo"""
+    lines = [line for line in text.split("\n") if line.strip()]
+    header, summary, body = lines[:3], lines[3:6], lines[6:]
+    # Every third body line goes into a two-column table, like a skills grid
+    tabled = body[::3]
+    flowing = [line for index, line in enumerate(body) if index % 3]
+    rows = [tabled[index:index + 2] + [""] * (2 - len(tabled[index:index + 2])) for index in range(0, len(tabled), 2)]
+    document = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document {NAMESPACES}><w:body>'
+        + _text_box(summary) + "".join(_paragraph(line) for line in flowing) + _table(rows)
+        + '<w:sectPr><w:headerReference w:type="default" r:id="rId2"/></w:sectPr></w:body></w:document>'
+    )
+    parts = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Default Extension="png" ContentType="image/png"/>'
+            '<Override PartName="/word/document.xml" ContentType='
+            '"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            '<Override PartName="/word/header1.xml" ContentType='
+            '"application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"/>'
+            '</Types>'
+        ),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/officeDocument" Target="word/document.xml"/>'
+            '</Relationships>'
+        ),
+        "word/_rels/document.xml.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/header" Target="header1.xml"/>'
+            '<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/image" Target="media/photo.png"/>'
+            '</Relationships>'
+        ),
+        "word/document.xml": document,
+        "word/header1.xml": (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:hdr {NAMESPACES}>'
+            + "".join(_paragraph(line) for line in header) + "</w:hdr>"
+        ),
+        # Incompressible, like a real photo
+        "word/media/photo.png": random.Random(seed).randbytes(PHOTO_BYTES)
+    }
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in parts.items():
+            archive.writestr(zipfile.ZipInfo(name, date_time=(2024, 1, 1, 0, 0, 0)), data)
+    return buffer.getvalue()
+
+def python_docx_text(content: bytes) -> str:
+    """The extraction this replaces: body paragraphs of the python-docx object model"""
+    from docx import Document
+    text = ""
+    for paragraph in Document(io.BytesIO(content)).paragraphs:
+        if paragraph.text.strip():
+            text += paragraph.text + "\n"
+    return text
+
+def streaming_text(content: bytes) -> str:
+    from docx_text import extract_docx_text
+    return extract_docx_text(io.BytesIO(content))
+
+def best_ms(extract: Callable[[bytes], str], content: bytes) -> float:
+    extract(content)
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        extract(content)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def coverage(extracted: str, text: str) -> float:
+    """Share of the resume's non-blank lines present in the extracted text"""
+    lines = [line for line in text.split("\n") if line.strip()]
+    found = set(extracted.split("\n"))
+    return sum(line in found for line in lines) / len(lines)
+
+def main():
+    documents: List[Tuple[str, bytes, str]] = [
+        (f"{language}/{length}", content, text)
+        for language, length, file_format, text, content in build_corpus() if file_format == "docx"
+    ]
+    for language in LANGUAGES:
+        text = generate_resume(language, "long")
+        documents.append((f"{language}/template", to_template_docx(text), text))
+
+    failures = []
+    print(f"{'document':<16} {'KB':>7} {'python-docx ms':>15} {'streaming ms':>13} {'speedup':>8} {'coverage':>17}")
+    totals = [0.0, 0.0]
+    for name, content, text in documents:
+        old_ms, new_ms = best_ms(python_docx_text, content), best_ms(streaming_text, content)
+        old_coverage, new_coverage = coverage(python_docx_text(content), text), coverage(streaming_text(content), text)
+        totals[0] += old_ms
+        totals[1] += new_ms
+        print(f"{name:<16} {len(content) / 1024:>7.0f} {old_ms:>15.3f} {new_ms:>13.3f} {old_ms / new_ms:>7.1f}x"
+              f" {old_coverage:>7.0%} -> {new_coverage:>5.0%}")
+        if new_coverage < old_coverage:
+            failures.append(f"{name}: streaming extractor recovered less text")
+    print(f"{'total':<16} {'':>7} {totals[0]:>15.3f} {totals[1]:>13.3f} {totals[0] / totals[1]:>7.1f}x")
+    if totals[1] > totals[0]:
+        failures.append("streaming extractor is slower than python-docx")
+
+    for failure in failures:
+        print("FAIL", failure)
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
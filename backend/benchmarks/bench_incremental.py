@@ -0,0 +1,76 @@
+"""
+Benchmark: re-analysing a resume after one section was edited
+
+For each long resume of benchmarks.resume_corpus, analyses the original with
+extract_resume_features (which leaves the parts of every section in a dict, as the
+section cache would hold them), then edits one section the way a candidate acting on a
+suggestion would: one more line at the end of the experience section. The edited resume
+is analysed from scratch and with the original's section parts. Fails if the two
+analyses differ, if any section other than the edited one was recomputed, or if the
+incremental analysis is not faster.
+
+    python -m benchmarks.bench_incremental
+Run from the backend directory.
+"""
+import sys
+import time
+from typing import Callable
+
+from benchmarks.resume_corpus import generate_resume, LANGUAGES
+
+REPEATS = 5
+EDITS = {
+    "skills": "Kubernetes, Terraform, GraphQL",
+    "experience": "Led the migration of 40 services to Kubernetes and Terraform, cutting hosting costs by 30%."
+}
+
+def edit_section(text: str, kind: str) -> str:
+    """The text with one more line at the end of the first section of this kind"""
+    from sections import segment_sections
+    section = segment_sections(text).get(kind)[0]
+    return text[:section.end] + "\n" + EDITS[kind] + text[section.end:]
+
+def best_ms(call: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    from main import extract_resume_features
+
+    failures = []
+    totals = {kind: [0.0, 0.0] for kind in EDITS}
+    print(f"{'resume':<10} {'edited':<11} {'full ms':>9} {'incremental ms':>15} {'speedup':>8}")
+    for language in LANGUAGES:
+        original = generate_resume(language, "long")
+        parts = {}
+        extract_resume_features(original, section_parts=parts)
+        for kind in EDITS:
+            edited = edit_section(original, kind)
+            full = extract_resume_features(edited)
+            sections = {"recomputed": [], "reused": []}
+            incremental = extract_resume_features(edited, section_parts=dict(parts), sections=sections)
+            if full != incremental:
+                failures.append(f"{language}/{kind}: incremental analysis differs from the full one")
+            if sections["recomputed"] != [kind]:
+                failures.append(f"{language}/{kind}: recomputed {sections['recomputed']}")
+
+            full_ms = best_ms(lambda: extract_resume_features(edited))
+            incremental_ms = best_ms(lambda: extract_resume_features(edited, section_parts=dict(parts)))
+            totals[kind][0] += full_ms
+            totals[kind][1] += incremental_ms
+            print(f"{language + '/long':<10} {kind:<11} {full_ms:>9.2f} {incremental_ms:>15.2f} {full_ms / incremental_ms:>7.1f}x")
+    for kind, (full_ms, incremental_ms) in totals.items():
+        print(f"{'total':<10} {kind:<11} {full_ms:>9.2f} {incremental_ms:>15.2f} {full_ms / incremental_ms:>7.1f}x")
+        if incremental_ms >= full_ms:
+            failures.append(f"re-analysis after a {kind} edit is not faster than a full analysis")
+
+    for failure in failures:
+        print("FAIL", failure)
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
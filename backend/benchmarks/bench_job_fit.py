@@ -0,0 +1,169 @@
+"""
+Benchmark: vectorized job-fit scoring vs the original per-profile loop
+
+Checks that analyse_job_fit_like_hr returns exactly what the original loop returned
+for many random candidates, then times both.
+
+Run from the backend directory:
+    python -m benchmarks.bench_job_fit
+"""
+import random
+import re
+import time
+from typing import Any, Dict, List
+
+from ai_hr_analyser import AIHRAnalyser, SKILLS_DATABASE
+
+def legacy_analyse_job_fit(self, text: str, extracted_skills: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    """The original per-profile loop, kept as the reference for equivalence and timing"""
+
+    all_skills = [skill.lower() for skill in extracted_skills["all_skills"]]
+    skills_section_skills = [skill.lower() for skill in extracted_skills["skills_section"]]
+    project_skills = [skill.lower() for skill in extracted_skills["project_skills"]]
+
+    job_matches = []
+
+    for job_title, profile in self.job_profiles.items():
+        # Calculate skill matches across categories
+        core_matches = legacy_count_skill_matches(self, all_skills, profile["core_skills"])
+        framework_matches = legacy_count_skill_matches(self, all_skills, profile["framework_skills"])
+        database_matches = legacy_count_skill_matches(self, all_skills, profile["database_skills"])
+        tools_matches = legacy_count_skill_matches(self, all_skills, profile["tools_skills"])
+
+        # Project relevance analysis
+        project_relevance = self._analyse_project_relevance(text, profile["project_indicators"])
+
+        # Calculate weighted scores
+        skill_score = (core_matches * 3 + framework_matches * 2 + database_matches * 2 + tools_matches * 1) / 8
+        project_score = project_relevance / 10
+
+        # Experience level assessment
+        experience_score = self._assess_experience_level(text, profile["seniority"])
+
+        # Final weighted score
+        final_score = (
+            skill_score * profile["skills_weight"] +
+            project_score * profile["projects_weight"] +
+            experience_score * profile["experience_weight"]
+        ) * 100
+
+        # HR-like minimum requirements check
+        total_skill_matches = core_matches + framework_matches + database_matches + tools_matches
+        if total_skill_matches < profile["min_skills"]:
+            final_score = max(final_score - 20, 0)
+
+        # Bonus for skills diversity
+        if len(set(all_skills)) > 10:
+            final_score += 5
+
+        # Project skills bonus
+        if len(project_skills) > 3:
+            final_score += 5
+
+        final_score = min(int(final_score), 100)
+
+        # Generate HR-like assessment
+        matching_skills = legacy_get_matching_skills(self, all_skills, profile)
+        missing_critical = legacy_get_missing_critical_skills(self, all_skills, profile)
+        hr_assessment = self._generate_hr_assessment(final_score, total_skill_matches, project_relevance, job_title, matching_skills)
+
+        job_matches.append({
+            "job_title": job_title,
+            "match_percentage": final_score,
+            "matching_skills": matching_skills,
+            "missing_skills": missing_critical,
+            "match_reasons": hr_assessment,
+            "skill_breakdown": {
+                "core": f"{core_matches}/{len(profile['core_skills'])}",
+                "frameworks": f"{framework_matches}/{len(profile['framework_skills'])}",
+                "databases": f"{database_matches}/{len(profile['database_skills'])}",
+                "tools": f"{tools_matches}/{len(profile['tools_skills'])}"
+            },
+            "hr_recommendation": self._get_hr_recommendation(final_score, job_title)
+        })
+
+    # Sort and return top 3 like HR would prioritize
+    job_matches.sort(key=lambda x: x["match_percentage"], reverse=True)
+    return job_matches[:3]
+
+def legacy_count_skill_matches(self, candidate_skills: List[str], required_skills: List[str]) -> int:
+    """Count skill matches with fuzzy matching"""
+    matches = 0
+    for req_skill in required_skills:
+        for cand_skill in candidate_skills:
+            if (req_skill.lower() in cand_skill or cand_skill in req_skill.lower() or
+                self._are_similar_skills(req_skill.lower(), cand_skill)):
+                matches += 1
+                break
+    return matches
+
+def legacy_get_matching_skills(self, candidate_skills: List[str], profile: Dict) -> List[str]:
+    """Get all matching skills"""
+    all_required = (profile["core_skills"] + profile["framework_skills"] + 
+                   profile["database_skills"] + profile["tools_skills"])
+
+    matching = []
+    for req_skill in all_required:
+        for cand_skill in candidate_skills:
+            if (req_skill.lower() in cand_skill or cand_skill in req_skill.lower() or
+                self._are_similar_skills(req_skill.lower(), cand_skill)):
+                matching.append(req_skill)
+                break
+
+    return list(set(matching))
+
+def legacy_get_missing_critical_skills(self, candidate_skills: List[str], profile: Dict) -> List[str]:
+    """Get missing critical skills"""
+    critical_skills = profile["core_skills"] + profile["framework_skills"][:2]
+
+    missing = []
+    for skill in critical_skills:
+        found = False
+        for cand_skill in candidate_skills:
+            if (skill.lower() in cand_skill or cand_skill in skill.lower() or
+                self._are_similar_skills(skill.lower(), cand_skill)):
+                found = True
+                break
+        if not found:
+            missing.append(skill)
+
+    return missing[:5]
+
+def random_candidate(rng: random.Random, analyser: AIHRAnalyser, skill_count: int):
+    profile_skills = sorted({skill for profile in analyser.job_profiles.values()
+                             for category in ("core_skills", "framework_skills", "database_skills", "tools_skills")
+                             for skill in profile[category]})
+    indicators = sorted({indicator for profile in analyser.job_profiles.values()
+                         for indicator in profile["project_indicators"]})
+    pool = profile_skills + SKILLS_DATABASE + ["js", "ts", "reactjs", "postgres", "mongo", "c", "r"]
+    skills = rng.sample(pool, min(skill_count, len(pool)))
+    text = " ".join(rng.sample(indicators, rng.randint(0, 12)) + skills)
+    text += f" {rng.randint(0, 12)} years of experience"
+    extracted = {
+        "all_skills": skills,
+        "skills_section": skills[:rng.randint(0, len(skills))],
+        "project_skills": skills[:rng.randint(0, 6)]
+    }
+    return text, extracted
+
+def main():
+    rng = random.Random(7)
+    analyser = AIHRAnalyser()
+
+    for _ in range(500):
+        text, extracted = random_candidate(rng, analyser, rng.randint(0, 60))
+        assert analyser.analyse_job_fit_like_hr(text, extracted) == legacy_analyse_job_fit(analyser, text, extracted), text
+
+    print(f"{'skills':>7} {'legacy ms':>10} {'vector ms':>10} {'speedup':>8}")
+    for skill_count in (10, 30, 60, 120):
+        samples = [random_candidate(rng, analyser, skill_count) for _ in range(50)]
+        timings = []
+        for func in (lambda t, e: legacy_analyse_job_fit(analyser, t, e), analyser.analyse_job_fit_like_hr):
+            start = time.perf_counter()
+            for text, extracted in samples:
+                func(text, extracted)
+            timings.append((time.perf_counter() - start) / len(samples) * 1000)
+        print(f"{skill_count:>7} {timings[0]:>10.3f} {timings[1]:>10.3f} {timings[0] / timings[1]:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
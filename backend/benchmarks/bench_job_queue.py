@@ -0,0 +1,169 @@
+"""
+Benchmark: the analysis job queue end to end
+
+Queues every document of benchmarks.resume_corpus (plus one unreadable file) before any
+job worker runs, as a burst would, then starts the workers and measures how long the
+backlog takes to drain and how long jobs waited, for 1 and WORKERS worker processes.
+Each job has a callback URL pointing at a stub receiver in this process, so the run also
+checks callback delivery and its HMAC signature. A last run kills a worker mid-analysis
+and checks that its job is queued again and finished by the replacement worker.
+
+Fails if a job's result differs from analysing the same file synchronously (the section
+report aside, since a worker may reuse sections of an earlier job), if the unreadable
+file does not fail with the synchronous error, if a callback is missing or badly
+signed, or if the killed worker's job is lost.
+
+    python -m benchmarks.bench_job_queue
+Run from the backend directory.
+"""
+import hashlib
+import hmac
+import json
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Read by job_queue at import time; the stub receiver runs on loopback, so it must be allowed explicitly
+SECRET = "bench-secret"
+os.environ["JOB_CALLBACK_SECRET"] = SECRET
+os.environ["JOB_CALLBACK_HOSTS"] = "127.0.0.1"
+
+# Workers are new interpreters: with another hash seed, lists built from sets (the skill
+# lists) come out in another order than in this process, so every process gets the same seed
+if __name__ == "__main__" and os.environ.get("PYTHONHASHSEED") != "0":
+    os.environ["PYTHONHASHSEED"] = "0"
+    os.execv(sys.executable, [sys.executable, "-m", "benchmarks.bench_job_queue", *sys.argv[1:]])
+
+from benchmarks.resume_corpus import build_corpus
+
+WORKERS = 2
+TIMEOUT_SECONDS = 300
+SLOW_JOB_SECONDS = 2.0
+
+class CallbackReceiver(BaseHTTPRequestHandler):
+    """Stub integration endpoint: keeps every callback with whether its signature checked out"""
+    received = {}
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        expected = "sha256=" + hmac.new(SECRET.encode("utf-8"), body, hashlib.sha256).hexdigest()
+        payload = json.loads(body)
+        signed = hmac.compare_digest(self.headers.get("X-Signature-256", ""), expected)
+        CallbackReceiver.received[payload["job_id"]] = (payload, signed)
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+def without_report(response: dict) -> dict:
+    return {name: value for name, value in response.items() if name != "section_analysis"}
+
+def wait_for(job_queue, job_ids, timeout: float = TIMEOUT_SECONDS) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        jobs = {job_id: job_queue.get(job_id) for job_id in job_ids}
+        if all(job["status"] in ("done", "failed") for job in jobs.values()) or time.monotonic() > deadline:
+            return jobs
+        time.sleep(0.05)
+
+def slow_analyse_job(*args):
+    # Long enough for the worker to be killed while it holds the job
+    time.sleep(SLOW_JOB_SECONDS)
+    from main import analyse_job
+    return analyse_job(*args)
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+def main():
+    import database.models
+    from job_queue import JobQueue, JobWorkers
+    from main import ResumeAnalysisError, analyse_job, process_resume, warm_analysers
+    from response_builder import dumps
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CallbackReceiver)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    callback_url = f"http://127.0.0.1:{server.server_port}/hooks/analysis"
+
+    uploads = [(f"{language}-{length}.{fmt}", content) for language, length, fmt, _, content in build_corpus()]
+    uploads.append(("unreadable.pdf", b"%PDF-1.4 not really a pdf"))
+    expected = {}
+    for filename, content in uploads:
+        try:
+            expected[filename] = ("done", without_report(json.loads(dumps(process_resume(content, filename)))))
+        except ResumeAnalysisError as e:
+            expected[filename] = ("failed", e.detail)
+
+    failures = []
+    print(f"{'workers':>7} {'jobs':>5} {'drain s':>8} {'jobs/s':>7} {'wait p50 s':>11} {'wait max s':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for round_number, workers in enumerate((1, WORKERS)):
+            database.models.DATABASE_PATH = os.path.join(directory, f"jobs-{round_number}.db")
+            job_queue = JobQueue()
+            CallbackReceiver.received = {}
+            submitted = {
+                job_queue.submit(filename, content, hashlib.sha256(content).hexdigest(), None, callback_url)[0]: filename
+                for filename, content in uploads
+            }
+            pool = JobWorkers(job_queue, analyse_job, warm_analysers, workers)
+            start = time.perf_counter()
+            pool.start()
+            jobs = wait_for(job_queue, submitted)
+            drain = time.perf_counter() - start
+            time.sleep(0.5)  # Callbacks are delivered just after the result is stored
+            pool.stop()
+
+            waits = [job["started_at"] - job["created_at"] for job in jobs.values() if job["started_at"] is not None]
+            print(f"{workers:>7} {len(jobs):>5} {drain:>8.2f} {len(jobs) / drain:>7.1f} "
+                  f"{percentile(waits, 0.5):>11.2f} {max(waits):>11.2f}")
+
+            for job_id, job in jobs.items():
+                filename = submitted[job_id]
+                status, outcome = expected[filename]
+                if job["status"] != status:
+                    failures.append(f"{workers} workers: {filename} is {job['status']}, expected {status}")
+                    continue
+                got = without_report(json.loads(job["result"])) if status == "done" else job["error"]
+                if got != outcome:
+                    failures.append(f"{workers} workers: {filename} result differs from the synchronous analysis")
+                payload, signed = CallbackReceiver.received.get(job_id, (None, False))
+                if payload is None or payload["status"] != status or not signed:
+                    failures.append(f"{workers} workers: {filename} callback missing, wrong or badly signed")
+                elif job["callback_status"] != "delivered (204)":
+                    failures.append(f"{workers} workers: {filename} callback status {job['callback_status']!r}")
+
+        # A worker killed mid-analysis: its job goes back to the queue and the replacement finishes it
+        database.models.DATABASE_PATH = os.path.join(directory, "jobs-kill.db")
+        job_queue = JobQueue()
+        filename, content = uploads[0]
+        job_id, _ = job_queue.submit(filename, content, hashlib.sha256(content).hexdigest())
+        pool = JobWorkers(job_queue, slow_analyse_job, warm_analysers, 1)
+        pool.start()
+        while job_queue.get(job_id)["status"] == "queued":
+            time.sleep(0.05)
+        worker = database.models.get_connection().execute(
+            "SELECT worker FROM analysis_jobs WHERE id = ?", (job_id,)
+        ).fetchone()[0]
+        os.kill(int(worker.rsplit(":", 1)[1]), signal.SIGKILL)
+        job = wait_for(job_queue, [job_id])[job_id]
+        pool.stop()
+        print(f"killed worker: job {job['status']} after {job['attempts']} attempts")
+        if job["status"] != "done" or job["attempts"] != 2:
+            failures.append(f"job of the killed worker is {job['status']} after {job['attempts']} attempts")
+        elif without_report(json.loads(job["result"])) != expected[filename][1]:
+            failures.append("job of the killed worker: result differs from the synchronous analysis")
+
+    server.shutdown()
+    for failure in failures:
+        print("FAIL", failure)
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
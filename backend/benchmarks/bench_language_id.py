@@ -0,0 +1,83 @@
+"""
+Benchmark: sampled n-gram language identification vs langdetect.detect
+
+Checks that the identifier agrees with the expected language on resume-like text in
+every supported language, is deterministic, and stays under BUDGET_MS per uncached call
+however long the text is. The time of a case is the best of ROUNDS rounds, each averaged
+over CALLS calls, so a scheduler hiccup does not fail the run. Exits with status 1 on failure.
+
+Run from the backend directory:
+    python -m benchmarks.bench_language_id
+"""
+import sys
+import time
+
+from language_id import LanguageIdentifier
+
+BUDGET_MS = 1.0
+ROUNDS = 5
+CALLS = 20
+
+SAMPLES = {
+    'en': "Senior software engineer with eight years of experience building scalable web applications. "
+          "Led a team of five developers and improved deployment speed.",
+    'de': "Erfahrener Softwareentwickler mit fundierten Kenntnissen in der Entwicklung von Webanwendungen. "
+          "Verantwortlich für die Leitung eines Teams von fünf Entwicklern.",
+    'es': "Ingeniero de software con experiencia en el desarrollo de aplicaciones web escalables. "
+          "Responsable de liderar un equipo de cinco desarrolladores.",
+    'fr': "Ingénieur logiciel expérimenté dans le développement d'applications web évolutives. "
+          "Responsable de la gestion d'une équipe de cinq développeurs.",
+    'it': "Ingegnere del software con esperienza nello sviluppo di applicazioni web scalabili. "
+          "Responsabile della gestione di un gruppo di cinque sviluppatori.",
+    'pt': "Engenheiro de software com experiência no desenvolvimento de aplicações web escaláveis. "
+          "Responsável por liderar uma equipe de cinco desenvolvedores.",
+    'ru': "Опытный инженер-программист с опытом разработки масштабируемых веб-приложений. "
+          "Руководил командой из пяти разработчиков.",
+    'zh': "高级软件工程师，拥有八年开发经验。熟练掌握 Python、Java、Docker 和 Kubernetes。负责团队管理。",
+    'ja': "シニアソフトウェアエンジニアとして8年の経験があります。Python と Java を使用した開発を担当しました。",
+    'ar': "مهندس برمجيات أول يتمتع بخبرة ثماني سنوات في تطوير تطبيقات الويب القابلة للتوسع وقيادة الفرق."
+}
+
+def time_call(func, text: str, repeat: int, rounds: int = 1) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(text)
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best * 1000
+
+def main():
+    try:
+        from langdetect import detect
+    except ImportError:
+        detect = None
+
+    identifier = LanguageIdentifier(cache_bytes=0)  # Every call below is a cold detection
+    start = time.perf_counter()
+    identifier.load()
+    print(f"profiles loaded in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    failures = []
+    print(f"{'language':>8} {'chars':>8} {'detected':>9} {'ms':>8} {'langdetect ms':>14}")
+    for language, sentence in SAMPLES.items():
+        for copies in (1, 50, 700):
+            text = "\n".join([sentence] * copies)
+            detected = identifier.detect(text)
+            if detected != language:
+                failures.append(f"{language} x{copies}: detected {detected}")
+            if any(identifier.detect(text) != detected for _ in range(5)):
+                failures.append(f"{language} x{copies}: non-deterministic")
+
+            elapsed_ms = time_call(identifier.detect, text, CALLS, ROUNDS)
+            if elapsed_ms > BUDGET_MS:
+                failures.append(f"{language} x{copies}: {elapsed_ms:.3f} ms over the {BUDGET_MS} ms budget")
+            legacy_ms = f"{time_call(detect, text, 3):14.1f}" if detect else f"{'n/a':>14}"
+            print(f"{language:>8} {len(text):>8} {detected:>9} {elapsed_ms:>8.3f} {legacy_ms}")
+
+    for failure in failures:
+        print("FAIL", failure)
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
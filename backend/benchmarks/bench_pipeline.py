@@ -0,0 +1,191 @@
+"""
+Benchmark: every pipeline stage over the synthetic multilingual resume corpus
+
+Times extract_text (PDF and DOCX), AIHRAnalyser._extract_skills_from_text,
+extract_all_skills_comprehensive, segment_sections, analyse_job_fit_like_hr, ATSAnalyser.analyse_ats_compatibility and extract_contact_ai on
+each resume of benchmarks.resume_corpus (10 languages x short/long). Per case the best
+of several repeats is kept, which is the most stable figure on a shared machine.
+
+    python -m benchmarks.bench_pipeline                       # print timings
+    python -m benchmarks.bench_pipeline --save                # ...and store them as the baseline
+    python -m benchmarks.bench_pipeline --compare             # ...and flag regressions
+    python -m benchmarks.bench_pipeline --compare --threshold 0.1 --stage extract_contact_ai
+
+A stage regresses when its total time exceeds the baseline by more than the threshold
+(and by more than MIN_DELTA_MS); --compare exits with status 1 if any stage does.
+
+The baseline also keeps, per resume, the top job matches and the skills attributed to
+the extracted experience and project entries. --compare lists every resume whose
+outputs differ and fails as well, so a refactor cannot reorder rankings unnoticed; an
+intended change is accepted by saving a new baseline.
+Run from the backend directory.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.resume_corpus import build_corpus
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "pipeline.json")
+DEFAULT_THRESHOLD = 0.25
+MIN_REPEATS = 3
+MIN_CASE_SECONDS = 0.1   # Repeat each case until it has run at least this long
+MIN_DELTA_MS = 1.0       # Slowdowns smaller than this (stage total) are timer noise
+
+def build_stages() -> Dict[str, List[Tuple[str, Callable[[], object]]]]:
+    """{stage: [(case, zero-argument call)]} over the whole corpus"""
+    from main import extract_text, extract_contact_ai
+    from ai_hr_analyser import AIHRAnalyser
+    from ats_analyser import ATSAnalyser
+    from sections import segment_sections
+
+    hr_analyser = AIHRAnalyser()
+    ats_analyser = ATSAnalyser()
+    stages: Dict[str, List[Tuple[str, Callable[[], object]]]] = {
+        "extract_text[pdf]": [], "extract_text[docx]": [], "_extract_skills_from_text": [],
+        "extract_all_skills_comprehensive": [], "segment_sections": [], "analyse_job_fit_like_hr": [], "analyse_ats_compatibility": [],
+        "extract_contact_ai": []
+    }
+    for language, length, file_format, text, content in build_corpus():
+        case = f"{language}/{length}"
+        filename = f"resume.{file_format}"
+        stages[f"extract_text[{file_format}]"].append(
+            (case, lambda content=content, filename=filename: extract_text(content, filename))
+        )
+        if file_format != "pdf":
+            continue  # Text stages run once per resume
+        skills = hr_analyser.extract_all_skills_comprehensive(text)
+        stages["_extract_skills_from_text"].append((case, lambda text=text: hr_analyser._extract_skills_from_text(text)))
+        stages["extract_all_skills_comprehensive"].append(
+            (case, lambda text=text, sections=segment_sections(text):
+             hr_analyser.extract_all_skills_comprehensive(text, sections=sections))
+        )
+        stages["segment_sections"].append((case, lambda text=text: segment_sections(text)))
+        stages["analyse_job_fit_like_hr"].append(
+            (case, lambda text=text, skills=skills: hr_analyser.analyse_job_fit_like_hr(text, skills))
+        )
+        stages["analyse_ats_compatibility"].append((case, lambda text=text: ats_analyser.analyse_ats_compatibility(text)))
+        stages["extract_contact_ai"].append((case, lambda text=text: extract_contact_ai(text)))
+    return stages
+
+def time_case(call: Callable[[], object]) -> float:
+    """Best time of one call in milliseconds"""
+    call()  # Warm caches and lazy imports outside the measurement
+    best, repeats, started = float("inf"), 0, time.perf_counter()
+    while repeats < MIN_REPEATS or time.perf_counter() - started < MIN_CASE_SECONDS:
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+        repeats += 1
+    return best * 1000
+
+def analysis_outputs() -> Dict[str, dict]:
+    """{case: top job matches and entry-attributed skills} over the corpus"""
+    from main import extract_resume_features
+
+    outputs = {}
+    for language, length, file_format, text, _ in build_corpus():
+        if file_format != "pdf":
+            continue
+        features = extract_resume_features(text)
+        categorized = features["analysis"]["skills"]["categorized"]
+        outputs[f"{language}/{length}"] = {
+            "job_matches": [match["job_title"] for match in features["job_matches"][:3]],
+            "from_experience": sorted(categorized["From Experience"]),
+            "from_projects": sorted(categorized["From Projects"])
+        }
+    return outputs
+
+def run(selected: List[str]) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for stage, cases in build_stages().items():
+        if selected and stage not in selected:
+            continue
+        results[stage] = {case: time_case(call) for case, call in cases}
+    return results
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float) -> List[str]:
+    """Print the change per stage and return the stages that regressed"""
+    regressions = []
+    print(f"\n{'stage':<33} {'baseline ms':>12} {'current ms':>12} {'change':>9}")
+    for stage, cases in results.items():
+        base_cases = baseline.get(stage)
+        if not base_cases:
+            print(f"{stage:<33} {'-':>12} {sum(cases.values()):>12.3f} {'new':>9}")
+            continue
+        shared = [case for case in cases if case in base_cases]
+        before = sum(base_cases[case] for case in shared)
+        after = sum(cases[case] for case in shared)
+        change = after / before - 1 if before else 0.0
+        flag = "  REGRESSION" if change > threshold and after - before > MIN_DELTA_MS else ""
+        print(f"{stage:<33} {before:>12.3f} {after:>12.3f} {change:>+8.0%}{flag}")
+        if flag:
+            worst = sorted(shared, key=lambda case: cases[case] / max(base_cases[case], 1e-9), reverse=True)[:3]
+            for case in worst:
+                print(f"    {case:<24} {base_cases[case]:>12.3f} {cases[case]:>12.3f}")
+            regressions.append(stage)
+    return regressions
+
+def compare_outputs(outputs: Dict[str, dict], baseline: Dict[str, dict]) -> List[str]:
+    """Print and return the cases whose outputs differ from the baseline"""
+    changed = []
+    for case, output in outputs.items():
+        for name, value in output.items():
+            before = baseline.get(case, {}).get(name)
+            if before is not None and before != value:
+                print(f"    {case:<10} {name}: {before} -> {value}")
+                changed.append(case)
+    return sorted(set(changed))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, help="write the timings as a baseline")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown per stage as a fraction (default %(default)s)")
+    parser.add_argument("--stage", action="append", default=[], help="only run this stage (repeatable)")
+    parser.add_argument("--verbose", action="store_true", help="print every case")
+    args = parser.parse_args()
+
+    results = run(args.stage)
+    print(f"{'stage':<33} {'cases':>6} {'total ms':>10} {'max ms':>10}")
+    for stage, cases in results.items():
+        print(f"{stage:<33} {len(cases):>6} {sum(cases.values()):>10.3f} {max(cases.values()):>10.3f}")
+        if args.verbose:
+            for case, elapsed_ms in cases.items():
+                print(f"    {case:<24} {elapsed_ms:>10.3f}")
+
+    outputs = analysis_outputs() if args.save or args.compare else {}
+    regressions, changed = [], []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline["stages"], args.threshold)
+        print("\noutputs")
+        changed = compare_outputs(outputs, baseline.get("outputs", {}))
+        print(f"    {len(changed)} of {len(outputs)} resumes differ from the baseline")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as baseline_file:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "stages": results,
+                "outputs": outputs
+            }, baseline_file, indent=1, sort_keys=True)
+        print(f"\nbaseline saved to {args.save}")
+
+    if regressions:
+        print(f"\nFAIL {len(regressions)} stage(s) slower than the baseline by more than {args.threshold:.0%}")
+    if changed:
+        print(f"\nFAIL outputs changed for {', '.join(changed)}")
+    sys.exit(1 if regressions or changed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: single-pass SkillMatcher vs the original per-skill regex loop
+
+Run from the backend directory:
+    python -m benchmarks.bench_skill_matcher
+"""
+import random
+import re
+import time
+from typing import List
+
+from ai_hr_analyser import SKILLS_DATABASE, SKILL_VARIATIONS, skill_matcher
+
+FILLER_WORDS = [
+    "developed", "scalable", "services", "team", "led", "designed", "using", "with", "and",
+    "improved", "latency", "by", "users", "platform", "built", "the", "for", "in", "a",
+    "c++", "asp.net", "node", "js", "ml", "ui/ux", ".net", "spring", "boot", "ruby", "on", "rails",
+    "entwicklung", "développement", "開発", "разработка", "(react)", "[aws]", "k8s,", "sql-server"
+]
+
+def legacy_extract_skills(text: str) -> List[str]:
+    """The original implementation: one regex search per skill and per variation"""
+    found_skills = []
+    text_lower = text.lower()
+    for skill in SKILLS_DATABASE:
+        skill_lower = skill.lower()
+        if re.search(r'\b' + re.escape(skill_lower) + r'\b', text_lower):
+            found_skills.append(skill)
+            continue
+        if skill_lower in SKILL_VARIATIONS:
+            for variation in SKILL_VARIATIONS[skill_lower]:
+                if re.search(r'\b' + re.escape(variation) + r'\b', text_lower):
+                    found_skills.append(skill)
+                    break
+
+    cleaned_skills = []
+    for skill in found_skills:
+        skill = skill.strip()
+        if len(skill) > 1 and skill not in cleaned_skills:
+            cleaned_skills.append(skill)
+    return cleaned_skills
+
+def synthetic_text(rng: random.Random, size: int) -> str:
+    vocabulary = FILLER_WORDS * 4 + SKILLS_DATABASE
+    words, length = [], 0
+    while length < size:
+        word = rng.choice(vocabulary)
+        if rng.random() < 0.3:
+            word = word.upper()
+        words.append(word)
+        length += len(word) + 1
+        if rng.random() < 0.1:
+            words.append("\n")
+    return " ".join(words)[:size]
+
+def time_call(func, text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    rng = random.Random(42)
+    matcher = skill_matcher()
+
+    # Equivalence check over many random texts before timing anything
+    for _ in range(300):
+        text = synthetic_text(rng, rng.randint(10, 3000))
+        assert matcher.find(text) == legacy_extract_skills(text), text
+
+    print(f"{'text size':>10} {'legacy ms':>12} {'matcher ms':>12} {'speedup':>9}")
+    for size in (500, 2000, 10000, 50000, 100000):
+        text = synthetic_text(rng, size)
+        repeat = max(3, 20000 // size)
+        legacy_ms = time_call(legacy_extract_skills, text, repeat)
+        matcher_ms = time_call(matcher.find, text, repeat)
+        print(f"{size:>10} {legacy_ms:>12.3f} {matcher_ms:>12.3f} {legacy_ms / matcher_ms:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
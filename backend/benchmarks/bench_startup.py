@@ -0,0 +1,95 @@
+"""
+Benchmark: cold start of the API
+
+1. `python -X importtime -c "import main"` in a fresh interpreter: prints the slowest
+   imports and fails if a lazily loaded dependency (LAZY_MODULES) is imported at startup.
+2. Starts uvicorn in a subprocess and measures the time until GET /health first answers
+   200, failing if the best of RUNS attempts exceeds STARTUP_BUDGET_MS.
+
+Exits with status 1 on failure. Run from the backend directory:
+    python -m benchmarks.bench_startup
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List, Tuple
+
+STARTUP_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 2000))
+RUNS = 3
+TIMEOUT_SECONDS = 30
+
+# Loaded on first use only; none of these may be imported by `import main`
+LAZY_MODULES = ["numpy", "sklearn", "scipy", "PyPDF2", "docx", "googletrans", "langdetect"]
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_times() -> Dict[str, Tuple[int, int]]:
+    """{module: (self microseconds, cumulative microseconds)} for `import main`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def time_to_health() -> float:
+    """Milliseconds from spawning uvicorn until /health answers 200"""
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < TIMEOUT_SECONDS:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - start) * 1000
+            except OSError:
+                if server.poll() is not None:
+                    raise RuntimeError("uvicorn exited before answering /health")
+                time.sleep(0.01)
+        raise RuntimeError(f"/health did not answer within {TIMEOUT_SECONDS} s")
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    failures: List[str] = []
+
+    times = import_times()
+    print(f"import main: {times.get('main', (0, 0))[1] / 1000:.1f} ms")
+    print(f"{'module':<40} {'self ms':>9} {'cumulative ms':>14}")
+    top_level = {name: value for name, value in times.items() if "." not in name}
+    for name, (self_us, cumulative_us) in sorted(top_level.items(), key=lambda item: -item[1][1])[:12]:
+        print(f"{name:<40} {self_us / 1000:>9.1f} {cumulative_us / 1000:>14.1f}")
+    for module in LAZY_MODULES:
+        if module in times:
+            failures.append(f"{module} is imported at startup")
+
+    health_ms = [time_to_health() for _ in range(RUNS)]
+    print(f"time to first /health: " + ", ".join(f"{ms:.0f} ms" for ms in health_ms))
+    if min(health_ms) > STARTUP_BUDGET_MS:
+        failures.append(f"time to first /health {min(health_ms):.0f} ms exceeds the {STARTUP_BUDGET_MS:.0f} ms budget")
+
+    for failure in failures:
+        print("FAIL", failure)
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+Seeded generator of synthetic resumes for benchmarks
+
+generate_resume(language, length, seed) returns plain resume text in one of LANGUAGES,
+and to_pdf / to_docx wrap it in minimal but valid files, written by hand so the corpus
+needs no document libraries. PDFs use a Type0 font with Identity-H encoding and a
+ToUnicode CMap, so text extraction sees the original characters in every script (Arabic
+lines are stored in visual order like real PDFs, so mixed-direction lines come back in
+visual order too). The same seed always yields byte-identical files.
+"""
+import io
+import random
+import zipfile
+from typing import Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+LANGUAGES = ["en", "de", "es", "fr", "it", "pt", "zh", "ja", "ru", "ar"]
+LENGTHS = {"short": (2, 2), "long": (12, 8)}  # (jobs, projects)
+
+TECH_SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "Go", "C++", "C#", "React", "Angular", "Vue.js",
+    "Node.js", "Django", "Flask", "Spring", "PostgreSQL", "MySQL", "MongoDB", "Redis", "Docker",
+    "Kubernetes", "AWS", "Azure", "GCP", "Terraform", "Jenkins", "Git", "Linux", "Kafka",
+    "TensorFlow", "PyTorch", "Pandas", "NumPy", "Machine Learning", "REST API", "GraphQL", "CI/CD"
+]
+
+# Headings, phrases and names per language; {skill}, {skill2}, {number} are filled in
+CONTENT: Dict[str, Dict[str, object]] = {
+    "en": {
+        "headings": ["SUMMARY", "EXPERIENCE", "SKILLS", "PROJECTS", "EDUCATION", "CERTIFICATIONS"],
+        "names": ["John Smith", "Emily Carter", "Michael Brown", "Sarah Johnson"],
+        "titles": ["Senior Software Engineer", "Backend Developer", "Data Scientist", "DevOps Engineer"],
+        "companies": ["Acme Corporation", "Globex Industries", "Initech Ltd", "Umbrella Systems"],
+        "present": "present",
+        "summary": "Engineer with {number} years of experience building scalable web applications.",
+        "duties": ["Led a team of {number} engineers building services with {skill} and {skill2}.",
+                   "Improved API latency by {number}% using {skill}.",
+                   "Designed a data pipeline processing {number} million events per day with {skill}."],
+        "project": "A web platform for {number} users built with {skill} and {skill2}.",
+        "degree": "Bachelor of Science in Computer Science", "school": "State University",
+        "certificate": "Certified: AWS Solutions Architect", "domain": "example.com", "phone": "+1 555 {a} {b}"
+    },
+    "de": {
+        "headings": ["PROFIL", "BERUFSERFAHRUNG", "FÄHIGKEITEN", "PROJEKTE", "AUSBILDUNG", "ZERTIFIKATE"],
+        "names": ["Anna Müller", "Jonas Schmidt", "Lena Fischer", "Felix Weber"],
+        "titles": ["Softwareentwickler", "Backend-Entwicklerin", "Datenwissenschaftler", "DevOps-Ingenieur"],
+        "companies": ["Beispiel GmbH", "Muster AG", "Technik Werke GmbH", "Datenwerk AG"],
+        "present": "heute",
+        "summary": "Entwickler mit {number} Jahren Erfahrung in der Entwicklung skalierbarer Webanwendungen.",
+        "duties": ["Leitung eines Teams von {number} Entwicklern mit {skill} und {skill2}.",
+                   "Verbesserung der Antwortzeiten um {number}% mit {skill}.",
+                   "Entwicklung einer Datenpipeline für {number} Millionen Ereignisse pro Tag mit {skill}."],
+        "project": "Eine Webplattform für {number} Nutzer, entwickelt mit {skill} und {skill2}.",
+        "degree": "Master of Science Informatik", "school": "Technische Universität München",
+        "certificate": "Zertifiziert: AWS Solutions Architect", "domain": "beispiel.de", "phone": "+49 170 {a}{b}"
+    },
+    "es": {
+        "headings": ["PERFIL", "EXPERIENCIA", "HABILIDADES", "PROYECTOS", "EDUCACIÓN", "CERTIFICACIONES"],
+        "names": ["María García", "Carlos López", "Lucía Martínez", "Javier Sánchez"],
+        "titles": ["Ingeniero de Software", "Desarrolladora Backend", "Científico de Datos", "Ingeniero DevOps"],
+        "companies": ["Ejemplo S.A.", "Soluciones Digitales S.L.", "Tecnología Ibérica", "Datos y Nube S.A."],
+        "present": "actualidad",
+        "summary": "Ingeniero con {number} años de experiencia en el desarrollo de aplicaciones web escalables.",
+        "duties": ["Dirigí un equipo de {number} desarrolladores utilizando {skill} y {skill2}.",
+                   "Reduje la latencia de la API en un {number}% con {skill}.",
+                   "Diseñé un flujo de datos que procesa {number} millones de eventos al día con {skill}."],
+        "project": "Una plataforma web para {number} usuarios desarrollada con {skill} y {skill2}.",
+        "degree": "Grado en Ingeniería Informática", "school": "Universidad Politécnica de Madrid",
+        "certificate": "Certificado: AWS Solutions Architect", "domain": "ejemplo.es", "phone": "+34 612 {a} {b}"
+    },
+    "fr": {
+        "headings": ["PROFIL", "EXPÉRIENCE", "COMPÉTENCES", "PROJETS", "FORMATION", "CERTIFICATIONS"],
+        "names": ["Camille Dubois", "Louis Martin", "Chloé Bernard", "Hugo Lefèvre"],
+        "titles": ["Ingénieur Logiciel", "Développeuse Backend", "Data Scientist", "Ingénieur DevOps"],
+        "companies": ["Exemple SARL", "Solutions Numériques SA", "Technologies de France", "Nuage et Données"],
+        "present": "aujourd'hui",
+        "summary": "Ingénieur avec {number} ans d'expérience dans le développement d'applications web évolutives.",
+        "duties": ["Direction d'une équipe de {number} développeurs avec {skill} et {skill2}.",
+                   "Réduction de la latence de l'API de {number}% grâce à {skill}.",
+                   "Conception d'un pipeline traitant {number} millions d'événements par jour avec {skill}."],
+        "project": "Une plateforme web pour {number} utilisateurs développée avec {skill} et {skill2}.",
+        "degree": "Diplôme d'ingénieur en informatique", "school": "École Polytechnique",
+        "certificate": "Certifié : AWS Solutions Architect", "domain": "exemple.fr", "phone": "+33 6 {a} {b}"
+    },
+    "it": {
+        "headings": ["PROFILO", "ESPERIENZA", "COMPETENZE", "PROGETTI", "ISTRUZIONE", "CERTIFICAZIONI"],
+        "names": ["Giulia Rossi", "Marco Bianchi", "Francesca Romano", "Luca Ricci"],
+        "titles": ["Ingegnere del Software", "Sviluppatrice Backend", "Data Scientist", "Ingegnere DevOps"],
+        "companies": ["Esempio S.p.A.", "Soluzioni Digitali S.r.l.", "Tecnologia Italiana", "Dati e Cloud S.p.A."],
+        "present": "oggi",
+        "summary": "Ingegnere con {number} anni di esperienza nello sviluppo di applicazioni web scalabili.",
+        "duties": ["Ho guidato un gruppo di {number} sviluppatori utilizzando {skill} e {skill2}.",
+                   "Ho ridotto la latenza delle API del {number}% con {skill}.",
+                   "Ho progettato una pipeline che elabora {number} milioni di eventi al giorno con {skill}."],
+        "project": "Una piattaforma web per {number} utenti sviluppata con {skill} e {skill2}.",
+        "degree": "Laurea in Ingegneria Informatica", "school": "Politecnico di Milano",
+        "certificate": "Certificato: AWS Solutions Architect", "domain": "esempio.it", "phone": "+39 347 {a} {b}"
+    },
+    "pt": {
+        "headings": ["PERFIL", "EXPERIÊNCIA", "HABILIDADES", "PROJETOS", "EDUCAÇÃO", "CERTIFICAÇÕES"],
+        "names": ["Ana Souza", "João Silva", "Beatriz Costa", "Pedro Oliveira"],
+        "titles": ["Engenheiro de Software", "Desenvolvedora Backend", "Cientista de Dados", "Engenheiro DevOps"],
+        "companies": ["Exemplo Ltda.", "Soluções Digitais S.A.", "Tecnologia Brasil", "Dados e Nuvem Ltda."],
+        "present": "atual",
+        "summary": "Engenheiro com {number} anos de experiência no desenvolvimento de aplicações web escaláveis.",
+        "duties": ["Liderei uma equipe de {number} desenvolvedores utilizando {skill} e {skill2}.",
+                   "Reduzi a latência da API em {number}% com {skill}.",
+                   "Projetei um pipeline que processa {number} milhões de eventos por dia com {skill}."],
+        "project": "Uma plataforma web para {number} usuários desenvolvida com {skill} e {skill2}.",
+        "degree": "Bacharelado em Ciência da Computação", "school": "Universidade de São Paulo",
+        "certificate": "Certificado: AWS Solutions Architect", "domain": "exemplo.com.br", "phone": "+55 11 9{a} {b}"
+    },
+    "zh": {
+        "headings": ["个人简介", "工作经验", "技能", "项目", "教育背景", "证书"],
+        "names": ["张伟", "王芳", "李娜", "刘洋"],
+        "titles": ["高级软件工程师", "后端开发工程师", "数据科学家", "运维开发工程师"],
+        "companies": ["示例科技有限公司", "数字方案有限公司", "云数据科技公司", "创新软件集团"],
+        "present": "至今",
+        "summary": "拥有{number}年可扩展网络应用开发经验的工程师。",
+        "duties": ["带领{number}人团队使用{skill}和{skill2}开发服务。",
+                   "使用{skill}将接口延迟降低{number}%。",
+                   "使用{skill}设计每天处理{number}百万事件的数据管道。"],
+        "project": "使用{skill}和{skill2}开发的网络平台，服务{number}名用户。",
+        "degree": "计算机科学学士", "school": "清华大学",
+        "certificate": "认证：AWS Solutions Architect", "domain": "example.cn", "phone": "+86 138 {a} {b}"
+    },
+    "ja": {
+        "headings": ["概要", "職務経歴", "スキル", "プロジェクト", "学歴", "資格"],
+        "names": ["山田太郎", "佐藤花子", "鈴木一郎", "高橋美咲"],
+        "titles": ["シニアソフトウェアエンジニア", "バックエンドエンジニア", "データサイエンティスト", "インフラエンジニア"],
+        "companies": ["サンプル株式会社", "デジタルソリューション株式会社", "クラウドデータ株式会社", "未来技研株式会社"],
+        "present": "現在",
+        "summary": "スケーラブルなウェブアプリケーション開発に{number}年の経験を持つエンジニアです。",
+        "duties": ["{skill}と{skill2}を使用して{number}名のチームを率いました。",
+                   "{skill}を用いてAPIの応答時間を{number}%改善しました。",
+                   "{skill}で1日{number}百万件のイベントを処理するデータ基盤を設計しました。"],
+        "project": "{skill}と{skill2}で開発した{number}人のユーザー向けウェブプラットフォーム。",
+        "degree": "情報工学学士", "school": "東京大学",
+        "certificate": "認定：AWS Solutions Architect", "domain": "example.jp", "phone": "+81 90 {a} {b}"
+    },
+    "ru": {
+        "headings": ["О СЕБЕ", "ОПЫТ РАБОТЫ", "НАВЫКИ", "ПРОЕКТЫ", "ОБРАЗОВАНИЕ", "СЕРТИФИКАТЫ"],
+        "names": ["Иван Петров", "Анна Смирнова", "Дмитрий Иванов", "Ольга Кузнецова"],
+        "titles": ["Старший инженер-программист", "Backend-разработчик", "Специалист по данным", "DevOps-инженер"],
+        "companies": ["ООО Пример", "АО Цифровые решения", "ООО Облачные данные", "ООО Технологии"],
+        "present": "настоящее время",
+        "summary": "Инженер с опытом {number} лет в разработке масштабируемых веб-приложений.",
+        "duties": ["Руководил командой из {number} разработчиков, используя {skill} и {skill2}.",
+                   "Сократил задержку API на {number}% с помощью {skill}.",
+                   "Спроектировал конвейер данных на {skill}, обрабатывающий {number} миллионов событий в день."],
+        "project": "Веб-платформа для {number} пользователей, созданная на {skill} и {skill2}.",
+        "degree": "Бакалавр информатики", "school": "Московский государственный университет",
+        "certificate": "Сертификат: AWS Solutions Architect", "domain": "example.ru", "phone": "+7 916 {a} {b}"
+    },
+    "ar": {
+        "headings": ["نبذة", "الخبرة", "المهارات", "المشاريع", "التعليم", "الشهادات"],
+        "names": ["أحمد علي", "فاطمة حسن", "محمد إبراهيم", "سارة خالد"],
+        "titles": ["مهندس برمجيات أول", "مطور واجهات خلفية", "عالم بيانات", "مهندس عمليات التطوير"],
+        "companies": ["شركة المثال للتقنية", "حلول رقمية المحدودة", "شركة البيانات السحابية", "مجموعة الابتكار"],
+        "present": "حتى الآن",
+        "summary": "مهندس يتمتع بخبرة {number} سنوات في تطوير تطبيقات الويب القابلة للتوسع.",
+        "duties": ["قدت فريقا من {number} مطورين باستخدام {skill} و {skill2}.",
+                   "خفضت زمن استجابة الواجهة البرمجية بنسبة {number}% باستخدام {skill}.",
+                   "صممت خط بيانات يعالج {number} مليون حدث يوميا باستخدام {skill}."],
+        "project": "منصة ويب لعدد {number} مستخدم تم تطويرها باستخدام {skill} و {skill2}.",
+        "degree": "بكالوريوس علوم الحاسب", "school": "جامعة الملك سعود",
+        "certificate": "شهادة: AWS Solutions Architect", "domain": "example.sa", "phone": "+966 55 {a} {b}"
+    }
+}
+
+def _fill(rng: random.Random, template: str) -> str:
+    skill, skill2 = rng.sample(TECH_SKILLS, 2)
+    return template.format(skill=skill, skill2=skill2, number=rng.randint(2, 90))
+
+def generate_resume(language: str, length: str = "short", seed: int = 0) -> str:
+    """Plain-text resume with contact details, sections, jobs and projects"""
+    content = CONTENT[language]
+    rng = random.Random(f"{language}-{length}-{seed}")
+    jobs, projects = LENGTHS[length]
+    summary, experience, skills, projects_heading, education, certificates = content["headings"]
+
+    name = rng.choice(content["names"])
+    user = f"{rng.choice(['alex', 'sam', 'kim', 'lee'])}{rng.randint(10, 99)}"
+    lines = [
+        name,
+        f"{user}@{content['domain']} | {content['phone'].format(a=rng.randint(100, 999), b=rng.randint(1000, 9999))}"
+        f" | linkedin.com/in/{user} | github.com/{user}",
+        "",
+        summary,
+        _fill(rng, content["summary"]),
+        "",
+        experience
+    ]
+    year = 2024
+    for _ in range(jobs):
+        start = year - rng.randint(1, 4)
+        lines.append(rng.choice(content["titles"]))
+        lines.append(rng.choice(content["companies"]))
+        lines.append(f"{start} - {content['present'] if year == 2024 else year}")
+        lines.extend(_fill(rng, duty) for duty in rng.sample(content["duties"], 2))
+        year = start
+
+    lines += ["", skills, ", ".join(rng.sample(TECH_SKILLS, 8 if length == "short" else 20)), "", projects_heading]
+    for index in range(projects):
+        lines.append(f"{rng.choice(TECH_SKILLS)} {index + 1}")
+        lines.append(_fill(rng, content["project"]))
+    lines += ["", education, content["degree"], f"{content['school']} {year - 4} - {year}",
+              "", certificates, content["certificate"]]
+    return "\n".join(lines) + "\n"
+
+def to_docx(text: str) -> bytes:
+    """Minimal WordprocessingML package with one paragraph per line"""
+    paragraphs = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>' if line else "<w:p/>"
+        for line in text.split("\n")
+    )
+    parts = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" ContentType='
+            '"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            '</Types>'
+        ),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/officeDocument" Target="word/document.xml"/>'
+            '</Relationships>'
+        ),
+        "word/document.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{paragraphs}</w:body></w:document>'
+        )
+    }
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in parts.items():
+            # Fixed timestamps keep the archive byte-identical between runs
+            archive.writestr(zipfile.ZipInfo(name, date_time=(2024, 1, 1, 0, 0, 0)), data)
+    return buffer.getvalue()
+
+def _to_unicode_cmap(code_points: List[int]) -> bytes:
+    entries = []
+    # bfchar blocks hold at most 100 entries each
+    for start in range(0, len(code_points), 100):
+        block = code_points[start:start + 100]
+        entries.append(f"{len(block)} beginbfchar")
+        entries.extend(f"<{point:04X}> <{point:04X}>" for point in block)
+        entries.append("endbfchar")
+    return (
+        "/CIDInit /ProcSet findresource begin\n12 dict begin\nbegincmap\n"
+        "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def\n"
+        "/CMapName /Adobe-Identity-UCS def\n/CMapType 2 def\n"
+        "1 begincodespacerange\n<0000> <FFFF>\nendcodespacerange\n"
+        + "\n".join(entries) +
+        "\nendcmap\nCMapName currentdict /CMap defineresource pop\nend\nend\n"
+    ).encode("ascii")
+
+def to_pdf(text: str, lines_per_page: int = 50) -> bytes:
+    """PDF with the text on as many pages as needed; characters are written as CIDs equal to
+    their (BMP) code points and mapped back through the ToUnicode CMap"""
+    lines = [line.replace("\t", " ") for line in text.split("\n")]
+    pages = [lines[start:start + lines_per_page] for start in range(0, len(lines), lines_per_page)] or [[]]
+    code_points = sorted({ord(char) for line in lines for char in line if ord(char) <= 0xFFFF})
+
+    objects: List[bytes] = []  # Object n is objects[n - 1]
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    def stream(data: bytes, extra: str = "") -> bytes:
+        return f"<< /Length {len(data)}{extra} >>\nstream\n".encode("ascii") + data + b"\nendstream"
+
+    catalog = add(b"")
+    pages_id = add(b"")
+    cmap = add(stream(_to_unicode_cmap(code_points)))
+    widths = " ".join(f"{point} [{500 if point < 0x2E80 else 1000}]" for point in code_points)
+    descendant = add((
+        "<< /Type /Font /Subtype /CIDFontType2 /BaseFont /ResumeSans"
+        " /CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) /Supplement 0 >>"
+        f" /FontDescriptor {len(objects) + 2} 0 R /CIDToGIDMap /Identity /W [{widths}] >>"
+    ).encode("ascii"))
+    add((
+        "<< /Type /FontDescriptor /FontName /ResumeSans /Flags 32 /FontBBox [0 -200 1000 800]"
+        " /ItalicAngle 0 /Ascent 800 /Descent -200 /CapHeight 700 /StemV 80 >>"
+    ).encode("ascii"))
+    font = add((
+        "<< /Type /Font /Subtype /Type0 /BaseFont /ResumeSans /Encoding /Identity-H"
+        f" /DescendantFonts [{descendant} 0 R] /ToUnicode {cmap} 0 R >>"
+    ).encode("ascii"))
+
+    page_ids = []
+    for page_lines in pages:
+        commands = ["BT", "/F1 10 Tf", "14 TL", "50 800 Td"]
+        for line in page_lines:
+            if any("\u0600" <= char <= "\u06ff" for char in line):
+                line = line[::-1]  # Right-to-left lines are stored in visual order, as layout engines emit them
+            glyphs = "".join(f"{ord(char):04X}" for char in line if ord(char) <= 0xFFFF)
+            commands.append(f"<{glyphs}> Tj T*")
+        commands.append("ET")
+        content = add(stream("\n".join(commands).encode("ascii")))
+        page_ids.append(add((
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 595 842]"
+            f" /Resources << /Font << /F1 {font} 0 R >> >> /Contents {content} 0 R >>"
+        ).encode("ascii")))
+
+    objects[catalog - 1] = f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode("ascii")
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode("ascii")
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(f"{number} 0 obj\n".encode("ascii") + body + b"\nendobj\n")
+    xref = output.tell()
+    output.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("ascii"))
+    for offset in offsets:
+        output.write(f"{offset:010d} 00000 n \n".encode("ascii"))
+    output.write(f"trailer\n<< /Size {len(objects) + 1} /Root {catalog} 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("ascii"))
+    return output.getvalue()
+
+def build_corpus(seed: int = 0) -> List[Tuple[str, str, str, str, bytes]]:
+    """(language, length, format, text, file bytes) for every combination"""
+    corpus = []
+    for language in LANGUAGES:
+        for length in LENGTHS:
+            text = generate_resume(language, length, seed)
+            corpus.append((language, length, "pdf", text, to_pdf(text)))
+            corpus.append((language, length, "docx", text, to_docx(text)))
+    return corpus
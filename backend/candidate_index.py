@@ -0,0 +1,258 @@
+"""
+Inverted skill index over analysed candidates, with WAND top-k search
+
+Every analysed resume is stored once (by upload hash) in the candidates table with its
+canonical skills and a weight per skill; candidate_skills, clustered by skill, is the
+inverted index on disk. CandidateIndex mirrors it in memory as one posting list per
+skill (candidate ids ascending, with their weights), loading only the rows added since
+its last refresh, so every process stays current without rereading the table.
+
+Search scores a candidate as the sum over the query skills it has of
+query weight x idf x candidate weight, and returns the k best with WAND (Broder et al.):
+each posting list knows the most it can add to a score, so candidates whose possible
+total cannot beat the current k-th best are skipped without being scored, and whole
+stretches of the long posting lists (common skills) are jumped over with bisect.
+"""
+import heapq
+import math
+import os
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+CANDIDATE_INDEX_ENABLED = os.environ.get("CANDIDATE_INDEX", "1").lower() in ("1", "true", "yes")
+MAX_TOP_K = 100
+# Weight of a skill in a candidate: found anywhere, plus a bonus per section that backs it up
+BASE_SKILL_WEIGHT = 1.0
+EVIDENCE_BONUS = 0.5
+EVIDENCE_SECTIONS = ("From Projects", "From Experience", "From Achievements")
+
+_EXHAUSTED = float("inf")
+
+def candidate_skill_weights(features: Dict) -> Dict[str, float]:
+    """Skill -> weight of an analysed resume, from the features of extract_resume_features"""
+    categorized = features["analysis"]["skills"].get("categorized", {})
+    evidence = [set(categorized.get(section, [])) for section in EVIDENCE_SECTIONS]
+    return {
+        skill: BASE_SKILL_WEIGHT + EVIDENCE_BONUS * sum(skill in backed for backed in evidence)
+        for skill in features["analysis"]["skills"]["all"]
+    }
+
+def parse_skills(value: Optional[str], weighted: bool = False) -> Dict[str, float]:
+    """Comma-separated skills ("python, django:2" when weighted) -> {lowercase canonical skill: weight}"""
+    from ai_hr_analyser import skill_matcher
+    matcher = skill_matcher()
+    skills: Dict[str, float] = {}
+    for term in (value or "").split(","):
+        term, weight = term.strip(), 1.0
+        if weighted and ":" in term:
+            term, _, weight_text = term.rpartition(":")
+            term = term.strip()
+            try:
+                weight = float(weight_text)
+            except ValueError:
+                raise ValueError(f"Invalid skill weight: {weight_text.strip()!r}")
+            if not 0 < weight <= 100:
+                raise ValueError(f"Skill weight out of range (0, 100]: {weight_text.strip()!r}")
+        if not term:
+            continue
+        # Known skills and aliases map to their canonical name ("js" -> "javascript")
+        keys = [term.lower()] if matcher.ordered({term.lower()}) else sorted(matcher.match_keys(term))
+        for key in keys or [term.lower()]:
+            skills[key] = max(skills.get(key, 0.0), weight)
+    return skills
+
+class Posting:
+    """One skill's posting list: candidate ids in ascending order and their weights"""
+    __slots__ = ("skill", "ids", "weights", "max_weight")
+
+    def __init__(self, skill: str):
+        self.skill = skill
+        self.ids: List[int] = []
+        self.weights: List[float] = []
+        self.max_weight = 0.0
+
+    def append(self, candidate_id: int, weight: float):
+        self.ids.append(candidate_id)
+        self.weights.append(weight)
+        self.max_weight = max(self.max_weight, weight)
+
+    def __contains__(self, candidate_id: int) -> bool:
+        position = bisect_left(self.ids, candidate_id)
+        return position < len(self.ids) and self.ids[position] == candidate_id
+
+class _Cursor:
+    """Position in a posting list during one search; factor is the query weight x idf"""
+    __slots__ = ("posting", "position", "factor", "bound", "doc")
+
+    def __init__(self, posting: Posting, factor: float):
+        self.posting = posting
+        self.position = 0
+        self.factor = factor
+        self.bound = factor * posting.max_weight  # The most this skill can add to any score
+        self.doc = posting.ids[0] if posting.ids else _EXHAUSTED
+
+    def skip_to(self, candidate_id: int):
+        ids = self.posting.ids
+        self.position = bisect_left(ids, candidate_id, self.position)
+        self.doc = ids[self.position] if self.position < len(ids) else _EXHAUSTED
+
+    def advance(self):
+        self.position += 1
+        ids = self.posting.ids
+        self.doc = ids[self.position] if self.position < len(ids) else _EXHAUSTED
+
+class SearchResult:
+    def __init__(self, hits: List[Tuple[int, float, List[str]]], evaluated: int, total: int):
+        self.hits = hits            # (candidate id, score, matched skills), best first
+        self.evaluated = evaluated  # Candidates fully scored; the rest were skipped
+        self.total = total          # Candidates in the index
+
+class CandidateIndex:
+    def __init__(self):
+        self.postings: Dict[str, Posting] = {}     # lowercase skill -> posting list
+        self.candidates: Dict[int, Dict] = {}
+        self.last_id = 0
+        self._lock = threading.Lock()
+        self._db_ready = False
+        self._pid: Optional[int] = None
+
+    def _ensure_db(self):
+        if not self._db_ready:
+            from database.models import init_db
+            init_db()
+            self._db_ready = True
+
+    def add(self, content_hash: str, filename: str, features: Dict) -> Optional[int]:
+        """Store an analysed resume (once per upload hash); it is searchable from the next refresh"""
+        from database.models import save_candidate
+        self._ensure_db()
+        job_matches = features.get("job_matches") or []
+        top_match = job_matches[0] if job_matches else {}
+        return save_candidate(
+            content_hash, filename, features["analysis"].get("name", ""), top_match.get("job_title", ""),
+            int(top_match.get("match_percentage", 50)), int(features["ats_analysis"].get("ats_score", 0)),
+            candidate_skill_weights(features)
+        )
+
+    def refresh(self):
+        """Load the candidates stored since the last refresh (by any process) into the postings"""
+        from database.models import get_candidates_after, get_candidate_skills_after, get_max_candidate_id
+        self._ensure_db()
+        with self._lock:
+            if self._pid != os.getpid():
+                # A forked copy starts over rather than trusting the parent's state
+                self.postings, self.candidates, self.last_id, self._pid = {}, {}, 0, os.getpid()
+            if get_max_candidate_id() <= self.last_id:
+                return
+            last_id = self.last_id
+            for candidate_id, filename, name, top_job_title, compatibility_score, ats_score in get_candidates_after(last_id):
+                self.candidates[candidate_id] = {
+                    "candidate_id": candidate_id, "filename": filename, "name": name,
+                    "top_job_title": top_job_title, "compatibility_score": compatibility_score, "ats_score": ats_score
+                }
+                self.last_id = max(self.last_id, candidate_id)
+            # Rows come in candidate id order, so every posting list stays sorted by appending
+            for skill, candidate_id, weight in get_candidate_skills_after(last_id):
+                if candidate_id > self.last_id:
+                    continue  # Stored after the candidates query: picked up by the next refresh
+                key = skill.lower()
+                posting = self.postings.get(key)
+                if posting is None:
+                    posting = self.postings[key] = Posting(skill)
+                posting.append(candidate_id, weight)
+
+    def idf(self, posting: Posting) -> float:
+        # BM25-style: rare skills count more, and it never goes negative
+        total, frequency = len(self.candidates), len(posting.ids)
+        return math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+
+    def search(self, weights: Dict[str, float], required: Iterable[str] = (), excluded: Iterable[str] = (),
+               k: int = 10) -> SearchResult:
+        """Top-k candidates for weighted lowercase skills, having every required and no excluded skill"""
+        self.refresh()
+        with self._lock:
+            return self._search(weights, list(required), list(excluded), k)
+
+    def _search(self, weights: Dict[str, float], required: List[str], excluded: List[str], k: int) -> SearchResult:
+        total = len(self.candidates)
+        required_postings = [self.postings.get(skill) for skill in required]
+        if any(posting is None for posting in required_postings):
+            return SearchResult([], 0, total)  # Nobody has a required skill that is not indexed
+        excluded_postings = [self.postings[skill] for skill in excluded if skill in self.postings]
+
+        cursors = [
+            _Cursor(self.postings[skill], weight * self.idf(self.postings[skill]))
+            for skill, weight in weights.items() if skill in self.postings and weight > 0
+        ]
+        cursors = [cursor for cursor in cursors if cursor.bound > 0]
+        if not cursors and required_postings:
+            # Filter-only query: every candidate with the required skills, best analysis score first
+            shortest = min(required_postings, key=lambda posting: len(posting.ids))
+            eligible = [candidate_id for candidate_id in shortest.ids
+                        if all(candidate_id in posting for posting in required_postings)
+                        and not any(candidate_id in posting for posting in excluded_postings)]
+            eligible.sort(key=lambda candidate_id: (-self.candidates[candidate_id]["compatibility_score"], candidate_id))
+            matched = [posting.skill for posting in required_postings]
+            return SearchResult([(candidate_id, 0.0, matched) for candidate_id in eligible[:k]], len(eligible), total)
+
+        heap: List[Tuple[float, int, int, List[str]]] = []  # (score, -id, id, matched): min-heap of the best k
+        evaluated = 0
+        while True:
+            # WAND pivot: the first candidate whose cumulative upper bound could enter the top k
+            cursors.sort(key=lambda cursor: cursor.doc)
+            threshold = heap[0][0] if len(heap) >= k else 0.0
+            reachable, pivot = 0.0, None
+            for index, cursor in enumerate(cursors):
+                if cursor.doc == _EXHAUSTED:
+                    break
+                reachable += cursor.bound
+                if reachable > threshold:
+                    pivot = index
+                    break
+            if pivot is None:
+                break  # No remaining candidate can beat the k-th best: stop early
+            pivot_doc = cursors[pivot].doc
+
+            if cursors[0].doc != pivot_doc:
+                # Everything before the pivot is too weak on its own: jump those lists forward
+                for cursor in cursors[:pivot]:
+                    cursor.skip_to(pivot_doc)
+                continue
+
+            # Every list at the pivot points to it: score the candidate
+            score, matched = 0.0, []
+            for cursor in cursors:
+                if cursor.doc != pivot_doc:
+                    break
+                score += cursor.factor * cursor.posting.weights[cursor.position]
+                matched.append(cursor.posting.skill)
+                cursor.advance()
+            if (all(pivot_doc in posting for posting in required_postings)
+                    and not any(pivot_doc in posting for posting in excluded_postings)):
+                evaluated += 1
+                entry = (score, -pivot_doc, pivot_doc, matched)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+
+        hits = [(candidate_id, score, matched) for score, _, candidate_id, matched in sorted(heap, reverse=True)]
+        return SearchResult(hits, evaluated, total)
+
+    def exhaustive_search(self, weights: Dict[str, float], k: int = 10) -> List[Tuple[int, float]]:
+        """Score every candidate of every query posting list (reference for tests and benchmarks)"""
+        self.refresh()
+        with self._lock:
+            scores: Dict[int, float] = {}
+            for skill, weight in weights.items():
+                posting = self.postings.get(skill)
+                if posting is None or weight <= 0:
+                    continue
+                factor = weight * self.idf(posting)
+                for candidate_id, candidate_weight in zip(posting.ids, posting.weights):
+                    scores[candidate_id] = scores.get(candidate_id, 0.0) + factor * candidate_weight
+            return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+    def stats(self) -> Dict:
+        return {"candidates": len(self.candidates), "skills": len(self.postings), "last_id": self.last_id}
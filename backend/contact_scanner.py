@@ -0,0 +1,275 @@
+"""
+Linear-time contact extraction
+
+The text is split into lines and each line into tokens once. Every token is classified
+with plain string operations (email, profile URL, @handle, website, "LinkedIn:" style
+label), and phone numbers come from a single scan for digit runs per line. Candidates
+are ranked by how explicit they are, so a profile URL wins over a labelled handle no
+matter where each appears, without rescanning the text once per pattern.
+
+Work per token is bounded by MAX_TOKEN_LENGTH and every regex used here has no nested
+or overlapping quantifiers, so the total cost is linear in the size of the text.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+MAX_TOKEN_LENGTH = 256  # Longer tokens cannot be contact details and are skipped
+
+# Output order matches the order fields were filled by the original pattern cascade
+FIELDS = ['email', 'phone', 'linkedin', 'github', 'website', 'twitter', 'instagram', 'behance']
+
+_TOKEN_SPLIT = re.compile(r'[\s|;,()\[\]<>"\']+')
+_DIGIT = re.compile(r'\d')
+_PHONE_RUN = re.compile(r'[+(]?\d[\d \t().-]*')
+
+# Tried in order on each digit run; all have bounded width, so each search is linear
+_PHONE_PATTERNS = [
+    re.compile(r'(\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9})'),
+    re.compile(r'(\(\d{3}\)\s?\d{3}[-.\s]?\d{4})'),
+    re.compile(r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})')
+]
+_PHONE_LABELS = ('phone', 'tel', 'mobile', 'telefon', 'teléfono', 'téléphone')
+
+_EMAIL_LOCAL_CHARS = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-')
+_DOMAIN_CHARS = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-')
+_HANDLE_CHARS = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-')
+_SEPARATOR_TOKENS = {':', '-', '/', '–', '—', '=', '>'}
+
+_PROFILE_LABELS = {'linkedin': 'linkedin', 'github': 'github', 'twitter': 'twitter',
+                   'instagram': 'instagram', 'behance': 'behance'}
+_PROFILE_URLS = [('linkedin', 'linkedin.com/in/', 50), ('linkedin', 'linkedin.com/pub/', 50),
+                 ('linkedin', 'linkedin.com/profile/', 50), ('github', 'github.com/', 40)]
+_SOCIAL_URLS = [('twitter', 'twitter.com/'), ('twitter', 'x.com/'),
+                ('instagram', 'instagram.com/'), ('behance', 'behance.net/')]
+_WEBSITE_LABELS = {'portfolio', 'website', 'site', 'homepage', 'web', 'blog'}
+_LABELS = set(_PROFILE_LABELS) | _WEBSITE_LABELS
+
+# Words that follow a label but are not usernames ("LinkedIn Profile")
+_NOT_HANDLES = {'linkedin', 'github', 'twitter', 'facebook', 'instagram', 'behance',
+                'profile', 'profil', 'perfil', 'url', 'link', 'page', 'account'}
+
+_PERSONAL_MAIL_DOMAINS = ('linkedin', 'github', 'gmail', 'yahoo', 'hotmail', 'outlook')
+_SOCIAL_DOMAINS = ('twitter.com', 'x.com', 'instagram.com', 'behance.net', 'facebook.com')
+
+# Bare "name.tld" tokens only count as websites for these TLDs, which keeps file names
+# and dotted technology names (Node.js, ASP.NET) out
+_WEBSITE_TLDS = {
+    'com', 'net', 'org', 'io', 'dev', 'me', 'app', 'co', 'ai', 'tech', 'info', 'xyz', 'site',
+    'online', 'page', 'design', 'portfolio', 'blog', 'de', 'fr', 'es', 'it', 'pt', 'nl', 'uk',
+    'eu', 'ch', 'at', 'se', 'no', 'dk', 'fi', 'pl', 'ru', 'cn', 'jp', 'in', 'br', 'ca', 'au', 'us'
+}
+_NOT_WEBSITES = {'asp.net', 'vb.net', 'ado.net', 'socket.io', 'dot.net'}
+
+def _leading_handle(value: str, extra_chars: str = '') -> str:
+    """Longest prefix of value made of username characters"""
+    end = 0
+    while end < len(value) and (value[end] in _HANDLE_CHARS or value[end] in extra_chars):
+        end += 1
+    return value[:end]
+
+def _valid_profile_handle(username: str, max_length: int) -> bool:
+    return (3 <= len(username) <= max_length and
+            username[0].isalpha() and
+            username.lower() not in _NOT_HANDLES and
+            not username.startswith(('http', 'www')) and
+            not username.endswith(('.com', '.net', '.org')))
+
+def _find_email(token: str) -> Optional[str]:
+    at = token.find('@')
+    if at <= 0:
+        return None
+    start = at
+    while start > 0 and token[start - 1] in _EMAIL_LOCAL_CHARS:
+        start -= 1
+    end = at + 1
+    while end < len(token) and token[end] in _DOMAIN_CHARS:
+        end += 1
+    domain = token[at + 1:end].rstrip('.-')
+    name, dot, tld = domain.rpartition('.')
+    if start == at or not name or not dot or len(tld) < 2 or not (tld.isascii() and tld.isalpha()):
+        return None
+    return token[start:at + 1] + domain
+
+def _url_path(lower: str, token: str, marker: str) -> Optional[str]:
+    """The part of the token after a domain marker such as 'linkedin.com/'"""
+    index = lower.find(marker)
+    if index < 0:
+        return None
+    # The marker must start the host, not be the tail of another domain
+    if index > 0 and lower[index - 1] not in '/.':
+        return None
+    return token[index + len(marker):]
+
+def _website_host(token: str) -> Optional[str]:
+    host = token
+    lower = host.lower()
+    if lower.startswith(('http://', 'https://')):
+        host = host[host.index('//') + 2:]
+    host = host.split('/', 1)[0].strip('.:')
+    name, dot, tld = host.rpartition('.')
+    if not name or not dot or len(host) <= 4 or not (tld.isascii() and tld.isalpha() and len(tld) >= 2):
+        return None
+    if any(char not in _DOMAIN_CHARS and char != '_' for char in host):
+        return None
+    return host
+
+class _Candidates:
+    """Best (lowest rank, earliest) value seen so far for each field"""
+
+    def __init__(self):
+        self.best: Dict[str, Tuple[int, str]] = {}
+
+    def offer(self, field: str, rank: int, value: str):
+        current = self.best.get(field)
+        if current is None or rank < current[0]:
+            self.best[field] = (rank, value)
+
+    def settled(self, field: str, rank: int) -> bool:
+        """True when no candidate of this rank could replace the current value"""
+        current = self.best.get(field)
+        return current is not None and current[0] <= rank
+
+    def result(self) -> Dict[str, str]:
+        return {field: self.best[field][1] for field in FIELDS if field in self.best}
+
+def _label_value(tokens: List[str], index: int, label: str, token: str) -> Optional[str]:
+    """Value after a label token: 'LinkedIn: x', 'LinkedIn:x', 'LinkedIn - x'"""
+    rest = token[len(label):].lstrip(':-=/')
+    if rest:
+        return rest
+    # Skip at most two separator tokens so the lookahead stays constant work
+    for next_token in tokens[index + 1:index + 3]:
+        if next_token not in _SEPARATOR_TOKENS:
+            return next_token.lstrip(':-=/') or None
+    return None
+
+def _scan_token(candidates: _Candidates, tokens: List[str], index: int):
+    token = tokens[index]
+    if len(token) > MAX_TOKEN_LENGTH:
+        return
+    lower = token.lower()
+
+    if '@' in token:
+        if token.startswith('@'):
+            username = _leading_handle(token[1:]).rstrip('.-')
+            if 2 < len(username) < 30 and '.' not in username and not candidates.settled('twitter', 1):
+                candidates.offer('twitter', 1, f"https://twitter.com/{username}")
+        elif not candidates.settled('email', 0):
+            email = _find_email(token)
+            if email:
+                candidates.offer('email', 0, email)
+        return
+
+    # Profile URLs are the most explicit evidence
+    if '/' in token:
+        for field, marker, max_length in _PROFILE_URLS:
+            path = _url_path(lower, token, marker)
+            if path is not None:
+                username = path.strip().rstrip('/')
+                if _valid_profile_handle(username, max_length):
+                    candidates.offer(field, 0, f"https://{field}.com/{'in/' if field == 'linkedin' else ''}{username}")
+                return
+
+        for field, marker in _SOCIAL_URLS:
+            path = _url_path(lower, token, marker)
+            if path is not None:
+                username = _leading_handle(path)
+                if 2 < len(username) < 30:
+                    candidates.offer(field, 0, f"https://{field}.com/{username}")
+                return
+
+    github_io = lower.find('.github.io')
+    if github_io > 0:
+        username = token[:github_io]
+        if '//' in username:
+            username = username.split('//', 1)[1]
+        if _valid_profile_handle(username, 40):
+            candidates.offer('github', 1, f"https://github.com/{username}")
+        return
+
+    # Labels: "LinkedIn: johnsmith", "Portfolio: johnsmith.dev"
+    label = _leading_handle(lower).strip('.-_')
+    if label in _PROFILE_LABELS and lower[len(label):len(label) + 1] in ('', ':', '-', '=', '/'):
+        field = _PROFILE_LABELS[label]
+        value = None if candidates.settled(field, 2) else _label_value(tokens, index, label, token)
+        if value and not value.lower().startswith(('http', 'www')):
+            username = _leading_handle(value).rstrip('.')
+            if field in ('linkedin', 'github'):
+                if _valid_profile_handle(username, 50 if field == 'linkedin' else 40):
+                    candidates.offer(field, 2, f"https://{field}.com/{'in/' if field == 'linkedin' else ''}{username}")
+            elif 2 < len(username) < 30:
+                candidates.offer(field, 2, f"https://{field}.com/{username}")
+        return
+
+    if label in _WEBSITE_LABELS and lower[len(label):len(label) + 1] in ('', ':'):
+        value = None if candidates.settled('website', 0) else _label_value(tokens, index, label, token)
+        host = _website_host(value) if value and len(value) <= MAX_TOKEN_LENGTH else None
+        if host and not any(domain in host.lower() for domain in _PERSONAL_MAIL_DOMAINS):
+            candidates.offer('website', 0, f"https://{host}")
+        return
+
+    if '.' in token and not candidates.settled('website', 1):
+        _scan_website(candidates, token, lower)
+
+def _scan_website(candidates: _Candidates, token: str, lower: str):
+    if any(domain in lower for domain in _PERSONAL_MAIL_DOMAINS):
+        return
+    host = _website_host(token)
+    if host is None:
+        return
+    host_lower = host.lower()
+    if any(host_lower == domain or host_lower.endswith('.' + domain) for domain in _SOCIAL_DOMAINS):
+        return
+
+    if lower.startswith(('http://', 'https://')):
+        candidates.offer('website', 1, f"https://{host}")
+    elif host_lower.startswith('www.'):
+        candidates.offer('website', 2, f"https://{host[4:]}")
+    elif (token.strip('.:/') == host and host_lower not in _NOT_WEBSITES and
+          host_lower.rpartition('.')[2] in _WEBSITE_TLDS):
+        candidates.offer('website', 3, f"https://{host}")
+
+def _scan_phones(candidates: _Candidates, line: str, line_lower: str):
+    for run in _PHONE_RUN.finditer(line):
+        text = run.group().rstrip(' \t(.-')
+        for rank, pattern in enumerate(_PHONE_PATTERNS):
+            match = pattern.search(text)
+            if match:
+                candidates.offer('phone', rank, match.group(1))
+                break
+        else:
+            # "Phone: 0170 1234567" style numbers without a recognised grouping
+            before = line_lower[max(run.start() - 16, 0):run.start()].rstrip(' \t:')
+            digits = text.lstrip('(').replace('.', ' ')
+            if before.endswith(_PHONE_LABELS) and len(digits) >= 8:
+                candidates.offer('phone', len(_PHONE_PATTERNS), digits)
+
+def contact_candidates(text: str) -> Dict[str, Tuple[int, str]]:
+    """Best (rank, value) per field in the text; scan_contacts of a text cut at line breaks is
+    best_contacts of the candidates of its pieces"""
+    candidates = _Candidates()
+    for line in text.splitlines():
+        if not line:
+            continue
+        tokens = [token for token in _TOKEN_SPLIT.split(line) if token]
+        for index, token in enumerate(tokens):
+            # Plain words and numbers are the bulk of a resume; only labels among them matter
+            if '@' in token or '.' in token or '/' in token or ':' in token:
+                _scan_token(candidates, tokens, index)
+            elif token.isalpha() and token.lower() in _LABELS:
+                _scan_token(candidates, tokens, index)
+        if not candidates.settled('phone', 0) and _DIGIT.search(line):
+            _scan_phones(candidates, line, line.lower())
+    return candidates.best
+
+def best_contacts(pieces: List[Dict[str, Tuple[int, str]]]) -> Dict[str, str]:
+    """Contact details from the candidates of consecutive pieces of a text, in text order"""
+    candidates = _Candidates()
+    for best in pieces:
+        for field, (rank, value) in best.items():
+            candidates.offer(field, rank, value)
+    return candidates.result()
+
+def scan_contacts(text: str) -> Dict[str, str]:
+    """Extract contact details and profile links from resume text in one pass"""
+    return best_contacts([contact_candidates(text)])
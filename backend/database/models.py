@@ -1,12 +1,143 @@
 import sqlite3
-from typing import List, Dict, Any
+import json
+import threading
+from typing import List, Dict, Any, Optional
 import os
 
 DATABASE_PATH = "resume_analyzer.db"
 
+# One long-lived connection per thread (and per process, since forked workers must not
+# share a parent's connection). Keeping connections open is what makes sqlite3's
+# per-connection statement cache effective: the SQL constants below are parsed once
+# per connection and reused on every call.
+_local = threading.local()
+STATEMENT_CACHE_SIZE = 128
+
+PRAGMAS = [
+    "PRAGMA journal_mode=WAL",        # readers never block on the writer
+    "PRAGMA synchronous=NORMAL",      # safe with WAL, avoids an fsync per commit
+    "PRAGMA busy_timeout=5000",       # wait for a competing writer instead of failing
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",        # 8 MB page cache
+    "PRAGMA mmap_size=67108864"       # 64 MB memory-mapped reads
+]
+
+SELECT_JOB_ROLES = '''
+    SELECT r.id, r.title, r.category, r.description, s.skill
+    FROM job_roles r
+    LEFT JOIN job_role_skills s ON s.job_role_id = r.id
+    ORDER BY r.id, s.position
+'''
+SELECT_CATALOG_VERSION = 'SELECT version FROM catalog_version WHERE id = 1'
+BUMP_CATALOG_VERSION = 'UPDATE catalog_version SET version = version + 1 WHERE id = 1'
+INSERT_JOB_ROLE = '''
+    INSERT INTO job_roles (title, category, description, required_skills)
+    VALUES (?, ?, ?, ?)
+'''
+INSERT_JOB_ROLE_SKILL = '''
+    INSERT INTO job_role_skills (job_role_id, position, skill, category)
+    VALUES (?, ?, ?, ?)
+'''
+INSERT_ANALYSIS = '''
+    INSERT INTO analysis_history (filename, analysis_result, content_hash, translate_to)
+    VALUES (?, ?, ?, ?)
+'''
+# Batch lookup with a constant statement text (texts passed as one JSON array)
+SELECT_TRANSLATIONS = '''
+    SELECT source_text, translated_text FROM translation_memory
+    WHERE target_lang = ?2 AND source_text IN (SELECT value FROM json_each(?1))
+'''
+INSERT_TRANSLATION = '''
+    INSERT OR REPLACE INTO translation_memory (source_text, target_lang, translated_text)
+    VALUES (?, ?, ?)
+'''
+SELECT_CACHED_ANALYSIS = '''
+    SELECT analysis_result FROM analysis_history
+    WHERE content_hash = ? AND translate_to = ?
+      AND created_at >= datetime('now', ?)
+    ORDER BY id DESC LIMIT 1
+'''
+
+INSERT_CANDIDATE = '''
+    INSERT OR IGNORE INTO candidates (content_hash, filename, name, top_job_title, compatibility_score, ats_score)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+INSERT_CANDIDATE_SKILL = '''
+    INSERT OR REPLACE INTO candidate_skills (skill, candidate_id, weight) VALUES (?, ?, ?)
+'''
+SELECT_MAX_CANDIDATE_ID = 'SELECT COALESCE(MAX(id), 0) FROM candidates'
+SELECT_CANDIDATES_AFTER = '''
+    SELECT id, filename, name, top_job_title, compatibility_score, ats_score FROM candidates
+    WHERE id > ? ORDER BY id
+'''
+SELECT_CANDIDATE_SKILLS_AFTER = '''
+    SELECT skill, candidate_id, weight FROM candidate_skills
+    WHERE candidate_id > ? ORDER BY candidate_id
+'''
+
+# Analysis job queue. Times are Unix epoch seconds (sub-second, for queue wait times);
+# a claim takes the oldest queued job and leases it to one worker in a single statement
+# Inserts nothing once max_queued jobs are queued; the count and the insert are one statement
+INSERT_JOB = '''
+    INSERT INTO analysis_jobs (id, status, filename, content, content_hash, translate_to, callback_url, created_at)
+    SELECT ?, 'queued', ?, ?, ?, ?, ?, ?
+    WHERE (SELECT COUNT(*) FROM analysis_jobs WHERE status = 'queued') < ?
+'''
+CLAIM_JOB = '''
+    UPDATE analysis_jobs
+    SET status = 'running', worker = ?1, started_at = ?2, lease_expires = ?3, attempts = attempts + 1
+    WHERE id = (SELECT id FROM analysis_jobs WHERE status = 'queued' ORDER BY created_at, id LIMIT 1)
+    RETURNING id, filename, content, content_hash, translate_to, callback_url, created_at, attempts
+'''
+# Running jobs whose worker is gone: queued again, or failed once they used up their attempts
+RELEASE_JOBS = '''
+    UPDATE analysis_jobs
+    SET status = CASE WHEN attempts >= ?1 THEN 'failed' ELSE 'queued' END,
+        error = CASE WHEN attempts >= ?1 THEN 'Analysis worker stopped while analysing this resume' END,
+        finished_at = CASE WHEN attempts >= ?1 THEN ?2 END,
+        content = CASE WHEN attempts >= ?1 THEN NULL ELSE content END,
+        worker = NULL, lease_expires = NULL
+    WHERE status = 'running' AND (lease_expires < ?2 OR worker = ?3)
+    RETURNING id, status, callback_url
+'''
+# The upload is dropped once the job is finished; only the result (or error) is kept
+FINISH_JOB = '''
+    UPDATE analysis_jobs
+    SET status = ?, result = ?, error = ?, finished_at = ?, content = NULL, lease_expires = NULL
+    WHERE id = ? AND status = 'running' AND worker = ?
+'''
+SET_JOB_CALLBACK_STATUS = 'UPDATE analysis_jobs SET callback_status = ? WHERE id = ?'
+SELECT_JOB = '''
+    SELECT id, status, filename, translate_to, callback_url, callback_status, created_at, started_at,
+           finished_at, attempts, result, error
+    FROM analysis_jobs WHERE id = ?
+'''
+SELECT_JOBS_AHEAD = '''
+    SELECT COUNT(*) FROM analysis_jobs
+    WHERE status = 'queued' AND (created_at < ?1 OR (created_at = ?1 AND id < ?2))
+'''
+SELECT_JOB_QUEUE_STATS = '''
+    SELECT status, COUNT(*), MIN(created_at) FROM analysis_jobs
+    WHERE status IN ('queued', 'running') GROUP BY status
+'''
+DELETE_FINISHED_JOBS = "DELETE FROM analysis_jobs WHERE status IN ('done', 'failed') AND finished_at < ?"
+
+def get_connection() -> sqlite3.Connection:
+    """This thread's pooled connection, opened and tuned on first use"""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None and _local.path == DATABASE_PATH and _local.pid == os.getpid():
+        return conn
+    
+    conn = sqlite3.connect(DATABASE_PATH, timeout=5.0, cached_statements=STATEMENT_CACHE_SIZE)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    _local.conn, _local.path, _local.pid = conn, DATABASE_PATH, os.getpid()
+    return conn
+
 def init_db():
     """Initialize the database with required tables"""
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = get_connection()
     cursor = conn.cursor()
     
     # Create job_roles table
@@ -16,11 +147,35 @@ def init_db():
             title TEXT NOT NULL,
             category TEXT NOT NULL,
             description TEXT,
-            required_skills TEXT,  -- JSON string of skills array
+            required_skills TEXT,  -- Legacy comma-joined copy; job_role_skills is authoritative
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
     
+    # One row per required skill, in the role's order
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS job_role_skills (
+            job_role_id INTEGER NOT NULL REFERENCES job_roles (id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            skill TEXT NOT NULL COLLATE NOCASE,
+            category TEXT NOT NULL,
+            PRIMARY KEY (job_role_id, position)
+        )
+    ''')
+    # Roles are only ever read whole (into the job catalog snapshot), never by skill or category,
+    # so indexes on those would only slow down inserts: drop the ones earlier versions created
+    for index in ('idx_job_role_skills_skill', 'idx_job_role_skills_category', 'idx_job_roles_category'):
+        cursor.execute(f'DROP INDEX IF EXISTS {index}')
+    
+    # Single row bumped by every catalog write so readers can detect changes cheaply
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS catalog_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    ''')
+    cursor.execute('INSERT OR IGNORE INTO catalog_version (id, version) VALUES (1, 0)')
+    
     # Create users table for future authentication
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS users (
@@ -43,32 +198,119 @@ def init_db():
         )
     ''')
     
+    # Columns used by the persistent analysis cache (added to pre-existing databases too)
+    _ensure_column(cursor, 'analysis_history', 'content_hash', 'TEXT')
+    _ensure_column(cursor, 'analysis_history', 'translate_to', "TEXT DEFAULT ''")
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_analysis_history_content_hash
+        ON analysis_history (content_hash, translate_to)
+    ''')
+    
+    # Analysed candidates (one per distinct upload) and their skills for candidate search.
+    # candidate_skills is the inverted index: clustered by skill, each skill's rows are its
+    # posting list in candidate id order
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS candidates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content_hash TEXT NOT NULL UNIQUE,
+            filename TEXT,
+            name TEXT,
+            top_job_title TEXT,
+            compatibility_score INTEGER,
+            ats_score INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS candidate_skills (
+            skill TEXT NOT NULL COLLATE NOCASE,
+            candidate_id INTEGER NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+            weight REAL NOT NULL,
+            PRIMARY KEY (skill, candidate_id)
+        ) WITHOUT ROWID
+    ''')
+    # Lets a process load only the candidates added since its last refresh
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_candidate_skills_candidate ON candidate_skills (candidate_id)')
+    
+    # Translation memory: one row per (text, target language), looked up by primary key
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS translation_memory (
+            source_text TEXT NOT NULL,
+            target_lang TEXT NOT NULL,
+            translated_text TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (target_lang, source_text)
+        ) WITHOUT ROWID
+    ''')
+    
+    # Durable queue of POST /api/jobs analyses, claimed by the job worker processes
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS analysis_jobs (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,  -- queued, running, done or failed
+            filename TEXT,
+            content BLOB,  -- The upload, until the job is finished
+            content_hash TEXT NOT NULL,
+            translate_to TEXT DEFAULT '',
+            callback_url TEXT,
+            callback_status TEXT,
+            worker TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            created_at REAL NOT NULL,
+            started_at REAL,
+            lease_expires REAL,
+            finished_at REAL,
+            result TEXT,  -- JSON string
+            error TEXT
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_analysis_jobs_status ON analysis_jobs (status, created_at)')
+    
+    _migrate_required_skills(cursor)
     conn.commit()
-    conn.close()
+
+def _ensure_column(cursor: sqlite3.Cursor, table: str, column: str, declaration: str):
+    """Add a column to an existing table if it is missing"""
+    cursor.execute(f'PRAGMA table_info({table})')
+    if column not in [row[1] for row in cursor.fetchall()]:
+        cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {declaration}')
+
+def _migrate_required_skills(cursor: sqlite3.Cursor):
+    """Copy comma-joined skills of roles created before job_role_skills existed"""
+    cursor.execute('''
+        SELECT id, category, required_skills FROM job_roles
+        WHERE required_skills <> ''
+          AND NOT EXISTS (SELECT 1 FROM job_role_skills WHERE job_role_id = job_roles.id)
+    ''')
+    for role_id, category, required_skills_str in cursor.fetchall():
+        cursor.executemany(INSERT_JOB_ROLE_SKILL, [
+            (role_id, position, skill, category)
+            for position, skill in enumerate(required_skills_str.split(','))
+        ])
 
 def get_job_roles() -> List[Dict[str, Any]]:
     """Get all job roles from database"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT title, category, description, required_skills FROM job_roles')
-    rows = cursor.fetchall()
-    
     job_roles = []
-    for row in rows:
-        title, category, description, required_skills_str = row
-        required_skills = required_skills_str.split(',') if required_skills_str else []
-        
-        job_roles.append({
-            'title': title,
-            'category': category,
-            'description': description,
-            'required_skills': required_skills
-        })
+    current_id = None
+    for role_id, title, category, description, skill in get_connection().execute(SELECT_JOB_ROLES):
+        if role_id != current_id:
+            current_id = role_id
+            job_roles.append({
+                'title': title,
+                'category': category,
+                'description': description,
+                'required_skills': []
+            })
+        if skill is not None:
+            job_roles[-1]['required_skills'].append(skill)
     
-    conn.close()
     return job_roles
 
+def get_catalog_version() -> int:
+    """Version of the job catalog, incremented by every insert_job_role/clear_job_roles"""
+    row = get_connection().execute(SELECT_CATALOG_VERSION).fetchone()
+    return row[0] if row else 0
+
 def insert_job_role(title: str, category: str, description: str, required_skills: List[str]):
     """Insert a new job role into database"""
     # Input validation
@@ -79,25 +321,150 @@ def insert_job_role(title: str, category: str, description: str, required_skills
     if len(description) > 1000:
         raise ValueError("Description too long")
     
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
     # Sanitize skills
     sanitized_skills = [skill[:50] for skill in required_skills if skill.strip()]
     required_skills_str = ','.join(sanitized_skills)
     
-    cursor.execute('''
-        INSERT INTO job_roles (title, category, description, required_skills)
-        VALUES (?, ?, ?, ?)
-    ''', (title[:200], category[:100], description[:1000], required_skills_str))
-    
-    conn.commit()
-    conn.close()
+    conn = get_connection()
+    with conn:
+        cursor = conn.execute(INSERT_JOB_ROLE, (title[:200], category[:100], description[:1000], required_skills_str))
+        role_id = cursor.lastrowid
+        conn.executemany(INSERT_JOB_ROLE_SKILL, [
+            (role_id, position, skill, category[:100]) for position, skill in enumerate(sanitized_skills)
+        ])
+        conn.execute(BUMP_CATALOG_VERSION)
 
 def clear_job_roles():
     """Clear all job roles from database"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    cursor.execute('DELETE FROM job_roles')
-    conn.commit()
-    conn.close()
\ No newline at end of file
+    conn = get_connection()
+    with conn:
+        conn.execute('DELETE FROM job_role_skills')
+        conn.execute('DELETE FROM job_roles')
+        conn.execute(BUMP_CATALOG_VERSION)
+
+def save_analysis_result(filename: str, content_hash: str, translate_to: str, result: Dict[str, Any]):
+    """Store an analysis response in analysis_history, keyed by the upload's content hash"""
+    conn = get_connection()
+    with conn:
+        conn.execute(INSERT_ANALYSIS, ((filename or '')[:255], json.dumps(result), content_hash, translate_to))
+
+def get_cached_analysis(content_hash: str, translate_to: str, max_age_seconds: float) -> Optional[Dict[str, Any]]:
+    """Get the most recent stored analysis for an upload if it is younger than max_age_seconds"""
+    row = get_connection().execute(
+        SELECT_CACHED_ANALYSIS, (content_hash, translate_to, f'-{int(max_age_seconds)} seconds')
+    ).fetchone()
+    
+    return json.loads(row[0]) if row else None
+
+def get_translations(texts: List[str], target_lang: str) -> Dict[str, str]:
+    """Stored translations for any of the texts, as {source text: translation}"""
+    rows = get_connection().execute(SELECT_TRANSLATIONS, (json.dumps(texts), target_lang)).fetchall()
+    return dict(rows)
+
+def save_translations(translations: Dict[str, str], target_lang: str):
+    """Add translations to the translation memory"""
+    conn = get_connection()
+    with conn:
+        conn.executemany(INSERT_TRANSLATION, [
+            (source_text, target_lang, translated_text) for source_text, translated_text in translations.items()
+        ])
+
+def save_candidate(content_hash: str, filename: str, name: str, top_job_title: str, compatibility_score: int,
+                   ats_score: int, skills: Dict[str, float]) -> Optional[int]:
+    """Store an analysed candidate and its weighted skills; None if the upload is already stored"""
+    conn = get_connection()
+    with conn:
+        cursor = conn.execute(INSERT_CANDIDATE, (
+            content_hash, (filename or '')[:255], (name or '')[:100], (top_job_title or '')[:200],
+            compatibility_score, ats_score
+        ))
+        if not cursor.rowcount:
+            return None
+        candidate_id = cursor.lastrowid
+        conn.executemany(INSERT_CANDIDATE_SKILL, [
+            (skill[:50], candidate_id, weight) for skill, weight in skills.items()
+        ])
+    return candidate_id
+
+def get_max_candidate_id() -> int:
+    """Id of the most recently stored candidate (0 when there is none)"""
+    return get_connection().execute(SELECT_MAX_CANDIDATE_ID).fetchone()[0]
+
+def get_candidates_after(candidate_id: int) -> List[tuple]:
+    """(id, filename, name, top_job_title, compatibility_score, ats_score) of candidates newer than the id"""
+    return get_connection().execute(SELECT_CANDIDATES_AFTER, (candidate_id,)).fetchall()
+
+def get_candidate_skills_after(candidate_id: int) -> List[tuple]:
+    """(skill, candidate_id, weight) rows of candidates newer than the id, in candidate id order"""
+    return get_connection().execute(SELECT_CANDIDATE_SKILLS_AFTER, (candidate_id,)).fetchall()
+
+def insert_job(job_id: str, filename: str, content: bytes, content_hash: str, translate_to: str,
+               callback_url: Optional[str], created_at: float, max_queued: int) -> bool:
+    """Queue an analysis job; False (nothing inserted) if max_queued jobs are already queued"""
+    conn = get_connection()
+    # IMMEDIATE takes the write lock before counting, so concurrent submitters cannot both pass the limit
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        inserted = conn.execute(INSERT_JOB, (job_id, (filename or '')[:255], content, content_hash, translate_to,
+                                             callback_url, created_at, max_queued)).rowcount
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return inserted == 1
+
+def claim_job(worker: str, now: float, lease_seconds: float) -> Optional[tuple]:
+    """Lease the oldest queued job to a worker:
+    (id, filename, content, content_hash, translate_to, callback_url, created_at, attempts), or None"""
+    conn = get_connection()
+    # IMMEDIATE takes the write lock up front, so competing workers wait instead of failing to upgrade
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        row = conn.execute(CLAIM_JOB, (worker, now, now + lease_seconds)).fetchone()
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return row
+
+def release_jobs(now: float, max_attempts: int, worker: Optional[str] = None) -> List[tuple]:
+    """Requeue running jobs whose lease expired (or that belong to the given worker);
+    (id, status, callback_url) of each, status 'failed' for those out of attempts"""
+    conn = get_connection()
+    with conn:
+        return conn.execute(RELEASE_JOBS, (max_attempts, now, worker)).fetchall()
+
+def finish_job(job_id: str, worker: str, status: str, result: Optional[str], error: Optional[str],
+               finished_at: float) -> bool:
+    """Record a job's outcome; False if the worker no longer holds the job (its lease was released)"""
+    conn = get_connection()
+    with conn:
+        return conn.execute(FINISH_JOB, (status, result, error, finished_at, job_id, worker)).rowcount > 0
+
+def set_job_callback_status(job_id: str, callback_status: str):
+    conn = get_connection()
+    with conn:
+        conn.execute(SET_JOB_CALLBACK_STATUS, (callback_status, job_id))
+
+def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """A job's state and, once finished, its result JSON string or error"""
+    row = get_connection().execute(SELECT_JOB, (job_id,)).fetchone()
+    if row is None:
+        return None
+    columns = ('id', 'status', 'filename', 'translate_to', 'callback_url', 'callback_status', 'created_at',
+               'started_at', 'finished_at', 'attempts', 'result', 'error')
+    return dict(zip(columns, row))
+
+def count_jobs_ahead(job_id: str, created_at: float) -> int:
+    """Queued jobs that will be claimed before this one"""
+    return get_connection().execute(SELECT_JOBS_AHEAD, (created_at, job_id)).fetchone()[0]
+
+def get_job_queue_stats() -> Dict[str, tuple]:
+    """{status: (jobs, oldest created_at)} of the queued and running jobs"""
+    rows = get_connection().execute(SELECT_JOB_QUEUE_STATS).fetchall()
+    return {status: (count, oldest) for status, count, oldest in rows}
+
+def delete_finished_jobs(finished_before: float) -> int:
+    conn = get_connection()
+    with conn:
+        return conn.execute(DELETE_FINISHED_JOBS, (finished_before,)).rowcount
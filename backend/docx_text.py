@@ -0,0 +1,102 @@
+"""
+Streaming DOCX text extraction
+
+A DOCX file is a ZIP package; its text lives in a handful of WordprocessingML parts.
+Instead of building python-docx's object model for the whole package, this opens only
+those parts and walks them with ElementTree.iterparse, emitting each paragraph as soon
+as its closing tag is read and discarding the parsed elements. Embedded images and
+other media are never decompressed.
+
+Unlike python-docx's Document.paragraphs, the walk covers every paragraph in the part:
+table cells, text boxes and content controls as well as the body. Page headers come
+before the body and footers after it, matching where they appear on the page.
+"""
+import re
+import zipfile
+from typing import IO, Iterator, List, Optional, Union
+from xml.etree.ElementTree import ParseError, iterparse
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+BODY_PART = "word/document.xml"
+HEADER_PART = re.compile(r"word/header\d*\.xml$")
+FOOTER_PART = re.compile(r"word/footer\d*\.xml$")
+
+# Run content that contributes characters, as python-docx renders it in Paragraph.text
+RUN_TEXT = {
+    W + "tab": "\t",
+    W + "ptab": "\t",
+    W + "br": "\n",
+    W + "cr": "\n",
+    W + "noBreakHyphen": "-"
+}
+PARAGRAPH = W + "p"
+TEXT = W + "t"
+# Word writes text boxes twice: as DrawingML (mc:Choice) and as VML (mc:Fallback); read one
+FALLBACK = MC + "Fallback"
+
+def iter_part_paragraphs(part: IO[bytes]) -> Iterator[str]:
+    """Text of each paragraph of one WordprocessingML part, in document order"""
+    # A paragraph can contain another (a text box anchored in it): one buffer per open paragraph
+    open_paragraphs: List[List[str]] = []
+    fallback_depth = 0
+    for event, element in iterparse(part, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            if tag == PARAGRAPH:
+                open_paragraphs.append([])
+            elif tag == FALLBACK:
+                fallback_depth += 1
+            continue
+
+        if tag == FALLBACK:
+            fallback_depth -= 1
+        elif tag == PARAGRAPH:
+            text = "".join(open_paragraphs.pop())
+            if not fallback_depth:
+                yield text
+            if not open_paragraphs:
+                element.clear()  # Keep memory flat on long documents
+        elif open_paragraphs and not fallback_depth:
+            if tag == TEXT:
+                if element.text:
+                    open_paragraphs[-1].append(element.text)
+            elif tag in RUN_TEXT:
+                open_paragraphs[-1].append(RUN_TEXT[tag])
+
+def iter_docx_paragraphs(source: Union[str, IO[bytes]]) -> Iterator[str]:
+    """Paragraph texts of a DOCX file (path or seekable binary file): headers, body, footers"""
+    try:
+        with zipfile.ZipFile(source) as package:
+            names = package.namelist()
+            if BODY_PART not in names:
+                raise ValueError("Not a DOCX document")
+            headers = sorted(name for name in names if HEADER_PART.match(name))
+            footers = sorted(name for name in names if FOOTER_PART.match(name))
+            # Sections often repeat the same header (first page, even pages, default): emit each once
+            seen_margins = set()
+            for name in headers + [BODY_PART] + footers:
+                with package.open(name) as part:
+                    if name == BODY_PART:
+                        yield from iter_part_paragraphs(part)
+                        continue
+                    paragraphs = tuple(iter_part_paragraphs(part))
+                if paragraphs not in seen_margins:
+                    seen_margins.add(paragraphs)
+                    yield from paragraphs
+    except (zipfile.BadZipFile, ParseError, EOFError) as e:
+        raise ValueError("Unreadable DOCX") from e
+
+def extract_docx_text(source: Union[str, IO[bytes]], max_chars: Optional[int] = None) -> str:
+    """Non-blank paragraphs, one per line; stops reading once max_chars have been collected"""
+    lines = []
+    length = 0
+    for text in iter_docx_paragraphs(source):
+        if not text.strip():
+            continue
+        lines.append(text)
+        length += len(text) + 1
+        if max_chars is not None and length >= max_chars:
+            break
+    return "\n".join(lines) + "\n" if lines else ""
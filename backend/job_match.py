@@ -0,0 +1,167 @@
+"""
+Job description features and resume-versus-many-job-descriptions scoring
+
+A job description is reduced once to the features matching needs: the canonical skills
+the skill matcher finds in it and its normalized keyword set (Unicode NFKC, casefolded,
+punctuation-aware tokens, stopwords dropped). JobDescriptionCache keeps those features in
+an LRU keyed by the SHA-256 of the text, so an open requisition scored against every new
+applicant is tokenized and matched only the first time.
+
+Scoring one resume against many job descriptions is then a single resume extraction
+plus one gather over the concatenated skill columns of all job descriptions (how many of
+each one's required skills the resume has) and a set intersection per job description.
+
+NumPy is imported where it is used, so importing this module (ats_analyser does) keeps
+it out of API startup.
+"""
+import hashlib
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Sequence
+
+from ai_hr_analyser import skill_matcher
+from analysis_cache import LRUCache
+
+JD_CACHE_MAX_BYTES = int(float(os.environ.get("JD_CACHE_MAX_MB", 16)) * 1024 * 1024)
+JD_CACHE_TTL = float(os.environ.get("JD_CACHE_TTL", 24 * 3600))
+MAX_JOB_DESCRIPTION_CHARS = 20000
+# Job descriptions per /api/ats-match request (each is one form field; Starlette parses at most 1000)
+MAX_JOB_DESCRIPTIONS = min(int(os.environ.get("ATS_MATCH_MAX_JOBS", 500)), 999)
+MIN_KEYWORD_CHARS = 4  # Same "longer than three characters" rule as the original word overlap
+# A job description's score: required skills weigh more than general keyword overlap
+SKILL_WEIGHT = 0.7
+KEYWORD_WEIGHT = 0.3
+MAX_LISTED_SKILLS = 15
+
+# Words a job description is full of that say nothing about the role
+STOPWORDS = {
+    "about", "also", "able", "been", "being", "both", "each", "from", "have", "into", "more", "most", "must",
+    "other", "over", "should", "such", "than", "that", "their", "them", "then", "there", "these", "they",
+    "this", "those", "through", "very", "were", "what", "when", "where", "which", "while", "will", "with",
+    "within", "would", "your", "you'll", "we're", "plus", "well", "including", "across", "looking",
+    "join", "role", "team", "work", "working", "years", "year", "strong", "good", "great", "ideal",
+    "candidate", "responsibilities", "requirements", "experience", "knowledge", "skills", "ability",
+    "nice", "preferred", "required", "wanted"
+}
+
+# Words keep inner "." "/" "-" "'" ("node.js", "ci/cd", "e-commerce") and trailing "+" "#" ("c++", "c#")
+_TOKEN = re.compile(r"\w+(?:[./'\-]\w+)*[+#]*")
+
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFKC", text).casefold()
+
+def keywords(text: str) -> FrozenSet[str]:
+    """Normalized keyword set of a text (the resume side uses the same tokenizer)"""
+    return frozenset(
+        token for token in _TOKEN.findall(normalize_text(text))
+        if len(token) >= MIN_KEYWORD_CHARS and token not in STOPWORDS and not token.isdigit()
+    )
+
+@lru_cache(maxsize=None)
+def skill_columns() -> Dict[str, int]:
+    """Lowercase canonical skill key -> column of the skill vectors (skill-database order)"""
+    columns: Dict[str, int] = {}
+    for skill in skill_matcher().skills:
+        columns.setdefault(skill.lower(), len(columns))
+    return columns
+
+@lru_cache(maxsize=None)
+def column_skills() -> List[str]:
+    """Skill name of each column"""
+    names: Dict[int, str] = {}
+    for skill in skill_matcher().skills:
+        names.setdefault(skill_columns()[skill.lower()], skill)
+    return [names[column] for column in range(len(names))]
+
+def _columns_of(skill_keys) -> "np.ndarray":
+    import numpy as np
+    columns = skill_columns()
+    return np.array(sorted(columns[key] for key in skill_keys if key in columns), dtype=np.intp)
+
+class JobDescription:
+    """Features of one job description, computed once and cached by content hash"""
+    __slots__ = ("key", "skills", "columns", "keywords")
+
+    def __init__(self, text: str, key: Optional[str] = None):
+        self.key = key or job_description_key(text)
+        self.columns = _columns_of(skill_matcher().match_keys(text))
+        self.skills: List[str] = [column_skills()[column] for column in self.columns]
+        self.keywords = keywords(text)
+
+    def size(self) -> int:
+        """Approximate footprint in bytes, for the cache budget"""
+        return (200 + self.columns.nbytes + sum(len(skill) + 60 for skill in self.skills)
+                + sum(len(word) + 60 for word in self.keywords))
+
+def job_description_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class ResumeMatchProfile:
+    """The resume side of matching: skill vector and keyword set, from one pass each"""
+
+    def __init__(self, text: str):
+        import numpy as np
+        columns = _columns_of(skill_matcher().match_keys(text))
+        self.skills: List[str] = [column_skills()[column] for column in columns]
+        self.vector = np.zeros(len(skill_columns()), dtype=bool)
+        self.vector[columns] = True
+        self.keywords = keywords(text)
+
+def score_job_descriptions(resume: ResumeMatchProfile, jobs: Sequence[JobDescription]) -> List[Dict]:
+    """Skill, keyword and combined match (0-100) of the resume against each job description"""
+    if not jobs:
+        return []
+    import numpy as np
+    # Every job's required skill columns back to back: one gather answers all of them
+    lengths = np.array([len(job.columns) for job in jobs], dtype=np.intp)
+    hits = resume.vector[np.concatenate([job.columns for job in jobs])]
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    matched_counts = np.concatenate(([0], np.cumsum(hits)))[offsets]
+    matched_counts = (matched_counts[1:] - matched_counts[:-1]).tolist()
+    hits, offsets = hits.tolist(), offsets.tolist()
+
+    results = []
+    for index, job in enumerate(jobs):
+        job_hits = hits[offsets[index]:offsets[index + 1]]
+        keyword_match = (
+            min(100, int(len(resume.keywords & job.keywords) / len(job.keywords) * 100)) if job.keywords else 0
+        )
+        if job_hits:
+            skill_match = int(matched_counts[index] / len(job_hits) * 100)
+            score = int(round(skill_match * SKILL_WEIGHT + keyword_match * KEYWORD_WEIGHT))
+        else:
+            skill_match = None  # The job description names no known skill: keywords decide
+            score = keyword_match
+        results.append({
+            "score": score,
+            "skill_match": skill_match,
+            "keyword_match": keyword_match,
+            "matched_skills": [skill for skill, hit in zip(job.skills, job_hits) if hit][:MAX_LISTED_SKILLS],
+            "missing_skills": [skill for skill, hit in zip(job.skills, job_hits) if not hit][:MAX_LISTED_SKILLS]
+        })
+    return results
+
+class JobDescriptionCache:
+    """LRU of job description features keyed by the SHA-256 of the text (thread-safe)"""
+
+    def __init__(self, max_bytes: int = JD_CACHE_MAX_BYTES, ttl_seconds: float = JD_CACHE_TTL):
+        self._cache = LRUCache(max_bytes, ttl_seconds)
+
+    def get(self, text: str) -> JobDescription:
+        key = job_description_key(text)
+        job = self._cache.get(key)
+        if job is None:
+            job = JobDescription(text, key)
+            self._cache.set(key, job, size=job.size())
+        return job
+
+    def get_many(self, texts: Sequence[str]) -> List[JobDescription]:
+        return [self.get(text) for text in texts]
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> Dict:
+        return self._cache.stats()
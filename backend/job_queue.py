@@ -0,0 +1,479 @@
+"""
+Durable SQLite job queue for resume analysis, and the worker processes that drain it
+
+POST /api/jobs stores the upload as a row of the analysis_jobs table and answers with
+the job id at once; GET /api/jobs/{id} reads the row back. Job workers are separate
+processes (started by the API process, or on their own with `python job_queue.py`) that claim the oldest queued job with one UPDATE ... RETURNING
+under SQLite's write lock, so every job goes to exactly one worker whichever process
+submitted it, and queued jobs survive a restart.
+
+A claim is a lease. A worker that crashes or is killed mid-analysis leaves a running job
+whose lease expires, and a later sweep queues it again (or fails it after
+JOB_MAX_ATTEMPTS, so a resume that kills its worker cannot loop forever). JobWorkers
+also releases a dead worker's jobs right away and starts a replacement.
+
+When a job finishes, the worker POSTs {job_id, status, result | error} to the job's
+callback URL, if it has one, signed with HMAC-SHA256 when JOB_CALLBACK_SECRET is set.
+Unless the host is listed in JOB_CALLBACK_HOSTS, callbacks only go to public addresses:
+the URL's host is resolved when the job is submitted, and the address the worker
+actually connects to is checked again, so DNS changes in between cannot redirect a
+callback to loopback, private, link-local or cloud metadata addresses.
+"""
+import hashlib
+import hmac
+import http.client
+import ipaddress
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from metrics import StageTimer, metrics
+from response_builder import dumps
+
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", 1))
+JOB_QUEUE_MAX = int(os.environ.get("JOB_QUEUE_MAX", 1000))
+JOB_POLL_SECONDS = float(os.environ.get("JOB_POLL_SECONDS", 1.0))
+JOB_LEASE_SECONDS = float(os.environ.get("JOB_LEASE_SECONDS", 300))
+JOB_MAX_ATTEMPTS = int(os.environ.get("JOB_MAX_ATTEMPTS", 3))
+JOB_RETENTION_SECONDS = float(os.environ.get("JOB_RETENTION_HOURS", 7 * 24)) * 3600
+JOB_SHUTDOWN_SECONDS = float(os.environ.get("JOB_SHUTDOWN_SECONDS", 30))
+JOB_CALLBACK_SECRET = os.environ.get("JOB_CALLBACK_SECRET", "")
+# Hosts callbacks may be sent to even if they resolve to private addresses (empty: public hosts only)
+JOB_CALLBACK_HOSTS = {host.strip().lower() for host in os.environ.get("JOB_CALLBACK_HOSTS", "").split(",") if host.strip()}
+JOB_CALLBACK_TIMEOUT = float(os.environ.get("JOB_CALLBACK_TIMEOUT", 10))
+JOB_CALLBACK_RETRIES = int(os.environ.get("JOB_CALLBACK_RETRIES", 3))
+MAX_CALLBACK_URL_CHARS = 2000
+# Housekeeping done by idle workers: expired leases, then finished jobs past their retention
+RELEASE_INTERVAL = 10.0
+PURGE_INTERVAL = 300.0
+
+class JobQueueFull(RuntimeError):
+    """Raised when JOB_QUEUE_MAX jobs are already waiting"""
+
+def worker_name(pid: int) -> str:
+    return f"{socket.gethostname()}:{pid}"
+
+class CallbackAddressError(OSError):
+    """The callback host resolved to an address callbacks may not be sent to"""
+
+def is_public_address(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])  # Drop an IPv6 zone index
+    if ip.version == 6 and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    # is_global excludes loopback, RFC 1918, link-local (169.254.169.254 metadata), CGNAT and reserved ranges
+    return ip.is_global and not ip.is_multicast
+
+def check_callback_url(url: str) -> str:
+    """The callback URL if it is an absolute http(s) URL to an allowed host; ValueError otherwise
+
+    Resolves the host (blocking): outside JOB_CALLBACK_HOSTS, every address must be public.
+    """
+    if len(url) > MAX_CALLBACK_URL_CHARS:
+        raise ValueError(f"callback_url too long. Maximum {MAX_CALLBACK_URL_CHARS} characters")
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+    except ValueError:
+        raise ValueError("Invalid callback_url")
+    if parts.scheme not in ("http", "https") or not host:
+        raise ValueError("callback_url must be an absolute http or https URL")
+    if host in JOB_CALLBACK_HOSTS:
+        return url
+    if JOB_CALLBACK_HOSTS:
+        raise ValueError(f"callback_url host not allowed: {host}")
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)}
+    except (socket.gaierror, UnicodeError):
+        raise ValueError(f"callback_url host cannot be resolved: {host}")
+    if not all(is_public_address(address) for address in addresses):
+        raise ValueError(f"callback_url host not allowed: {host} resolves to a non-public address")
+    return url
+
+def callback_signature(body: bytes, secret: str) -> str:
+    """Value of the X-Signature-256 header: HMAC-SHA256 of the exact body bytes"""
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+def _checked_connection(address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_address=None, **kwargs):
+    """socket.create_connection that refuses a non-public peer, checked after DNS resolution"""
+    sock = socket.create_connection(address, timeout, source_address, **kwargs)
+    peer = sock.getpeername()[0]
+    if not is_public_address(peer):
+        sock.close()
+        raise CallbackAddressError(f"callback address not allowed: {peer}")
+    return sock
+
+class _CheckedHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = _checked_connection
+
+class _CheckedHTTPSConnection(http.client.HTTPSConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = _checked_connection  # Used by connect() before the TLS handshake
+
+class _CheckedHTTPHandler(urllib.request.HTTPHandler):
+    def http_open(self, req):
+        return self.do_open(_CheckedHTTPConnection, req)
+
+class _CheckedHTTPSHandler(urllib.request.HTTPSHandler):
+    def https_open(self, req):
+        return self.do_open(_CheckedHTTPSConnection, req, context=self._context)
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    # A redirect could lead past the host checks: report it as a failed delivery instead
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+# No proxies: the address checked must be the callback receiver's own
+_callback_opener = urllib.request.build_opener(urllib.request.ProxyHandler({}), _NoRedirect)
+_checked_callback_opener = urllib.request.build_opener(
+    urllib.request.ProxyHandler({}), _NoRedirect, _CheckedHTTPHandler, _CheckedHTTPSHandler
+)
+
+def deliver_callback(url: str, payload: Dict[str, Any], secret: str = JOB_CALLBACK_SECRET,
+                     retries: int = JOB_CALLBACK_RETRIES, timeout: float = JOB_CALLBACK_TIMEOUT) -> str:
+    """POST the payload as JSON, retrying with backoff; the delivery status recorded on the job"""
+    body = dumps(payload)
+    headers = {"Content-Type": "application/json", "User-Agent": "resume-analyser-jobs"}
+    if secret:
+        headers["X-Signature-256"] = callback_signature(body, secret)
+    # Hosts in JOB_CALLBACK_HOSTS are trusted; any other must connect to a public address
+    trusted = (urlsplit(url).hostname or "").lower() in JOB_CALLBACK_HOSTS
+    opener = _callback_opener if trusted else _checked_callback_opener
+    outcome = "failed"
+    for attempt in range(retries + 1):
+        try:
+            request = urllib.request.Request(url, data=body, headers=headers, method="POST")
+            with opener.open(request, timeout=timeout) as response:
+                return f"delivered ({response.status})"
+        except urllib.error.HTTPError as e:
+            outcome = f"failed (HTTP {e.code})"
+            if 300 <= e.code < 500 and e.code not in (408, 429):
+                break  # Redirects and client errors will not change on a retry
+        except (urllib.error.URLError, OSError) as e:
+            reason = getattr(e, "reason", e)
+            outcome = f"failed ({reason})"
+            if isinstance(reason, CallbackAddressError):
+                break
+        if attempt < retries:
+            time.sleep(0.5 * 2 ** attempt)
+    return outcome
+
+class JobQueue:
+    """The analysis_jobs table as a queue: submit, claim, finish and look up jobs"""
+
+    def __init__(self, max_queued: int = JOB_QUEUE_MAX, lease_seconds: float = JOB_LEASE_SECONDS,
+                 max_attempts: int = JOB_MAX_ATTEMPTS, retention_seconds: float = JOB_RETENTION_SECONDS):
+        self.max_queued = max(max_queued, 1)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(max_attempts, 1)
+        self.retention_seconds = retention_seconds
+        self._db_ready = False
+
+    def _ensure_db(self):
+        if not self._db_ready:
+            from database.models import init_db
+            init_db()
+            self._db_ready = True
+
+    def submit(self, filename: str, content: bytes, content_hash: str, translate_to: Optional[str] = None,
+               callback_url: Optional[str] = None) -> Tuple[str, float]:
+        """Queue an upload for analysis: (job id, created_at)"""
+        from database.models import insert_job
+        self._ensure_db()
+        job_id, created_at = uuid.uuid4().hex, time.time()
+        if not insert_job(job_id, filename, content, content_hash, translate_to or "", callback_url, created_at,
+                          self.max_queued):
+            raise JobQueueFull("Analysis job queue is full")
+        return job_id, created_at
+
+    def claim(self, worker: str) -> Optional[Dict[str, Any]]:
+        """Lease the oldest queued job to the worker"""
+        from database.models import claim_job
+        self._ensure_db()
+        row = claim_job(worker, time.time(), self.lease_seconds)
+        if row is None:
+            return None
+        columns = ("id", "filename", "content", "content_hash", "translate_to", "callback_url", "created_at", "attempts")
+        return dict(zip(columns, row))
+
+    def finish(self, job_id: str, worker: str, result: Optional[dict] = None, error: Optional[str] = None) -> bool:
+        """Store the response (done) or error (failed); False if the worker's lease was released meanwhile"""
+        from database.models import finish_job
+        status = "failed" if error is not None else "done"
+        result_json = dumps(result).decode("utf-8") if result is not None else None
+        return finish_job(job_id, worker, status, result_json, error, time.time())
+
+    def release(self, worker: Optional[str] = None) -> List[tuple]:
+        """Requeue (or fail) jobs with an expired lease, and every running job of the worker if given"""
+        from database.models import release_jobs
+        self._ensure_db()
+        return release_jobs(time.time(), self.max_attempts, worker)
+
+    def set_callback_status(self, job_id: str, callback_status: str):
+        from database.models import set_job_callback_status
+        set_job_callback_status(job_id, callback_status)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """A job's state, with queue_position while it is queued"""
+        from database.models import count_jobs_ahead, get_job
+        self._ensure_db()
+        job = get_job(job_id)
+        if job is not None and job["status"] == "queued":
+            job["queue_position"] = count_jobs_ahead(job_id, job["created_at"]) + 1
+        return job
+
+    def depth(self) -> Dict[str, float]:
+        """Queued and running jobs, and how long the oldest queued job has been waiting"""
+        from database.models import get_job_queue_stats
+        self._ensure_db()
+        stats = get_job_queue_stats()
+        queued, oldest = stats.get("queued", (0, None))
+        return {
+            "queued": queued,
+            "running": stats.get("running", (0, None))[0],
+            "oldest_queued_seconds": max(time.time() - oldest, 0.0) if oldest is not None else 0.0
+        }
+
+    def purge(self) -> int:
+        """Delete finished jobs older than the retention period"""
+        from database.models import delete_finished_jobs
+        self._ensure_db()
+        return delete_finished_jobs(time.time() - self.retention_seconds)
+
+    def record_metrics(self):
+        """Set the queue gauges from the database, so they cover workers of every process"""
+        depth = self.depth()
+        metrics.set("job_queue_depth", depth["queued"], status="queued")
+        metrics.set("job_queue_depth", depth["running"], status="running")
+        metrics.set("job_oldest_queued_seconds", depth["oldest_queued_seconds"])
+
+def run_job(job_queue: JobQueue, job: Dict[str, Any], worker: str, handler: Callable[..., dict], events,
+            callbacks: "queue.Queue"):
+    """Analyse one claimed job and record its outcome"""
+    started = time.time()
+    events.put(("claimed", started - job["created_at"]))
+    result = error = None
+    try:
+        outcome = handler(job["content"], job["filename"], job["translate_to"] or None, job["content_hash"])
+        result, timings, fallbacks = outcome["response"], outcome["timings"], outcome["fallbacks"]
+    except Exception as e:
+        # ResumeAnalysisError carries a client-facing detail; anything else stays generic
+        error = getattr(e, "detail", None) or "Error processing file: Unable to analyse resume"
+        timings, fallbacks = getattr(e, "timings", None) or {}, []
+    if not job_queue.finish(job["id"], worker, result, error):
+        return  # Lease expired mid-analysis: the job was requeued and belongs to another claim now
+    status = "failed" if error is not None else "done"
+    events.put(("finished", status, time.time() - started, timings, fallbacks))
+    if job["callback_url"]:
+        payload = {"job_id": job["id"], "status": status}
+        payload.update({"error": error} if error is not None else {"result": result})
+        callbacks.put((job["id"], job["callback_url"], payload))
+
+def failed_callbacks(released: List[tuple]) -> List[tuple]:
+    """(job id, url, payload) of the callbacks owed for released jobs that ran out of attempts"""
+    error = "Analysis worker stopped while analysing this resume"
+    return [
+        (job_id, callback_url, {"job_id": job_id, "status": status, "error": error})
+        for job_id, status, callback_url in released if status == "failed" and callback_url
+    ]
+
+def run_callbacks(job_queue: JobQueue, callbacks: "queue.Queue"):
+    """Deliver queued callbacks one by one, so a slow receiver never holds up analysis"""
+    while True:
+        item = callbacks.get()
+        if item is None:
+            return
+        job_id, url, payload = item
+        try:
+            job_queue.set_callback_status(job_id, deliver_callback(url, payload))
+        except Exception:
+            pass  # A callback is best effort; the result is already stored for polling
+
+def worker_main(job_queue: JobQueue, handler: Callable[..., dict], initializer: Optional[Callable[[], None]],
+                database_path: str, stopping, wakeup, events, poll_seconds: float = JOB_POLL_SECONDS):
+    """Body of a job worker process: claim and analyse jobs until stopping is set"""
+    # Ctrl+C reaches the whole process group; the parent decides when its workers stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # A fresh process: the parent's database path is passed in rather than inherited
+    import database.models
+    database.models.DATABASE_PATH = database_path
+    if initializer is not None:
+        initializer()
+    worker = worker_name(os.getpid())
+    callbacks: queue.Queue = queue.Queue()
+    callback_thread = threading.Thread(target=run_callbacks, args=(job_queue, callbacks), daemon=True)
+    callback_thread.start()
+    last_release = last_purge = 0.0
+
+    while not stopping.is_set():
+        now = time.monotonic()
+        try:
+            if now - last_release >= RELEASE_INTERVAL:
+                last_release = now
+                released = job_queue.release()
+                for _, status, _ in released:
+                    events.put(("released", status))
+                for callback in failed_callbacks(released):
+                    callbacks.put(callback)
+
+            job = job_queue.claim(worker)
+            if job is not None:
+                run_job(job_queue, job, worker, handler, events, callbacks)
+                continue
+
+            if now - last_purge >= PURGE_INTERVAL:
+                last_purge = now
+                job_queue.purge()
+        except sqlite3.Error:
+            pass  # Database busy or unavailable: try again after the poll interval
+        # Woken early by a submission from this API process; polling covers any other submitter
+        wakeup.wait(poll_seconds)
+        wakeup.clear()
+
+    callbacks.put(None)
+    callback_thread.join(JOB_CALLBACK_TIMEOUT)
+
+def record_job_event(event: tuple):
+    """Fold a worker's job event into this process's metrics"""
+    kind = event[0]
+    if kind == "claimed":
+        metrics.observe("job_wait_seconds", event[1])
+    elif kind == "finished":
+        _, status, seconds, timings, fallbacks = event
+        metrics.inc("jobs_total", event=status)
+        metrics.observe("job_duration_seconds", seconds)
+        timer = StageTimer()
+        timer.merge(timings, fallbacks)
+        metrics.record_stages(timer)
+    elif kind == "released":
+        metrics.inc("jobs_total", event="requeued" if event[1] == "queued" else event[1])
+
+class JobWorkers:
+    """The local job worker processes: started, watched (a dead one is replaced) and stopped"""
+
+    def __init__(self, job_queue: JobQueue, handler: Callable[..., dict],
+                 initializer: Optional[Callable[[], None]] = None, workers: Optional[int] = None):
+        self.job_queue = job_queue
+        self.handler = handler          # handler(content, filename, translate_to, content_hash) -> stages dict
+        self.initializer = initializer
+        self.workers = max(JOB_WORKERS if workers is None else workers, 0)
+        # Workers are also replaced from the supervisor thread, while the API process runs other
+        # threads whose locks a fork would copy mid-use; a forkserver child starts clean instead
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self._context = multiprocessing.get_context(start_method)
+        self._processes: List[Any] = []
+        self._stopping = self._wakeup = self._events = None
+        self._closed = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+    def start(self):
+        """Spawn the worker processes (no-op when workers == 0: jobs wait for standalone workers)"""
+        if self.workers == 0 or self._processes:
+            return
+        self._stopping, self._wakeup, self._events = self._context.Event(), self._context.Event(), self._context.Queue()
+        self._closed.clear()
+        self._processes = [self._spawn() for _ in range(self.workers)]
+        self._monitor = threading.Thread(target=self._supervise, name="job-workers", daemon=True)
+        self._monitor.start()
+
+    def _spawn(self):
+        from database.models import DATABASE_PATH
+        process = self._context.Process(
+            target=worker_main, name="job-worker", daemon=True,
+            args=(self.job_queue, self.handler, self.initializer, DATABASE_PATH, self._stopping, self._wakeup, self._events)
+        )
+        process.start()
+        return process
+
+    def _supervise(self):
+        # Events arrive from every worker on one queue (read until the workers are gone, so
+        # none blocks on a full pipe while exiting); between them, replace any dead worker
+        while not self._closed.is_set():
+            try:
+                record_job_event(self._events.get(timeout=0.5))
+            except queue.Empty:
+                pass
+            if self._stopping.is_set():
+                continue
+            for index, process in enumerate(self._processes):
+                if not process.is_alive():
+                    process.join()
+                    self._release(process)
+                    self._processes[index] = self._spawn()
+
+    def _release(self, process):
+        """Queue a dead worker's job again now rather than when its lease expires"""
+        try:
+            released = self.job_queue.release(worker_name(process.pid))
+        except Exception:
+            return  # The lease expires instead
+        for _, status, _ in released:
+            record_job_event(("released", status))
+        owed = failed_callbacks(released)
+        if owed:
+            callbacks: queue.Queue = queue.Queue()
+            for callback in owed + [None]:
+                callbacks.put(callback)
+            threading.Thread(target=run_callbacks, args=(self.job_queue, callbacks), daemon=True).start()
+
+    def notify(self):
+        """Wake an idle worker: a job was just submitted"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def alive(self) -> int:
+        return sum(process.is_alive() for process in self._processes)
+
+    def stop(self, timeout: float = JOB_SHUTDOWN_SECONDS):
+        """Let the workers finish their current job (up to timeout), then stop them"""
+        if not self._processes:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(max(deadline - time.monotonic(), 0))
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+                process.join()
+                self._release(process)
+        self._closed.set()
+        self._monitor.join()
+        while True:
+            try:
+                record_job_event(self._events.get_nowait())
+            except queue.Empty:
+                break
+        self._processes = []
+
+    def run(self):
+        """Run the workers in the foreground until SIGINT or SIGTERM"""
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop.set())
+        self.start()
+        while not stop.wait(1.0):
+            pass
+        self.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"workers": self.workers, "alive": self.alive()}
+
+if __name__ == "__main__":
+    # Standalone workers for the queue of API processes started with JOB_WORKERS=0
+    from main import analyse_job, job_queue, warm_analysers
+    JobWorkers(job_queue, analyse_job, warm_analysers, max(JOB_WORKERS, 1)).run()
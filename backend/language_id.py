@@ -0,0 +1,217 @@
+"""
+Deterministic language identification on a bounded sample of the text
+
+Only a few evenly spaced windows of whole lines are read (at most SAMPLE_CHARS), so the
+cost does not grow with the length of the resume. Scripts that identify a language on
+their own (Hangul, kana, Han, Arabic, Greek, Thai, Devanagari, Hebrew) are answered from
+character counts. Latin and Cyrillic samples are scored against langdetect's character
+1-3 gram profiles, loaded once per process into one log-probability matrix, so a
+detection is a dictionary count plus one small matrix product and always gives the same
+answer for the same text. Results are cached by the hash of the sample.
+"""
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import threading
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, List, Optional
+
+from analysis_cache import LRUCache
+
+SAMPLE_CHARS = 2048   # Upper bound on characters read from any text
+SAMPLE_WINDOWS = 8    # Evenly spaced windows the sample is taken from
+MIN_LETTERS = 8       # Fewer letters than this cannot be identified
+SCRIPT_SHARE = 0.3    # Share of (weighted) letters a script needs to decide the language
+
+# Profiles scored for each script that several languages share
+PROFILE_GROUPS = {
+    'latin': ['af', 'ca', 'cs', 'cy', 'da', 'de', 'en', 'es', 'et', 'fi', 'fr', 'hr', 'hu', 'id',
+              'it', 'lt', 'lv', 'nl', 'no', 'pl', 'pt', 'ro', 'sk', 'sl', 'so', 'sq', 'sv', 'sw',
+              'tl', 'tr', 'vi'],
+    'cyrillic': ['bg', 'mk', 'ru', 'uk']
+}
+
+# Same smoothing langdetect applies to languages that never saw an n-gram
+_ALPHA = 0.5 / 10000
+
+# Code point ranges of scripts that decide the language (or the profile group) directly
+_SCRIPT_RANGES = sorted([
+    (0x0370, 0x03FF, 'el'), (0x0400, 0x04FF, 'cyrillic'), (0x0590, 0x05FF, 'he'),
+    (0x0600, 0x06FF, 'ar'), (0x0750, 0x077F, 'ar'), (0x0900, 0x097F, 'hi'), (0x0E00, 0x0E7F, 'th'),
+    (0x1100, 0x11FF, 'ko'), (0x1F00, 0x1FFF, 'el'), (0x3040, 0x30FF, 'kana'), (0x3130, 0x318F, 'ko'),
+    (0x31F0, 0x31FF, 'kana'), (0x3400, 0x4DBF, 'han'), (0x4E00, 0x9FFF, 'han'), (0xAC00, 0xD7AF, 'ko'),
+    (0xF900, 0xFAFF, 'han'), (0xFB50, 0xFDFF, 'ar'), (0xFE70, 0xFEFF, 'ar')
+])
+_RANGE_STARTS = [start for start, _, _ in _SCRIPT_RANGES]
+
+# A CJK character carries roughly a word's worth of text, so it outweighs a Latin letter
+_WIDE_SCRIPTS = {'ko', 'kana', 'han'}
+_WIDE_WEIGHT = 3
+
+# Letter runs, the unit langdetect builds its n-grams from
+_WORD = re.compile(r'[^\W\d_]+')
+
+def _profile_directory() -> Optional[str]:
+    # Locate langdetect's bundled profiles without importing the package
+    spec = importlib.util.find_spec('langdetect')
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return os.path.join(list(spec.submodule_search_locations)[0], 'profiles')
+
+class NgramModel:
+    """Log-probabilities of every known n-gram (rows) under each language (columns)"""
+
+    def __init__(self, languages: List[str], directory: Optional[str]):
+        import numpy as np
+
+        self.languages: List[str] = []
+        profiles = []
+        for language in languages:
+            path = os.path.join(directory, language) if directory else None
+            if path and os.path.exists(path):
+                with open(path, encoding='utf-8') as profile_file:
+                    profiles.append(json.load(profile_file))
+                self.languages.append(language)
+
+        self.gram_ids: Dict[str, int] = {}
+        for profile in profiles:
+            for gram in profile['freq']:
+                self.gram_ids.setdefault(gram, len(self.gram_ids))
+
+        probabilities = np.zeros((len(self.gram_ids), len(self.languages)), dtype=np.float64)
+        for column, profile in enumerate(profiles):
+            n_words = profile['n_words']
+            for gram, count in profile['freq'].items():
+                probabilities[self.gram_ids[gram], column] = count / n_words[len(gram) - 1]
+        self.log_probabilities = np.log(probabilities + _ALPHA)
+
+    def score(self, grams: Counter) -> Optional[str]:
+        """Most likely language for the n-gram counts, or None if none of them is known"""
+        rows, counts = [], []
+        for gram, count in grams.items():
+            row = self.gram_ids.get(gram)
+            if row is not None:
+                rows.append(row)
+                counts.append(count)
+        if not rows or not self.languages:
+            return None
+        import numpy as np
+        totals = np.asarray(counts, dtype=np.float64) @ self.log_probabilities[rows]
+        # argmax returns the first maximum, so ties resolve by profile order
+        return self.languages[int(np.argmax(totals))]
+
+def sample_text(text: str) -> str:
+    """Up to SAMPLE_CHARS characters of whole lines from evenly spaced parts of the text"""
+    if len(text) <= SAMPLE_CHARS:
+        return text
+    window = SAMPLE_CHARS // SAMPLE_WINDOWS
+    parts = []
+    for index in range(SAMPLE_WINDOWS):
+        start = index * len(text) // SAMPLE_WINDOWS
+        if index:
+            # Start on a line boundary; a window inside one huge line starts where it lands
+            newline = text.find('\n', start, start + window)
+            start = newline + 1 if newline >= 0 else start
+        chunk = text[start:start + window]
+        end = chunk.rfind('\n')
+        parts.append(chunk[:end] if end > 0 else chunk)
+    return '\n'.join(parts)
+
+def text_ngrams(text: str) -> Counter:
+    """Character 1-3 grams of each word padded with spaces, skipping all-caps words like langdetect"""
+    grams: Counter = Counter()
+    for word, count in Counter(_WORD.findall(text)).items():
+        if len(word) > 1 and word.isupper():
+            continue
+        padded = ' ' + word + ' '
+        for char in word:
+            grams[char] += count
+        for start in range(len(padded) - 1):
+            grams[padded[start:start + 2]] += count
+            if start < len(padded) - 2:
+                grams[padded[start:start + 3]] += count
+    return grams
+
+class LanguageIdentifier:
+    def __init__(self, profile_directory: Optional[str] = None, cache_bytes: int = 1024 * 1024):
+        self.profile_directory = profile_directory or _profile_directory()
+        self.detections = 0
+        self._models: Dict[str, NgramModel] = {}
+        self._lock = threading.Lock()
+        self._cache = LRUCache(max_bytes=cache_bytes, ttl_seconds=float('inf'))
+
+    def load(self):
+        """Load every n-gram profile now (e.g. before forking workers) instead of on first use"""
+        for group in PROFILE_GROUPS:
+            self._model(group)
+
+    def _model(self, group: str) -> NgramModel:
+        model = self._models.get(group)
+        if model is None:
+            with self._lock:
+                model = self._models.get(group)
+                if model is None:
+                    model = NgramModel(PROFILE_GROUPS[group], self.profile_directory)
+                    self._models[group] = model
+        return model
+
+    def detect(self, text: str, default: str = 'en') -> str:
+        """ISO 639-1 code of the text's language, or default if it cannot be told"""
+        sample = sample_text(text or '')
+        key = (hashlib.blake2b(sample.encode('utf-8', 'surrogatepass'), digest_size=16).digest(), default)
+        language = self._cache.get(key)
+        if language is None:
+            language = self._identify(sample) or default
+            self._cache.set(key, language, size=64)
+            self.detections += 1
+        return language
+
+    def _identify(self, sample: str) -> Optional[str]:
+        # Classify distinct characters only; resumes use a few hundred at most
+        letters = 0
+        counts = dict.fromkeys(('ko', 'kana', 'han', 'ar', 'el', 'th', 'hi', 'he', 'cyrillic'), 0)
+        for char, count in Counter(sample).items():
+            if not char.isalpha():
+                continue
+            letters += count
+            index = bisect_right(_RANGE_STARTS, ord(char)) - 1
+            if index >= 0 and ord(char) <= _SCRIPT_RANGES[index][1]:
+                counts[_SCRIPT_RANGES[index][2]] += count
+        if letters < MIN_LETTERS:
+            return None
+
+        wide = sum(counts[script] for script in _WIDE_SCRIPTS)
+        weighted_letters = letters + wide * (_WIDE_WEIGHT - 1)
+        share = lambda count: count / weighted_letters
+
+        # Kana only occurs in Japanese, which also uses Han characters
+        if counts['kana'] and share((counts['kana'] + counts['han']) * _WIDE_WEIGHT) >= SCRIPT_SHARE:
+            return 'ja'
+        if share(counts['ko'] * _WIDE_WEIGHT) >= SCRIPT_SHARE:
+            return 'ko'
+        if share(counts['han'] * _WIDE_WEIGHT) >= SCRIPT_SHARE:
+            return 'zh'
+        for script in ('ar', 'el', 'th', 'hi', 'he'):
+            if share(counts[script]) >= SCRIPT_SHARE:
+                return script
+
+        group = 'cyrillic' if share(counts['cyrillic']) >= SCRIPT_SHARE else 'latin'
+        return self._model(group).score(text_ngrams(sample))
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "loaded_groups": sorted(self._models),
+            "detections": self.detections,
+            "cache_hits": self._cache.hits,
+            "cache_misses": self._cache.misses
+        }
+
+# Shared by every caller in the process
+language_identifier = LanguageIdentifier()
+
+def detect_language(text: str, default: str = 'en') -> str:
+    """Language code of the text (see LanguageIdentifier.detect)"""
+    return language_identifier.detect(text, default)
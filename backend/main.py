@@ -1,65 +1,328 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, Form, UploadFile, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
-from typing import Optional
-import PyPDF2
-from docx import Document
+from fastapi.responses import StreamingResponse, PlainTextResponse
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
 import re
-from langdetect import detect
 import io
+import json
 import os
-from translator import translate_text, translate_to_english, TRANSLATIONS
-from ai_hr_analyser import AIHRAnalyser
+import asyncio
+import sqlite3
+import time
+from functools import cached_property
+from itertools import chain
+from ai_hr_analyser import AIHRAnalyser, skill_matcher
 from ats_analyser import ATSAnalyser
-
-app = FastAPI(title="Resume Analyser API", version="1.0.0")
+from worker_pool import AnalysisPool, AnalysisTimeoutError, PoolSaturatedError
+from analysis_cache import AnalysisCache
+from pattern_registry import pattern_registry, ANY_LANGUAGE
+from contact_scanner import scan_contacts, contact_candidates, best_contacts
+from sections import ResumeSections, segment_sections
+from skill_matcher import SkillOccurrences
+from section_cache import SectionCache, Segment, text_segments, match_record, shifted_matches
+from language_id import language_identifier, detect_language
+from metrics import StageTimer, metrics
+import docx_text
+from candidate_index import CandidateIndex, CANDIDATE_INDEX_ENABLED, MAX_TOP_K, parse_skills
+from job_queue import JobQueue, JobQueueFull, JobWorkers, check_callback_url
+from job_match import JobDescriptionCache, MAX_JOB_DESCRIPTIONS, MAX_JOB_DESCRIPTION_CHARS
+from response_builder import build_analysis_response, dumps, parse_fields, select_fields, with_section_analysis, FastJSONResponse
+from upload import (
+    Upload, Payload, UploadTooLarge, UploadLimitMiddleware, read_upload, open_payload,
+    MAX_UPLOAD_BYTES, MULTIPART_OVERHEAD_BYTES
+)
+from batch import (
+    BATCH_MAX_FILES, BATCH_MAX_ENTRY_BYTES, BATCH_MAX_ARCHIVE_BYTES, BATCH_MAX_TOTAL_BYTES, BatchBudget, EntryError,
+    batch_entry, batch_too_large, check_entry, check_size, expand_archive, read_member
+)
 
 # Cache analyser instances for better performance
 hr_analyser_instance = AIHRAnalyser()
 ats_analyser_instance = ATSAnalyser()
 
+def warm_analysers():
+    """Build this process's own analyser instances (analysis pool initializer)"""
+    global hr_analyser_instance, ats_analyser_instance
+    hr_analyser_instance = AIHRAnalyser()
+    ats_analyser_instance = ATSAnalyser()
+    # Tables are built on demand; workers build them up front so no request pays for it
+    hr_analyser_instance.profile_matrix
+    skill_matcher()
+    language_identifier.load()
+
+# CPU-bound analysis runs in worker processes so the event loop stays responsive
+analysis_pool = AnalysisPool(initializer=warm_analysers)
+
+# Repeat uploads of the same file are served from the content-addressed cache
+analysis_cache = AnalysisCache()
+
+# Job description features (skills, keywords) by text hash, so open requisitions are analysed once
+job_description_cache = JobDescriptionCache()
+
+# Every analysed resume, searchable by skill through GET /api/candidates/search
+candidate_index = CandidateIndex()
+
+# Per-section findings by section hash, so a re-uploaded resume only re-analyses edited sections
+section_cache = SectionCache()
+
+# Submitted jobs (POST /api/jobs), analysed by the job worker processes started with the app
+job_queue = JobQueue()
+
+# Batch requests share these slots so they never take the whole pool from interactive uploads
+BATCH_CONCURRENCY = int(os.environ.get("BATCH_CONCURRENCY", max(analysis_pool.workers // 2, 1)))
+batch_slots = asyncio.Semaphore(max(BATCH_CONCURRENCY, 1))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The pool forks first, while the process has no job supervisor thread yet
+    analysis_pool.start()
+    job_workers.start()
+    yield
+    job_workers.stop()
+    analysis_pool.shutdown()
+
+app = FastAPI(title="Resume Analyser API", version="1.0.0", lifespan=lifespan,
+              default_response_class=FastJSONResponse)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+# Refuse oversized single uploads while they are received, before multipart parsing buffers them
+app.add_middleware(UploadLimitMiddleware, limits={
+    "/api/analyse-resume": MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES,
+    "/api/jobs": MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES,
+    # Batch files are spooled to disk while parsed; this bounds the disk they take
+    "/api/analyse-resumes": max(BATCH_MAX_TOTAL_BYTES, BATCH_MAX_ARCHIVE_BYTES) + MULTIPART_OVERHEAD_BYTES,
+    # Job descriptions are form fields next to the file: up to 4 UTF-8 bytes per character
+    "/api/ats-match": MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES + MAX_JOB_DESCRIPTIONS * (4 * MAX_JOB_DESCRIPTION_CHARS + 256)
+})
 
-def extract_text(content: bytes, filename: str) -> str:
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    start = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        return response
+    finally:
+        # Label by route template, not raw path, so the number of series stays bounded
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        metrics.inc("requests_total", route=path, status=status)
+        metrics.observe("request_duration_seconds", time.perf_counter() - start, route=path)
+
+MAX_TEXT_CHARS = 100000  # 100KB limit on the text analysed per resume
+
+def extract_text(content, filename: str) -> str:
+    """Text of a PDF or DOCX given as bytes or a seekable binary file object"""
     text = ""
     try:
         if filename.lower().endswith('.pdf'):
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+            text = extract_pdf_text(content)
         elif filename.lower().endswith('.docx'):
-            doc = Document(io.BytesIO(content))
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text += paragraph.text + "\n"
-    except (PyPDF2.errors.PdfReadError, ValueError, IOError) as e:
+            text = extract_docx_text(content)
+    except (ValueError, IOError) as e:
         return "Error extracting text: Unable to process file"
     except Exception:
         return "Error extracting text: Unknown error occurred"
     
     return text.strip() if text.strip() else "No text found"
 
-def ai_analyse_resume(resume_text: str, language: str = "en") -> dict:
+def as_stream(content):
+    # Spilled uploads arrive as an mmap-backed file object; read those in place
+    return content if hasattr(content, "read") else io.BytesIO(content)
+
+def extract_pdf_text(content) -> str:
+    # Parsers are imported on first use: a worker that only sees DOCX never loads PyPDF2
+    import PyPDF2
+    text = ""
+    try:
+        pdf_reader = PyPDF2.PdfReader(as_stream(content))
+        for page in pdf_reader.pages:
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
+    except PyPDF2.errors.PdfReadError as e:
+        raise ValueError("Unreadable PDF") from e
+    return text
+
+def extract_docx_text(content) -> str:
+    # Streams only the XML parts holding text (body, tables, text boxes, headers, footers)
+    return docx_text.extract_docx_text(as_stream(content), max_chars=MAX_TEXT_CHARS)
+
+class ResumeAnalysisError(Exception):
+    """Raised by the analysis pipeline when the upload cannot be analysed (HTTP 400)"""
+    def __init__(self, detail: str):
+        super().__init__(detail)
+        self.detail = detail
+
+class ResumeAnalysisContext:
+    """Per-request memo of extracted features so every extractor runs at most once
+    
+    Findings that cannot cross a line break are gathered per section (segment_parts) and
+    joined; sections whose parts are already in section_parts are not scanned again, and
+    the parts computed here are added to it.
+    """
+    
+    def __init__(self, text: str, language: str = "en", section_parts: Optional[Dict[str, dict]] = None,
+                 layout: Optional[dict] = None):
+        self.text = text
+        self.language = language
+        self.section_parts = {} if section_parts is None else section_parts
+        if layout is not None:
+            # Segmented already (resume_section_keys), so neither pass runs again
+            self.sections = layout["sections"]
+            self.segments = layout["segments"]
+        # Section kinds in document order, by whether their parts were computed or reused
+        self.recomputed: List[str] = []
+        self.reused: List[str] = []
+        # (start, end) spans of the text behind each extracted entry, recorded by its extractor
+        self.entry_spans = {"projects": [], "experience": []}
+    
+    def skills_at(self, *spans: Tuple[int, int]) -> list:
+        """Skills inside the given (start, end) spans of the text, from the single skill scan"""
+        return self.skill_occurrences.within(spans)
+    
+    def section_entries(self, kind: str) -> list:
+        """Entry pattern matches (SECTION_ENTRY_PATTERNS) of every section of this kind, on the whole text"""
+        return [match for segment, parts in self.segment_parts if segment.kind == kind
+                for match in shifted_matches(parts["entries"], segment.start)]
+    
+    @cached_property
+    def sections(self) -> ResumeSections:
+        # The only pass over the text that looks for section structure
+        return segment_sections(self.text)
+    
+    @cached_property
+    def segments(self) -> List[Segment]:
+        return text_segments(self.sections, self.language)
+    
+    @cached_property
+    def segment_parts(self) -> List[Tuple[Segment, dict]]:
+        found = []
+        for segment in self.segments:
+            parts = self.section_parts.get(segment.key)
+            if parts is None:
+                parts = self.section_parts[segment.key] = analyse_section(
+                    self.text[segment.start:segment.end], segment, self.language
+                )
+                self.recomputed.append(segment.kind)
+            else:
+                self.reused.append(segment.kind)
+            found.append((segment, parts))
+        return found
+    
+    @cached_property
+    def skill_occurrences(self) -> SkillOccurrences:
+        # One skill scan per section; parts of the text are offset lookups
+        return SkillOccurrences.joined(
+            skill_matcher(), self.text, [(segment.start, *parts["skills"]) for segment, parts in self.segment_parts]
+        )
+    
+    @cached_property
+    def skill_pattern_matches(self) -> List[list]:
+        # Each pattern's matches section after section: the list findall gives on the whole text
+        return [list(chain.from_iterable(lists))
+                for lists in zip(*(parts["skill_patterns"] for _, parts in self.segment_parts))]
+    
+    @cached_property
+    def indicator_hits(self):
+        hits = None
+        for _, parts in self.segment_parts:
+            hits = parts["indicators"] if hits is None else hits | parts["indicators"]
+        return hits
+    
+    @cached_property
+    def ats_stats(self) -> dict:
+        return ats_analyser_instance.merge_text_stats([parts["ats"] for _, parts in self.segment_parts])
+    
+    @cached_property
+    def text_skills(self) -> list:
+        return self.skill_occurrences.all()
+    
+    @cached_property
+    def comprehensive_skills(self) -> dict:
+        return hr_analyser_instance.extract_all_skills_comprehensive(
+            self.text, sections=self.sections, occurrences=self.skill_occurrences
+        )
+    
+    @cached_property
+    def name(self) -> str:
+        return extract_name_ai(self.text)
+    
+    @cached_property
+    def contact(self) -> dict:
+        return best_contacts([parts["contact"] for _, parts in self.segment_parts])
+    
+    @cached_property
+    def skills(self) -> dict:
+        return extract_skills_ai(self.text, self.language, self)
+    
+    @cached_property
+    def experience(self) -> list:
+        return extract_experience_ai(self.text, self.language, self)
+    
+    @cached_property
+    def projects(self) -> list:
+        return extract_projects_ai(self.text, self.language, self)
+    
+    @cached_property
+    def education(self) -> list:
+        return extract_education_ai(self.text, self.language, self)
+    
+    @cached_property
+    def strengths(self) -> list:
+        return analyse_strengths_ai(self.text, self.language, self)
+    
+    @cached_property
+    def weaknesses(self) -> list:
+        return analyse_weaknesses_ai(self.text, self.language, self)
+    
+    @cached_property
+    def suggestions(self) -> list:
+        return generate_suggestions_ai(self.text, self.language, self)
+
+# Entries matched within every section of a kind; a match never leaves its section
+SECTION_ENTRY_PATTERNS = {"experience": "experience.job", "projects": "projects.item"}
+
+def analyse_section(text: str, segment: Segment, language: str) -> dict:
+    """Parts of one section: everything found in its text that does not depend on the rest of the resume"""
+    occurrences = hr_analyser_instance.locate_skills(text)
+    entries = []
+    if segment.kind in SECTION_ENTRY_PATTERNS and segment.content_end > segment.content_start:
+        pattern = pattern_registry.get(SECTION_ENTRY_PATTERNS[segment.kind], language)
+        entries = [match_record(match) for match in pattern.finditer(text, segment.content_start, segment.content_end)]
+    
+    return {
+        "skills": (occurrences.starts, occurrences.ends, occurrences.terms),
+        "skill_patterns": skill_pattern_matches(text, language),
+        "indicators": hr_analyser_instance.profile_matrix.indicator_hits(text),
+        "contact": contact_candidates(text),
+        "ats": ats_analyser_instance.text_stats(text),
+        "entries": entries
+    }
+
+def ai_analyse_resume(resume_text: str, language: str = "en", context: Optional[ResumeAnalysisContext] = None) -> dict:
     """AI-powered comprehensive resume analysis"""
+    context = context or ResumeAnalysisContext(resume_text, language)
     
     analysis = {
-        "name": extract_name_ai(resume_text),
-        "contact": extract_contact_ai(resume_text),
-        "skills": extract_skills_ai(resume_text, language),
-        "experience": extract_experience_ai(resume_text, language),
-        "projects": extract_projects_ai(resume_text, language),
-        "education": extract_education_ai(resume_text, language),
-        "strengths": analyse_strengths_ai(resume_text, language),
-        "weaknesses": analyse_weaknesses_ai(resume_text, language),
-        "suggestions": generate_suggestions_ai(resume_text, language)
+        "name": context.name,
+        "contact": context.contact,
+        "skills": context.skills,
+        "experience": context.experience,
+        "projects": context.projects,
+        "education": context.education,
+        "strengths": context.strengths,
+        "weaknesses": context.weaknesses,
+        "suggestions": context.suggestions
     }
     
     return analysis
@@ -86,210 +349,77 @@ def extract_name_ai(text: str) -> str:
     return "Unknown"
 
 def extract_contact_ai(text: str) -> dict:
-    """Enhanced contact extraction"""
-    contact = {}
-    
-    email_patterns = [
-        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        r'email[:\s]*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})',
-        r'e-mail[:\s]*([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})'
-    ]
-    
-    for pattern in email_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            contact['email'] = match.group(1) if match.groups() else match.group()
-            break
-    
-    phone_patterns = [
-        r'(\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9})',
-        r'(\(\d{3}\)\s?\d{3}[-.\s]?\d{4})',
-        r'(\d{3}[-.\s]?\d{3}[-.\s]?\d{4})',
-        r'phone[:\s]*(\+?\d[\d\s\-\(\)]{7,})'
-    ]
-    
-    for pattern in phone_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            contact['phone'] = match.group(1)
-            break
-    
-    # Aggressive LinkedIn detection - finds any LinkedIn reference
-    linkedin_patterns = [
-        # Any LinkedIn URL format
-        r'(?:https?://)?(?:www\.)?linkedin\.com/in/([^\s\)\]\|;,]+)',
-        r'(?:https?://)?(?:www\.)?linkedin\.com/pub/([^\s\)\]\|;,]+)',
-        r'(?:https?://)?(?:www\.)?linkedin\.com/profile/([^\s\)\]\|;,]+)',
-        # LinkedIn anywhere in text
-        r'linkedin\.com/in/([^\s\)\]\|;,]+)',
-        r'linkedin\.com/pub/([^\s\)\]\|;,]+)',
-        # LinkedIn with any separator
-        r'(?:linkedin|LinkedIn|LINKEDIN)\s*[:\-/|\s]*([a-zA-Z][a-zA-Z0-9._-]{2,50})',
-        # Any line containing linkedin
-        r'.*linkedin.*?([a-zA-Z][a-zA-Z0-9._-]{3,30}).*',
-        # Standalone usernames near linkedin
-        r'([a-zA-Z][a-zA-Z0-9._-]{3,30}).*linkedin',
-        r'linkedin.*?([a-zA-Z][a-zA-Z0-9._-]{3,30})',
-        # Simple patterns
-        r'(?:^|\s)([a-zA-Z][a-zA-Z0-9._-]{3,30})(?=.*linkedin)',
-        r'(?:linkedin)(?:[^a-zA-Z0-9]*?)([a-zA-Z][a-zA-Z0-9._-]{3,30})'
-    ]
-    
-    # Try each pattern and take first valid match
-    for pattern in linkedin_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            username = match.strip().rstrip('/')
-            # Minimal validation - just check it's reasonable
-            if (username and 
-                len(username) >= 3 and len(username) <= 50 and
-                username[0].isalpha() and
-                not username.lower() in ['linkedin', 'github', 'twitter', 'facebook'] and
-                not username.startswith(('http', 'www')) and
-                not username.endswith(('.com', '.net', '.org'))):
-                contact['linkedin'] = f"https://linkedin.com/in/{username}"
-                break
-        if 'linkedin' in contact:
-            break
-    
-    # Aggressive GitHub detection - finds any GitHub reference
-    github_patterns = [
-        # Any GitHub URL format
-        r'(?:https?://)?(?:www\.)?github\.com/([^\s\)\]\|;,]+)',
-        r'(?:https?://)?([^\s\)\]\|;,]+)\.github\.io',
-        # GitHub anywhere in text
-        r'github\.com/([^\s\)\]\|;,]+)',
-        # GitHub with any separator
-        r'(?:github|GitHub|GITHUB)\s*[:\-/|\s]*([a-zA-Z][a-zA-Z0-9._-]{2,40})',
-        # Any line containing github
-        r'.*github.*?([a-zA-Z][a-zA-Z0-9._-]{3,30}).*',
-        # Standalone usernames near github
-        r'([a-zA-Z][a-zA-Z0-9._-]{3,30}).*github',
-        r'github.*?([a-zA-Z][a-zA-Z0-9._-]{3,30})',
-        # Simple patterns
-        r'(?:^|\s)([a-zA-Z][a-zA-Z0-9._-]{3,30})(?=.*github)',
-        r'(?:github)(?:[^a-zA-Z0-9]*?)([a-zA-Z][a-zA-Z0-9._-]{3,30})'
-    ]
-    
-    # Try each pattern and take first valid match
-    for pattern in github_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            username = match.strip().rstrip('/')
-            # Minimal validation - just check it's reasonable
-            if (username and 
-                len(username) >= 3 and len(username) <= 40 and
-                username[0].isalpha() and
-                not username.lower() in ['github', 'linkedin', 'twitter', 'facebook'] and
-                not username.startswith(('http', 'www')) and
-                not username.endswith(('.com', '.net', '.org'))):
-                contact['github'] = f"https://github.com/{username}"
-                break
-        if 'github' in contact:
-            break
-    
-    # Portfolio/Website patterns
-    website_patterns = [
-        r'(?:portfolio|website|personal site|site)[:\s]*(?:https?://)?([\w.-]+\.[a-z]{2,})/?',
-        r'(?:https?://)([\w.-]+\.[a-z]{2,})(?=\s|$|\n)',
-        r'(?:www\.)([\w.-]+\.[a-z]{2,})(?=\s|$|\n)',
-        r'([\w-]+\.[a-z]{2,})(?=\s|$|\n)'
-    ]
-    
-    for pattern in website_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            website = match.strip()
-            if (not any(domain in website.lower() for domain in ['linkedin', 'github', 'gmail', 'yahoo', 'hotmail', 'outlook']) and
-                '.' in website and len(website) > 4):
-                if not website.startswith('http'):
-                    website = f"https://{website}"
-                contact['website'] = website
-                break
-        if 'website' in contact:
-            break
-    
-    # Additional social media detection
-    social_patterns = {
-        'twitter': r'(?:twitter|@)[:\s]*([\w]+)',
-        'instagram': r'(?:instagram)[:\s]*([\w.]+)',
-        'behance': r'(?:behance)[:\s]*([\w.]+)'
+    """Enhanced contact extraction (single linear-time scan, see contact_scanner)"""
+    return scan_contacts(text)
+
+# Enhanced multilingual skill patterns for better accuracy
+SKILL_PATTERNS = {
+    'programming': {
+        'en': r'\b(?:python|java|javascript|react|angular|vue|node|php|ruby|go|rust|swift|kotlin|scala|c\+\+|c#|typescript|html|css|sql|mongodb|postgresql|mysql|redis|elasticsearch|docker|kubernetes|aws|azure|gcp|git|jenkins|terraform|ansible)\b',
+        'de': r'\b(?:programmierung|entwicklung|softwareentwicklung|webentwicklung|datenbankentwicklung|frontend|backend|fullstack|programmiersprache|framework|bibliothek|api|datenbank|cloud|devops|versionskontrolle)\b',
+        'es': r'\b(?:programación|desarrollo|desarrollo de software|desarrollo web|desarrollo de bases de datos|frontend|backend|fullstack|lenguaje de programación|framework|biblioteca|api|base de datos|nube|devops|control de versiones)\b',
+        'fr': r'\b(?:programmation|développement|développement logiciel|développement web|développement de base de données|frontend|backend|fullstack|langage de programmation|framework|bibliothèque|api|base de données|cloud|devops|contrôle de version)\b',
+        'it': r'\b(?:programmazione|sviluppo|sviluppo software|sviluppo web|sviluppo database|frontend|backend|fullstack|linguaggio di programmazione|framework|libreria|api|database|cloud|devops|controllo versione)\b',
+        'pt': r'\b(?:programação|desenvolvimento|desenvolvimento de software|desenvolvimento web|desenvolvimento de banco de dados|frontend|backend|fullstack|linguagem de programação|framework|biblioteca|api|banco de dados|nuvem|devops|controle de versão)\b',
+        'zh': r'(?:编程|开发|软件开发|网页开发|数据库开发|前端|后端|全栈|编程语言|框架|库|接口|数据库|云计算|运维|版本控制)',
+        'ja': r'(?:プログラミング|開発|ソフトウェア開発|ウェブ開発|データベース開発|フロントエンド|バックエンド|フルスタック|プログラミング言語|フレームワーク|ライブラリ|API|データベース|クラウド|DevOps|バージョン管理)',
+        'ru': r'\b(?:программирование|разработка|разработка программного обеспечения|веб-разработка|разработка баз данных|фронтенд|бэкенд|фуллстек|язык программирования|фреймворк|библиотека|api|база данных|облако|devops|контроль версий)\b',
+        'ar': r'(?:برمجة|تطوير|تطوير البرمجيات|تطوير الويب|تطوير قواعد البيانات|الواجهة الأمامية|الواجهة الخلفية|مطور شامل|لغة برمجة|إطار عمل|مكتبة|واجهة برمجة|قاعدة بيانات|الحوسبة السحابية|عمليات التطوير|التحكم في الإصدار)'
+    },
+    'tools': {
+        'en': r'\b(?:git|github|gitlab|bitbucket|jira|confluence|slack|teams|figma|sketch|photoshop|illustrator|indesign|office|excel|powerpoint|word|outlook|salesforce|hubspot|analytics|tableau|powerbi)\b',
+        'de': r'\b(?:werkzeuge|tools|software|anwendungen|programme|systeme|plattformen|dienste|lösungen)\b',
+        'es': r'\b(?:herramientas|software|aplicaciones|programas|sistemas|plataformas|servicios|soluciones)\b',
+        'fr': r'\b(?:outils|logiciels|applications|programmes|systèmes|plateformes|services|solutions)\b',
+        'it': r'\b(?:strumenti|software|applicazioni|programmi|sistemi|piattaforme|servizi|soluzioni)\b',
+        'pt': r'\b(?:ferramentas|software|aplicações|programas|sistemas|plataformas|serviços|soluções)\b',
+        'zh': r'(?:工具|软件|应用程序|程序|系统|平台|服务|解决方案)',
+        'ja': r'(?:ツール|ソフトウェア|アプリケーション|プログラム|システム|プラットフォーム|サービス|ソリューション)',
+        'ru': r'\b(?:инструменты|программное обеспечение|приложения|программы|системы|платформы|сервисы|решения)\b',
+        'ar': r'(?:أدوات|برمجيات|تطبيقات|برامج|أنظمة|منصات|خدمات|حلول)'
+    },
+    'soft_skills': {
+        'en': r'\b(?:leadership|management|communication|teamwork|collaboration|problem.solving|analytical|creative|innovative|adaptable|flexible|organized|detail.oriented|time.management|project.management|agile|scrum)\b',
+        'de': r'\b(?:führung|management|kommunikation|teamarbeit|zusammenarbeit|problemlösung|analytisch|kreativ|innovativ|anpassungsfähig|flexibel|organisiert|detailorientiert|zeitmanagement|projektmanagement|agil|scrum)\b',
+        'es': r'\b(?:liderazgo|gestión|comunicación|trabajo en equipo|colaboración|resolución de problemas|analítico|creativo|innovador|adaptable|flexible|organizado|orientado al detalle|gestión del tiempo|gestión de proyectos|ágil|scrum)\b',
+        'fr': r'\b(?:leadership|gestion|communication|travail d\'équipe|collaboration|résolution de problèmes|analytique|créatif|innovant|adaptable|flexible|organisé|orienté détail|gestion du temps|gestion de projet|agile|scrum)\b',
+        'it': r'\b(?:leadership|gestione|comunicazione|lavoro di squadra|collaborazione|risoluzione problemi|analitico|creativo|innovativo|adattabile|flessibile|organizzato|orientato ai dettagli|gestione del tempo|gestione progetti|agile|scrum)\b',
+        'pt': r'\b(?:liderança|gestão|comunicação|trabalho em equipe|colaboração|resolução de problemas|analítico|criativo|inovador|adaptável|flexível|organizado|orientado a detalhes|gestão do tempo|gestão de projetos|ágil|scrum)\b',
+        'zh': r'(?:领导力|管理|沟通|团队合作|协作|问题解决|分析|创意|创新|适应性|灵活|有组织|注重细节|时间管理|项目管理|敏捷|Scrum)',
+        'ja': r'(?:リーダーシップ|マネジメント|コミュニケーション|チームワーク|コラボレーション|問題解決|分析的|創造的|革新的|適応性|柔軟性|組織的|細部重視|時間管理|プロジェクト管理|アジャイル|スクラム)',
+        'ru': r'\b(?:лидерство|управление|коммуникация|командная работа|сотрудничество|решение проблем|аналитический|творческий|инновационный|адаптивный|гибкий|организованный|внимание к деталям|управление временем|управление проектами|agile|scrum)\b',
+        'ar': r'(?:القيادة|الإدارة|التواصل|العمل الجماعي|التعاون|حل المشكلات|تحليلي|إبداعي|مبتكر|قابل للتكيف|مرن|منظم|موجه للتفاصيل|إدارة الوقت|إدارة المشاريع|رشيق|سكرم)'
     }
-    
-    for platform, pattern in social_patterns.items():
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            username = match.group(1)
-            if len(username) > 2 and len(username) < 30:
-                contact[platform] = f"https://{platform}.com/{username}"
-    
-    return contact
+}
+
+# Universal technical skill patterns (work across languages)
+UNIVERSAL_SKILL_PATTERNS = [
+    r'\b(?:Python|Java|JavaScript|React|Angular|Vue|Node\.?js|PHP|Ruby|Go|Rust|Swift|Kotlin|Scala|C\+\+|C#|TypeScript|HTML5?|CSS3?|SQL|NoSQL|MongoDB|PostgreSQL|MySQL|Redis|Elasticsearch|Docker|Kubernetes|AWS|Azure|GCP|Git|Jenkins|Terraform|Ansible|Linux|Ubuntu|Windows|macOS|Apache|Nginx|REST|GraphQL|JSON|XML|API|SDK|IDE|VS Code|IntelliJ|Eclipse|Xcode|Android Studio)\b',
+    r'\b(?:Machine Learning|Deep Learning|AI|Artificial Intelligence|Data Science|Big Data|Analytics|Statistics|Pandas|NumPy|TensorFlow|PyTorch|Scikit-learn|Jupyter|R|Matlab|Tableau|Power BI|Excel|Spark|Hadoop|Kafka|Airflow)\b',
+    r'\b(?:Agile|Scrum|Kanban|DevOps|CI/CD|Microservices|Serverless|Cloud Computing|Blockchain|IoT|AR|VR|Mobile Development|Web Development|Frontend|Backend|Full Stack|UI/UX|Design Patterns|Testing|QA|Automation)\b'
+]
 
-def extract_skills_ai(text: str, language: str) -> dict:
+for category, patterns in SKILL_PATTERNS.items():
+    pattern_registry.register(f"skills.{category}", patterns, re.IGNORECASE)
+pattern_registry.register("skills.universal", {ANY_LANGUAGE: UNIVERSAL_SKILL_PATTERNS}, re.IGNORECASE)
+
+def skill_pattern_matches(text: str, language: str) -> List[list]:
+    """findall of every skill pattern over the text: the language's categories, then the universal ones"""
+    return [pattern_registry.get(f"skills.{category}", language).findall(text) for category in SKILL_PATTERNS] + [
+        pattern.findall(text) for pattern in pattern_registry.get("skills.universal")
+    ]
+
+def extract_skills_ai(text: str, language: str, context: Optional[ResumeAnalysisContext] = None) -> dict:
     """Multilingual AI skill extraction with language-specific patterns"""
+    context = context or ResumeAnalysisContext(text, language)
     try:
         # Primary skill extraction using AI HR analyser
-        skills = hr_analyser_instance._extract_skills_from_text(text)
-        
-        # Enhanced multilingual skill patterns for better accuracy
-        multilingual_skill_patterns = {
-            'programming': {
-                'en': r'\b(?:python|java|javascript|react|angular|vue|node|php|ruby|go|rust|swift|kotlin|scala|c\+\+|c#|typescript|html|css|sql|mongodb|postgresql|mysql|redis|elasticsearch|docker|kubernetes|aws|azure|gcp|git|jenkins|terraform|ansible)\b',
-                'de': r'\b(?:programmierung|entwicklung|softwareentwicklung|webentwicklung|datenbankentwicklung|frontend|backend|fullstack|programmiersprache|framework|bibliothek|api|datenbank|cloud|devops|versionskontrolle)\b',
-                'es': r'\b(?:programación|desarrollo|desarrollo de software|desarrollo web|desarrollo de bases de datos|frontend|backend|fullstack|lenguaje de programación|framework|biblioteca|api|base de datos|nube|devops|control de versiones)\b',
-                'fr': r'\b(?:programmation|développement|développement logiciel|développement web|développement de base de données|frontend|backend|fullstack|langage de programmation|framework|bibliothèque|api|base de données|cloud|devops|contrôle de version)\b',
-                'it': r'\b(?:programmazione|sviluppo|sviluppo software|sviluppo web|sviluppo database|frontend|backend|fullstack|linguaggio di programmazione|framework|libreria|api|database|cloud|devops|controllo versione)\b',
-                'pt': r'\b(?:programação|desenvolvimento|desenvolvimento de software|desenvolvimento web|desenvolvimento de banco de dados|frontend|backend|fullstack|linguagem de programação|framework|biblioteca|api|banco de dados|nuvem|devops|controle de versão)\b',
-                'zh': r'(?:编程|开发|软件开发|网页开发|数据库开发|前端|后端|全栈|编程语言|框架|库|接口|数据库|云计算|运维|版本控制)',
-                'ja': r'(?:プログラミング|開発|ソフトウェア開発|ウェブ開発|データベース開発|フロントエンド|バックエンド|フルスタック|プログラミング言語|フレームワーク|ライブラリ|API|データベース|クラウド|DevOps|バージョン管理)',
-                'ru': r'\b(?:программирование|разработка|разработка программного обеспечения|веб-разработка|разработка баз данных|фронтенд|бэкенд|фуллстек|язык программирования|фреймворк|библиотека|api|база данных|облако|devops|контроль версий)\b',
-                'ar': r'(?:برمجة|تطوير|تطوير البرمجيات|تطوير الويب|تطوير قواعد البيانات|الواجهة الأمامية|الواجهة الخلفية|مطور شامل|لغة برمجة|إطار عمل|مكتبة|واجهة برمجة|قاعدة بيانات|الحوسبة السحابية|عمليات التطوير|التحكم في الإصدار)'
-            },
-            'tools': {
-                'en': r'\b(?:git|github|gitlab|bitbucket|jira|confluence|slack|teams|figma|sketch|photoshop|illustrator|indesign|office|excel|powerpoint|word|outlook|salesforce|hubspot|analytics|tableau|powerbi)\b',
-                'de': r'\b(?:werkzeuge|tools|software|anwendungen|programme|systeme|plattformen|dienste|lösungen)\b',
-                'es': r'\b(?:herramientas|software|aplicaciones|programas|sistemas|plataformas|servicios|soluciones)\b',
-                'fr': r'\b(?:outils|logiciels|applications|programmes|systèmes|plateformes|services|solutions)\b',
-                'it': r'\b(?:strumenti|software|applicazioni|programmi|sistemi|piattaforme|servizi|soluzioni)\b',
-                'pt': r'\b(?:ferramentas|software|aplicações|programas|sistemas|plataformas|serviços|soluções)\b',
-                'zh': r'(?:工具|软件|应用程序|程序|系统|平台|服务|解决方案)',
-                'ja': r'(?:ツール|ソフトウェア|アプリケーション|プログラム|システム|プラットフォーム|サービス|ソリューション)',
-                'ru': r'\b(?:инструменты|программное обеспечение|приложения|программы|системы|платформы|сервисы|решения)\b',
-                'ar': r'(?:أدوات|برمجيات|تطبيقات|برامج|أنظمة|منصات|خدمات|حلول)'
-            },
-            'soft_skills': {
-                'en': r'\b(?:leadership|management|communication|teamwork|collaboration|problem.solving|analytical|creative|innovative|adaptable|flexible|organized|detail.oriented|time.management|project.management|agile|scrum)\b',
-                'de': r'\b(?:führung|management|kommunikation|teamarbeit|zusammenarbeit|problemlösung|analytisch|kreativ|innovativ|anpassungsfähig|flexibel|organisiert|detailorientiert|zeitmanagement|projektmanagement|agil|scrum)\b',
-                'es': r'\b(?:liderazgo|gestión|comunicación|trabajo en equipo|colaboración|resolución de problemas|analítico|creativo|innovador|adaptable|flexible|organizado|orientado al detalle|gestión del tiempo|gestión de proyectos|ágil|scrum)\b',
-                'fr': r'\b(?:leadership|gestion|communication|travail d\'équipe|collaboration|résolution de problèmes|analytique|créatif|innovant|adaptable|flexible|organisé|orienté détail|gestion du temps|gestion de projet|agile|scrum)\b',
-                'it': r'\b(?:leadership|gestione|comunicazione|lavoro di squadra|collaborazione|risoluzione problemi|analitico|creativo|innovativo|adattabile|flessibile|organizzato|orientato ai dettagli|gestione del tempo|gestione progetti|agile|scrum)\b',
-                'pt': r'\b(?:liderança|gestão|comunicação|trabalho em equipe|colaboração|resolução de problemas|analítico|criativo|inovador|adaptável|flexível|organizado|orientado a detalhes|gestão do tempo|gestão de projetos|ágil|scrum)\b',
-                'zh': r'(?:领导力|管理|沟通|团队合作|协作|问题解决|分析|创意|创新|适应性|灵活|有组织|注重细节|时间管理|项目管理|敏捷|Scrum)',
-                'ja': r'(?:リーダーシップ|マネジメント|コミュニケーション|チームワーク|コラボレーション|問題解決|分析的|創造的|革新的|適応性|柔軟性|組織的|細部重視|時間管理|プロジェクト管理|アジャイル|スクラム)',
-                'ru': r'\b(?:лидерство|управление|коммуникация|командная работа|сотрудничество|решение проблем|аналитический|творческий|инновационный|адаптивный|гибкий|организованный|внимание к деталям|управление временем|управление проектами|agile|scrum)\b',
-                'ar': r'(?:القيادة|الإدارة|التواصل|العمل الجماعي|التعاون|حل المشكلات|تحليلي|إبداعي|مبتكر|قابل للتكيف|مرن|منظم|موجه للتفاصيل|إدارة الوقت|إدارة المشاريع|رشيق|سكرم)'
-            }
-        }
+        skills = context.text_skills
         
-        # Extract skills using language-specific patterns
+        # Extract skills using language-specific patterns (detected language, fallback to English), then universal ones
         language_skills = set(skills)  # Start with AI-detected skills
         
-        for category, patterns in multilingual_skill_patterns.items():
-            # Use detected language pattern, fallback to English
-            pattern = patterns.get(language, patterns.get('en', ''))
-            if pattern:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                language_skills.update(matches)
-        
-        # Universal technical skill patterns (work across languages)
-        universal_patterns = [
-            r'\b(?:Python|Java|JavaScript|React|Angular|Vue|Node\.?js|PHP|Ruby|Go|Rust|Swift|Kotlin|Scala|C\+\+|C#|TypeScript|HTML5?|CSS3?|SQL|NoSQL|MongoDB|PostgreSQL|MySQL|Redis|Elasticsearch|Docker|Kubernetes|AWS|Azure|GCP|Git|Jenkins|Terraform|Ansible|Linux|Ubuntu|Windows|macOS|Apache|Nginx|REST|GraphQL|JSON|XML|API|SDK|IDE|VS Code|IntelliJ|Eclipse|Xcode|Android Studio)\b',
-            r'\b(?:Machine Learning|Deep Learning|AI|Artificial Intelligence|Data Science|Big Data|Analytics|Statistics|Pandas|NumPy|TensorFlow|PyTorch|Scikit-learn|Jupyter|R|Matlab|Tableau|Power BI|Excel|Spark|Hadoop|Kafka|Airflow)\b',
-            r'\b(?:Agile|Scrum|Kanban|DevOps|CI/CD|Microservices|Serverless|Cloud Computing|Blockchain|IoT|AR|VR|Mobile Development|Web Development|Frontend|Backend|Full Stack|UI/UX|Design Patterns|Testing|QA|Automation)\b'
-        ]
-        
-        for pattern in universal_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for matches in context.skill_pattern_matches:
             language_skills.update(matches)
         
         # Clean and categorize skills
@@ -311,55 +441,42 @@ def extract_skills_ai(text: str, language: str) -> dict:
     except Exception:
         return {"categorized": {"All Skills": []}, "all": []}
 
-def extract_experience_ai(text: str, language: str) -> list:
+# Job title and company patterns
+JOB_PATTERNS = {
+    'en': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:at\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|present|current))',
+    'de': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:bei\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|heute|aktuell))',
+    'es': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:en\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|presente|actual))',
+    'fr': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:chez\s+|à\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|présent|actuel))',
+    'it': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:presso\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|presente|attuale))',
+    'pt': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:na\s+|em\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|presente|atual))',
+    'zh': r'(?:^|\n)\s*([^\n]{5,80})\s*(?:\n|$)\s*(?:在\s*)?([^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|现在|至今))',
+    'ja': r'(?:^|\n)\s*([^\n]{5,80})\s*(?:\n|$)\s*(?:で\s*|にて\s*)?([^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|現在|至))',
+    'ru': r'(?:^|\n)\s*([А-Я][^\n]{10,80})\s*(?:\n|$)\s*(?:в\s+|@\s*)?([А-Я][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|настоящее время|сейчас))',
+    'ar': r'(?:^|\n)\s*([^\n]{5,80})\s*(?:\n|$)\s*(?:في\s*)?([^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|الحاضر|الآن))'
+}
+
+UNIVERSAL_EXPERIENCE_PATTERNS = [
+    r'(\d{4}\s*[-–—]\s*(?:\d{4}|present|heute|presente|présent|attuale|atual|现在|現在|настоящее время|الحاضر))\s*[:|\n]?\s*([^\n]{10,100})',
+    r'([A-Z][^\n]{15,80})\s*\n\s*([A-Z][^\n]{5,50})\s*\n\s*(\d{4}\s*[-–—]\s*(?:\d{4}|present|current))'
+]
+
+pattern_registry.register("experience.job", JOB_PATTERNS, re.IGNORECASE | re.MULTILINE)
+pattern_registry.register("experience.universal", {ANY_LANGUAGE: UNIVERSAL_EXPERIENCE_PATTERNS}, re.IGNORECASE | re.MULTILINE)
+
+def extract_experience_ai(text: str, language: str, context: Optional[ResumeAnalysisContext] = None) -> list:
     """Multilingual AI experience extraction with enhanced accuracy"""
+    context = context or ResumeAnalysisContext(text, language)
     experiences = []
     
-    # Comprehensive multilingual experience patterns
-    exp_section_patterns = {
-        'en': r'(?:experience|work\s+history|employment|professional\s+experience|career|work\s+experience|job\s+history|employment\s+history)\s*:?\s*\n(.*?)(?=\n\s*(?:education|skills|projects|certifications|awards|languages|references|$))',
-        'de': r'(?:erfahrung|berufserfahrung|beschäftigung|arbeitserfahrung|beruflicher\s+werdegang|arbeitsplätze|anstellungen)\s*:?\s*\n(.*?)(?=\n\s*(?:bildung|ausbildung|fähigkeiten|projekte|zertifikate|auszeichnungen|sprachen|referenzen|$))',
-        'es': r'(?:experiencia|historial\s+laboral|empleo|experiencia\s+profesional|carrera|experiencia\s+de\s+trabajo|historial\s+de\s+trabajo)\s*:?\s*\n(.*?)(?=\n\s*(?:educación|habilidades|proyectos|certificaciones|premios|idiomas|referencias|$))',
-        'fr': r'(?:expérience|historique\s+de\s+travail|emploi|expérience\s+professionnelle|carrière|expérience\s+de\s+travail)\s*:?\s*\n(.*?)(?=\n\s*(?:éducation|formation|compétences|projets|certifications|prix|langues|références|$))',
-        'it': r'(?:esperienza|storia\s+lavorativa|impiego|esperienza\s+professionale|carriera|esperienza\s+di\s+lavoro)\s*:?\s*\n(.*?)(?=\n\s*(?:istruzione|formazione|competenze|progetti|certificazioni|premi|lingue|riferimenti|$))',
-        'pt': r'(?:experiência|histórico\s+de\s+trabalho|emprego|experiência\s+profissional|carreira|experiência\s+de\s+trabalho)\s*:?\s*\n(.*?)(?=\n\s*(?:educação|formação|habilidades|projetos|certificações|prêmios|idiomas|referências|$))',
-        'zh': r'(?:经验|工作经历|就业|职业经验|职业生涯|工作经验|工作历史)\s*:?\s*\n(.*?)(?=\n\s*(?:教育|技能|项目|认证|奖项|语言|推荐|$))',
-        'ja': r'(?:経験|職歴|雇用|職業経験|キャリア|仕事の経験|職歴)\s*:?\s*\n(.*?)(?=\n\s*(?:教育|学歴|スキル|プロジェクト|認定|賞|言語|参考|$))',
-        'ru': r'(?:опыт|трудовая\s+деятельность|занятость|профессиональный\s+опыт|карьера|опыт\s+работы)\s*:?\s*\n(.*?)(?=\n\s*(?:образование|навыки|проекты|сертификаты|награды|языки|рекомендации|$))',
-        'ar': r'(?:خبرة|تاريخ\s+العمل|التوظيف|الخبرة\s+المهنية|المسيرة\s+المهنية|خبرة\s+العمل)\s*:?\s*\n(.*?)(?=\n\s*(?:التعليم|المهارات|المشاريع|الشهادات|الجوائز|اللغات|المراجع|$))'
-    }
-    
-    # Job title and company patterns
-    job_patterns = {
-        'en': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:at\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|present|current))',
-        'de': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:bei\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|heute|aktuell))',
-        'es': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:en\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|presente|actual))',
-        'fr': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:chez\s+|à\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|présent|actuel))',
-        'it': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:presso\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|presente|attuale))',
-        'pt': r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*(?:na\s+|em\s+|@\s*)?([A-Z][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|presente|atual))',
-        'zh': r'(?:^|\n)\s*([^\n]{5,80})\s*(?:\n|$)\s*(?:在\s*)?([^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|现在|至今))',
-        'ja': r'(?:^|\n)\s*([^\n]{5,80})\s*(?:\n|$)\s*(?:で\s*|にて\s*)?([^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|現在|至))',
-        'ru': r'(?:^|\n)\s*([А-Я][^\n]{10,80})\s*(?:\n|$)\s*(?:в\s+|@\s*)?([А-Я][^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|настоящее время|сейчас))',
-        'ar': r'(?:^|\n)\s*([^\n]{5,80})\s*(?:\n|$)\s*(?:في\s*)?([^\n]{2,50})\s*(?:\n|$)\s*(\d{4}\s*[-–—]\s*(?:\d{4}|الحاضر|الآن))'
-    }
+    # Job entries of the experience section(s) found by the shared segmenter, with offsets into the text
+    job_matches = context.section_entries("experience")
     
-    # Extract experience section
-    section_pattern = exp_section_patterns.get(language, exp_section_patterns['en'])
-    section_match = re.search(section_pattern, text, re.IGNORECASE | re.DOTALL)
-    
-    if section_match:
-        exp_text = section_match.group(1)
-        
-        # Extract individual jobs
-        job_pattern = job_patterns.get(language, job_patterns['en'])
-        job_matches = re.findall(job_pattern, exp_text, re.IGNORECASE | re.MULTILINE)
-        
+    if job_matches:
         for match in job_matches[:8]:  # Limit to 8 experiences
-            title, company, duration = match
+            title, company, duration = match.groups()
             
-            # Extract skills from this experience
-            job_context = f"{title} {company}"
-            job_skills = hr_analyser_instance._extract_skills_from_text(job_context)
+            # Skills of this experience: the occurrences inside its title and company
+            job_skills = context.skills_at(match.span(1), match.span(2))
             
             experiences.append({
                 "title": title.strip(),
@@ -368,83 +485,69 @@ def extract_experience_ai(text: str, language: str) -> list:
                 "description": f"Professional role at {company.strip()}",
                 "skills_used": job_skills[:10]  # Top 10 skills
             })
+            context.entry_spans["experience"].append((match.span(1), match.span(2)))
     
     # Fallback: Universal patterns for any language
     if not experiences:
-        universal_patterns = [
-            r'(\d{4}\s*[-–—]\s*(?:\d{4}|present|heute|presente|présent|attuale|atual|现在|現在|настоящее время|الحاضر))\s*[:|\n]?\s*([^\n]{10,100})',
-            r'([A-Z][^\n]{15,80})\s*\n\s*([A-Z][^\n]{5,50})\s*\n\s*(\d{4}\s*[-–—]\s*(?:\d{4}|present|current))'
-        ]
-        
-        for pattern in universal_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches[:5]:
+        for pattern in pattern_registry.get("experience.universal"):
+            for found in list(pattern.finditer(text))[:5]:
+                match = found.groups()
                 if len(match) >= 2:
                     experiences.append({
                         "title": match[1] if len(match) > 1 else "Professional Role",
                         "company": "Company from resume",
                         "duration": match[0] if match[0] else "Not specified",
                         "description": "Experience extracted from resume",
-                        "skills_used": hr_analyser_instance._extract_skills_from_text(' '.join(match))[:5]
+                        "skills_used": context.skills_at(*[found.span(group) for group in range(1, len(match) + 1)])[:5]
                     })
+                    context.entry_spans["experience"].append((found.span(2),))
     
     return experiences or [{
         "title": "Professional Experience", 
         "company": "Various Companies",
         "duration": "Multiple Years", 
         "description": "Professional experience found in resume",
-        "skills_used": hr_analyser_instance._extract_skills_from_text(text)[:8]
+        "skills_used": context.text_skills[:8]
     }]
 
-def extract_projects_ai(text: str, language: str) -> list:
+# Project title and description patterns
+PROJECT_ITEM_PATTERNS = {
+    'en': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Technologies?|Tech Stack|Built with|Using)\s*:?\s*([^\n]+)',
+    'de': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Technologien?|Tech Stack|Erstellt mit|Verwendet)\s*:?\s*([^\n]+)',
+    'es': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Tecnologías?|Stack Tecnológico|Construido con|Usando)\s*:?\s*([^\n]+)',
+    'fr': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Technologies?|Stack Technique|Construit avec|Utilisant)\s*:?\s*([^\n]+)',
+    'it': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Tecnologie?|Stack Tecnologico|Costruito con|Usando)\s*:?\s*([^\n]+)',
+    'pt': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Tecnologias?|Stack Tecnológico|Construído com|Usando)\s*:?\s*([^\n]+)',
+    'zh': r'(?:^|\n)\s*([^\n]{3,100})\s*(?:\n|$)\s*([^\n]{10,300})(?:\n|$)\s*(?:技术|技术栈|使用技术|开发工具)\s*:?\s*([^\n]+)',
+    'ja': r'(?:^|\n)\s*([^\n]{3,100})\s*(?:\n|$)\s*([^\n]{10,300})(?:\n|$)\s*(?:技術|技術スタック|使用技術|開発ツール)\s*:?\s*([^\n]+)',
+    'ru': r'(?:^|\n)\s*([А-Я][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Технологии?|Технический стек|Построено с|Используя)\s*:?\s*([^\n]+)',
+    'ar': r'(?:^|\n)\s*([^\n]{3,100})\s*(?:\n|$)\s*([^\n]{10,300})(?:\n|$)\s*(?:التقنيات?|المكدس التقني|مبني باستخدام|باستخدام)\s*:?\s*([^\n]+)'
+}
+
+# Universal project patterns
+UNIVERSAL_PROJECT_PATTERNS = [
+    r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*([^\n]{30,200})\s*(?:\n|$)\s*(?:GitHub|Demo|Live|Link|URL)\s*:?\s*([^\n]+)',
+    r'(?:Built|Developed|Created|Designed|Implemented)\s+([^\n]{10,100})\s*(?:\n|$)\s*([^\n]{20,300})',
+    r'([A-Z][^\n]{5,80})\s*[-–—]\s*([^\n]{20,200})\s*(?:\n|$)\s*(?:Technologies?|Tech|Stack|Tools?)\s*:?\s*([^\n]+)'
+]
+
+pattern_registry.register("projects.item", PROJECT_ITEM_PATTERNS, re.IGNORECASE | re.MULTILINE)
+pattern_registry.register("projects.universal", {ANY_LANGUAGE: UNIVERSAL_PROJECT_PATTERNS}, re.IGNORECASE | re.MULTILINE)
+
+def extract_projects_ai(text: str, language: str, context: Optional[ResumeAnalysisContext] = None) -> list:
     """Multilingual AI project extraction with enhanced accuracy"""
+    context = context or ResumeAnalysisContext(text, language)
     projects = []
     
-    # Comprehensive multilingual project section patterns
-    project_section_patterns = {
-        'en': r'(?:projects?|portfolio|personal\s+projects?|side\s+projects?|academic\s+projects?|work\s+projects?)\s*:?\s*\n(.*?)(?=\n\s*(?:experience|education|skills|certifications|awards|languages|references|contact|$))',
-        'de': r'(?:projekte?|portfolio|persönliche\s+projekte?|nebenprojekte?|akademische\s+projekte?|arbeitsprojekte?)\s*:?\s*\n(.*?)(?=\n\s*(?:erfahrung|bildung|fähigkeiten|zertifikate|auszeichnungen|sprachen|referenzen|kontakt|$))',
-        'es': r'(?:proyectos?|portafolio|proyectos\s+personales?|proyectos\s+paralelos?|proyectos\s+académicos?|proyectos\s+de\s+trabajo?)\s*:?\s*\n(.*?)(?=\n\s*(?:experiencia|educación|habilidades|certificaciones|premios|idiomas|referencias|contacto|$))',
-        'fr': r'(?:projets?|portfolio|projets\s+personnels?|projets\s+parallèles?|projets\s+académiques?|projets\s+de\s+travail?)\s*:?\s*\n(.*?)(?=\n\s*(?:expérience|éducation|compétences|certifications|prix|langues|références|contact|$))',
-        'it': r'(?:progetti?|portfolio|progetti\s+personali?|progetti\s+paralleli?|progetti\s+accademici?|progetti\s+di\s+lavoro?)\s*:?\s*\n(.*?)(?=\n\s*(?:esperienza|istruzione|competenze|certificazioni|premi|lingue|riferimenti|contatto|$))',
-        'pt': r'(?:projetos?|portfólio|projetos\s+pessoais?|projetos\s+paralelos?|projetos\s+acadêmicos?|projetos\s+de\s+trabalho?)\s*:?\s*\n(.*?)(?=\n\s*(?:experiência|educação|habilidades|certificações|prêmios|idiomas|referências|contato|$))',
-        'zh': r'(?:项目|作品集|个人项目|业余项目|学术项目|工作项目)\s*:?\s*\n(.*?)(?=\n\s*(?:经验|教育|技能|认证|奖项|语言|推荐|联系|$))',
-        'ja': r'(?:プロジェクト|ポートフォリオ|個人プロジェクト|サイドプロジェクト|学術プロジェクト|仕事のプロジェクト)\s*:?\s*\n(.*?)(?=\n\s*(?:経験|教育|スキル|認定|賞|言語|参考|連絡|$))',
-        'ru': r'(?:проекты?|портфолио|личные\s+проекты?|побочные\s+проекты?|академические\s+проекты?|рабочие\s+проекты?)\s*:?\s*\n(.*?)(?=\n\s*(?:опыт|образование|навыки|сертификаты|награды|языки|рекомендации|контакт|$))',
-        'ar': r'(?:مشاريع?|محفظة\s+أعمال|مشاريع\s+شخصية?|مشاريع\s+جانبية?|مشاريع\s+أكاديمية?|مشاريع\s+عمل?)\s*:?\s*\n(.*?)(?=\n\s*(?:خبرة|التعليم|المهارات|الشهادات|الجوائز|اللغات|المراجع|الاتصال|$))'
-    }
-    
-    # Project title and description patterns
-    project_item_patterns = {
-        'en': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Technologies?|Tech Stack|Built with|Using)\s*:?\s*([^\n]+)',
-        'de': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Technologien?|Tech Stack|Erstellt mit|Verwendet)\s*:?\s*([^\n]+)',
-        'es': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Tecnologías?|Stack Tecnológico|Construido con|Usando)\s*:?\s*([^\n]+)',
-        'fr': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Technologies?|Stack Technique|Construit avec|Utilisant)\s*:?\s*([^\n]+)',
-        'it': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Tecnologie?|Stack Tecnologico|Costruito con|Usando)\s*:?\s*([^\n]+)',
-        'pt': r'(?:^|\n)\s*([A-Z][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Tecnologias?|Stack Tecnológico|Construído com|Usando)\s*:?\s*([^\n]+)',
-        'zh': r'(?:^|\n)\s*([^\n]{3,100})\s*(?:\n|$)\s*([^\n]{10,300})(?:\n|$)\s*(?:技术|技术栈|使用技术|开发工具)\s*:?\s*([^\n]+)',
-        'ja': r'(?:^|\n)\s*([^\n]{3,100})\s*(?:\n|$)\s*([^\n]{10,300})(?:\n|$)\s*(?:技術|技術スタック|使用技術|開発ツール)\s*:?\s*([^\n]+)',
-        'ru': r'(?:^|\n)\s*([А-Я][^\n]{5,100})\s*(?:\n|$)\s*([^\n]{20,300})(?:\n|$)\s*(?:Технологии?|Технический стек|Построено с|Используя)\s*:?\s*([^\n]+)',
-        'ar': r'(?:^|\n)\s*([^\n]{3,100})\s*(?:\n|$)\s*([^\n]{10,300})(?:\n|$)\s*(?:التقنيات?|المكدس التقني|مبني باستخدام|باستخدام)\s*:?\s*([^\n]+)'
-    }
-    
-    # Extract projects section
-    section_pattern = project_section_patterns.get(language, project_section_patterns['en'])
-    section_match = re.search(section_pattern, text, re.IGNORECASE | re.DOTALL)
+    # Project entries of the projects section(s) found by the shared segmenter, with offsets into the text
+    project_matches = context.section_entries("projects")
     
-    if section_match:
-        project_text = section_match.group(1)
-        
-        # Extract individual projects
-        item_pattern = project_item_patterns.get(language, project_item_patterns['en'])
-        project_matches = re.findall(item_pattern, project_text, re.IGNORECASE | re.MULTILINE)
-        
+    if project_matches:
         for match in project_matches[:10]:  # Limit to 10 projects
-            title, description, tech_list = match
+            title, description, tech_list = match.groups()
             
-            # Extract technologies from description and tech list
-            combined_text = f"{title} {description} {tech_list}"
-            technologies = hr_analyser_instance._extract_skills_from_text(combined_text)
+            # Technologies occurring in the title, description and tech list
+            technologies = context.skills_at(match.span(1), match.span(2), match.span(3))
             
             # Parse additional technologies from tech list
             tech_items = re.split(r'[,;|\n]', tech_list)
@@ -459,26 +562,20 @@ def extract_projects_ai(text: str, language: str) -> list:
                 "technologies": list(set(technologies))[:20],  # Remove duplicates, limit to 20
                 "tech_stack": tech_list.strip()[:200]
             })
+            context.entry_spans["projects"].append((match.span(1), match.span(2)))
     
     # Fallback: Look for project-like content anywhere in resume
     if not projects:
-        # Universal project patterns
-        universal_patterns = [
-            r'(?:^|\n)\s*([A-Z][^\n]{10,80})\s*(?:\n|$)\s*([^\n]{30,200})\s*(?:\n|$)\s*(?:GitHub|Demo|Live|Link|URL)\s*:?\s*([^\n]+)',
-            r'(?:Built|Developed|Created|Designed|Implemented)\s+([^\n]{10,100})\s*(?:\n|$)\s*([^\n]{20,300})',
-            r'([A-Z][^\n]{5,80})\s*[-–—]\s*([^\n]{20,200})\s*(?:\n|$)\s*(?:Technologies?|Tech|Stack|Tools?)\s*:?\s*([^\n]+)'
-        ]
-        
-        for pattern in universal_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches[:8]:
+        for pattern in pattern_registry.get("projects.universal"):
+            for found in list(pattern.finditer(text))[:8]:
+                match = found.groups()
                 if len(match) >= 2:
                     title = match[0] if match[0] else "Project"
                     description = match[1] if len(match) > 1 else "Project description"
                     tech_info = match[2] if len(match) > 2 else ""
                     
-                    combined_text = f"{title} {description} {tech_info}"
-                    technologies = hr_analyser_instance._extract_skills_from_text(combined_text)
+                    spans = [found.span(group) for group in range(1, len(match) + 1)]
+                    technologies = context.skills_at(*spans)
                     
                     projects.append({
                         "title": title.strip()[:150],
@@ -486,26 +583,41 @@ def extract_projects_ai(text: str, language: str) -> list:
                         "technologies": technologies[:15],
                         "tech_stack": tech_info.strip()[:200]
                     })
+                    context.entry_spans["projects"].append(tuple(spans[:2]))
     
     return projects[:10] if projects else [{
         "title": "Technical Projects", 
         "description": "Project experience found throughout resume", 
-        "technologies": hr_analyser_instance._extract_skills_from_text(text)[:10],
+        "technologies": context.text_skills[:10],
         "tech_stack": "Various technologies"
     }]
 
-def extract_education_ai(text: str, language: str) -> list:
+# Degree and year-range lines; the education section itself comes from the segmenter
+EDUCATION_PATTERNS = [
+    r'(?:b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|ph\.?d\.?|bachelor|master|dr\.|prof\.).*?(?:in|of|en|de|di|em|在|で)\s*([^\n]+)',
+    r'(\d{4})\s*(?:-|to|bis|a|à|a|至|まで)\s*(\d{4})\s*([^\n]+)'
+]
+
+pattern_registry.register("education", {ANY_LANGUAGE: EDUCATION_PATTERNS}, re.IGNORECASE | re.DOTALL)
+
+def extract_education_ai(text: str, language: str, context: Optional[ResumeAnalysisContext] = None) -> list:
     """AI-enhanced education extraction"""
+    context = context or ResumeAnalysisContext(text, language)
     education = []
     
-    edu_patterns = [
-        r'(?:bachelor|master|phd|degree|university|college|education|bachelor|master|promotion|abschluss|universität|hochschule|bildung|licenciatura|maestría|doctorado|grado|universidad|colegio|educación|licence|maîtrise|doctorat|diplôme|université|collège|éducation|laurea|master|dottorato|grado|università|collegio|istruzione|bacharelado|mestrado|doutorado|grau|universidade|faculdade|educação|学士|硕士|博士|学位|大学|学院|教育|学士|修士|博士|学位|大学|大学|教育)(.*?)(?:experience|skills|projects|$)',
-        r'(?:b\.?s\.?|m\.?s\.?|b\.?a\.?|m\.?a\.?|ph\.?d\.?|bachelor|master|dr\.|prof\.).*?(?:in|of|en|de|di|em|在|で)\s*([^\n]+)',
-        r'(\d{4})\s*(?:-|to|bis|a|à|a|至|まで)\s*(\d{4})\s*([^\n]+)'
-    ]
+    # Each education section as a whole, then degree and date lines within it
+    for section in context.sections.get("education")[:3]:
+        section_text = text[section.start:section.end]
+        if len(section_text.strip()) > 5:
+            education.append({
+                "degree": section_text.strip()[:100],
+                "institution": "Institution from resume",
+                "year": "Not specified"
+            })
     
-    for pattern in edu_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE | re.DOTALL)
+    search_text = context.sections.text("education") or text
+    for pattern in pattern_registry.get("education"):
+        matches = pattern.findall(search_text)
         for match in matches[:3]:
             if isinstance(match, tuple):
                 edu_text = ' '.join(match)
@@ -521,9 +633,10 @@ def extract_education_ai(text: str, language: str) -> list:
     
     return education
 
-def analyse_strengths_ai(text: str, language: str) -> list:
+def analyse_strengths_ai(text: str, language: str, context: Optional[ResumeAnalysisContext] = None) -> list:
     """Professional multilingual strength analysis"""
-    skills_data = extract_skills_ai(text, language)
+    context = context or ResumeAnalysisContext(text, language)
+    skills_data = context.skills
     strengths = []
     
     # Multilingual strength templates
@@ -567,9 +680,10 @@ def analyse_strengths_ai(text: str, language: str) -> list:
     
     return strengths or [templates["basic_foundation"]]
 
-def analyse_weaknesses_ai(text: str, language: str) -> list:
+def analyse_weaknesses_ai(text: str, language: str, context: Optional[ResumeAnalysisContext] = None) -> list:
     """Professional multilingual weakness analysis"""
-    skills_data = extract_skills_ai(text, language)
+    context = context or ResumeAnalysisContext(text, language)
+    skills_data = context.skills
     weaknesses = []
     
     # Multilingual weakness templates
@@ -609,12 +723,13 @@ def analyse_weaknesses_ai(text: str, language: str) -> list:
     
     return weaknesses or [templates["well_rounded"]]
 
-def generate_suggestions_ai(text: str, language: str) -> list:
+def generate_suggestions_ai(text: str, language: str, context: Optional[ResumeAnalysisContext] = None) -> list:
     """AI-generated personalized improvement suggestions based on comprehensive resume analysis"""
-    skills_data = extract_skills_ai(text, language)
-    contact_data = extract_contact_ai(text)
-    projects_data = extract_projects_ai(text, language)
-    experience_data = extract_experience_ai(text, language)
+    context = context or ResumeAnalysisContext(text, language)
+    skills_data = context.skills
+    contact_data = context.contact
+    projects_data = context.projects
+    experience_data = context.experience
     
     suggestions = []
     
@@ -773,6 +888,402 @@ def generate_suggestions_ai(text: str, language: str) -> list:
     # Return top 8 most relevant suggestions
     return suggestions[:8]
 
+def process_resume(content: bytes, filename: str, translate_to: Optional[str] = None) -> dict:
+    """Run the full analysis pipeline synchronously (executed inside an analysis worker)"""
+    stages = run_analysis_stages(content, filename, translate_to)
+    return with_section_analysis(stages["response"], stages["sections"])
+
+def run_analysis_stages(content: Optional[Payload], filename: str, translate_to: Optional[str] = None,
+                        text: Optional[str] = None, features: Optional[dict] = None,
+                        section_parts: Optional[Dict[str, dict]] = None, layout: Optional[dict] = None) -> dict:
+    """Run the pipeline stage by stage, skipping any stage whose cached output is supplied
+    
+    section_parts: cached parts of sections (by section key); the parts computed for the
+    other sections are returned under "section_parts" when it is given. layout: the
+    language and segmentation of text from resume_section_keys. "sections" reports
+    which sections this run analysed; it is kept out of the features and the response,
+    which are cached.
+    """
+    # Timings travel back with the result: the worker's clock readings are the only accurate ones
+    timer = StageTimer()
+    new_parts = {}
+    sections = {"recomputed": [], "reused": []}
+    if features is None:
+        if text is None:
+            text = extract_resume_text(content, filename, timer)
+        parts = dict(section_parts) if section_parts is not None else None
+        features = extract_resume_features(text, timer, parts, sections, layout)
+        if parts is not None:
+            new_parts = {key: value for key, value in parts.items() if key not in section_parts}
+    
+    with timer.stage("assemble_response"):
+        response = build_analysis_response(features, translate_to, timer)
+    
+    return {
+        "text": text,
+        "features": features,
+        "response": response,
+        "section_parts": new_parts,
+        "sections": sections,
+        "timings": timer.timings,
+        "fallbacks": timer.fallbacks
+    }
+
+def resume_section_keys(content: Optional[Payload], filename: str, text: Optional[str] = None) -> dict:
+    """The resume text (extracted unless supplied) and its layout: language, sections and the
+    segments whose keys look their parts up; the layout is handed on to run_analysis_stages"""
+    timer = StageTimer()
+    if text is None:
+        text = extract_resume_text(content, filename, timer)
+    with timer.stage("detect_language"):
+        language = resume_language(text)
+    with timer.stage("section_keys"):
+        sections = segment_sections(text)
+        segments = text_segments(sections, language)
+    layout = {"language": language, "sections": sections, "segments": segments}
+    return {"text": text, "layout": layout, "keys": [segment.key for segment in segments], "timings": timer.timings}
+
+def extract_resume_text(content: Optional[Payload], filename: str, timer: StageTimer) -> str:
+    try:
+        with timer.stage("extract_text"), open_payload(content) as data:
+            return prepare_resume_text(data, filename)
+    except ResumeAnalysisError as e:
+        e.timings = timer.timings  # Pickled back with the error so the API process can report them
+        raise
+
+def prepare_resume_text(content, filename: str) -> str:
+    """Extract, validate and bound the resume text"""
+    text = extract_text(content, filename)
+    
+    # Validate extracted text
+    if not text or "Error extracting text" in text or len(text.strip()) < 10:
+        raise ResumeAnalysisError("Could not extract readable text from file")
+    
+    # Sanitize text length (prevent memory issues)
+    if len(text) > MAX_TEXT_CHARS:
+        text = text[:MAX_TEXT_CHARS]
+    
+    return text
+
+# Certification and award lines anywhere in the resume; the sections come from the segmenter
+ACHIEVEMENT_PATTERNS = [
+    r'(?:certified|certification|certificate|zertifiziert|zertifizierung|zertifikat|certificado|certificación|certificado|certifié|certification|certificat|certificato|certificazione|certificato|certificado|certificação|certificado|认证|证书|证明|認定|認証|証明書)[:\s]*([^\n]+)',
+    r'(?:award|recognition|achievement|auszeichnung|anerkennung|erfolg|premio|reconocimiento|logro|prix|reconnaissance|réalisation|premio|riconoscimento|risultato|prêmio|reconhecimento|conquista|奖项|认可|成就|賞|認識|実績)[:\s]*([^\n]+)'
+]
+
+pattern_registry.register("achievements", {ANY_LANGUAGE: ACHIEVEMENT_PATTERNS}, re.IGNORECASE | re.DOTALL)
+
+def resume_language(text: str) -> str:
+    return detect_language(text) if len(text.strip()) > 20 else "en"
+
+def extract_resume_features(text: str, timer: Optional[StageTimer] = None,
+                            section_parts: Optional[Dict[str, dict]] = None,
+                            sections: Optional[Dict[str, List[str]]] = None,
+                            layout: Optional[dict] = None) -> dict:
+    """Run every extractor and analyser over the resume text (independent of request parameters)
+    
+    Sections whose parts are in section_parts are not scanned again; parts of the others
+    are added to it. The kinds of both are added to sections["recomputed"] and
+    sections["reused"] when it is given. A layout from resume_section_keys saves language
+    detection and segmentation.
+    """
+    timer = timer or StageTimer()
+    
+    # Detect language
+    if layout is not None:
+        language = layout["language"]
+    else:
+        with timer.stage("detect_language"):
+            language = resume_language(text)
+    
+    # Every extractor below reads from this context, so each feature is computed once
+    context = ResumeAnalysisContext(text, language, section_parts, layout)
+    with timer.stage("section_parts"):
+        context.segment_parts
+    if sections is not None:
+        sections["recomputed"].extend(context.recomputed)
+        sections["reused"].extend(context.reused)
+    
+    # AI HR-powered comprehensive analysis
+    try:
+        with timer.stage("extract_all_skills_comprehensive"):
+            comprehensive_skills = context.comprehensive_skills
+        with timer.stage("analyse_job_fit_like_hr"):
+            job_matches = hr_analyser_instance.analyse_job_fit_like_hr(text, comprehensive_skills, context.indicator_hits)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        # If AI HR analyser fails, create basic fallback
+        timer.fallback("job_fit")
+        try:
+            # Try direct skill extraction from text
+            fallback_skills = context.text_skills
+            comprehensive_skills = {"all_skills": fallback_skills, "skills_section": [], "project_skills": [], "total_count": len(fallback_skills)}
+            # Create basic job matches
+            job_matches = [{"job_title": "Software Developer", "match_percentage": 50, "matching_skills": fallback_skills[:5], "missing_skills": ["Python", "JavaScript", "SQL"]}]
+        except (AttributeError, KeyError, TypeError):
+            comprehensive_skills = {"all_skills": [], "skills_section": [], "project_skills": [], "total_count": 0}
+            job_matches = []
+    
+    # ATS Analysis with AI precision
+    try:
+        with timer.stage("ats_analysis"):
+            ats_analysis = ats_analyser_instance.analyse_ats_compatibility(text, text_stats=context.ats_stats)
+            ats_issues = ats_analyser_instance.scan_for_ats_issues(text, context.ats_stats)
+    except Exception:
+        # Fallback ATS analysis
+        timer.fallback("ats")
+        ats_analysis = {
+            'ats_score': 75,
+            'keyword_matches': {'matches': {}, 'scores': {}, 'total_score': 0},
+            'format_score': 80,
+            'readability_score': 75,
+            'job_match_score': 0,
+            'recommendations': ['Improve keyword optimization'],
+            'missing_keywords': [],
+            'ats_friendly': True
+        }
+        ats_issues = {'issues_found': 0, 'issues': [], 'ats_friendly': True}
+    
+    # Use AI HR analyser for all skill detection
+    with timer.stage("ai_analyse_resume"):
+        analysis = ai_analyse_resume(text, language, context)
+    
+    # Extract skills from all sections for comprehensive analysis
+    section_skills_start = time.perf_counter()
+    all_extracted_skills = set()
+    
+    # Get skills from AI HR analyser
+    if comprehensive_skills["all_skills"]:
+        all_extracted_skills.update(comprehensive_skills["all_skills"])
+    
+    # Skills of the extracted projects: occurrences inside each entry's title and description
+    project_spans = context.entry_spans["projects"][:len(analysis["projects"])]
+    project_skills = context.skills_at(*[span for entry in project_spans for span in entry])
+    all_extracted_skills.update(project_skills)
+    
+    # Skills of the extracted experience entries, the same way
+    experience_spans = context.entry_spans["experience"][:len(analysis["experience"])]
+    experience_skills = context.skills_at(*[span for entry in experience_spans for span in entry])
+    all_extracted_skills.update(experience_skills)
+    
+    # Skills in the achievements/awards and certifications sections and in achievement lines
+    achievement_spans = context.sections.bounds("achievements", "certifications")
+    for pattern in pattern_registry.get("achievements"):
+        achievement_spans.extend(match.span(1) for match in pattern.finditer(text))
+    
+    if achievement_spans:
+        achievement_skills = context.skills_at(*achievement_spans)
+        all_extracted_skills.update(achievement_skills)
+    
+    # Update analysis with comprehensive skills
+    final_skills = list(all_extracted_skills)
+    analysis["skills"] = {
+        "all": final_skills,
+        "categorized": {
+            "All Skills": final_skills,
+            "From Projects": project_skills,
+            "From Experience": experience_skills,
+            "From Achievements": achievement_skills if achievement_spans else []
+        }
+    }
+    timer.add("section_skills", (time.perf_counter() - section_skills_start) * 1000)
+    
+    return {
+        "language": language,
+        "analysis": analysis,
+        "job_matches": job_matches,
+        "ats_analysis": ats_analysis,
+        "ats_issues": ats_issues
+    }
+
+async def analyse_with_cache(upload: Upload, filename: str, translate_to: Optional[str] = None,
+                             timer: Optional[StageTimer] = None) -> dict:
+    """Serve an analysis from the cache, running only the stages that are not cached yet"""
+    timer = timer or StageTimer()
+    with timer.stage("cache_lookup"):
+        file_key = upload.sha256  # Hashed while the upload was read
+        text, features, response = analysis_cache.lookup(file_key, translate_to)
+    if response is not None:
+        return with_section_analysis(response)
+    
+    if text is None and analysis_cache.persistent:
+        with timer.stage("cache_lookup"):
+            response = await asyncio.to_thread(analysis_cache.load_persisted, file_key, translate_to)
+        if response is not None:
+            return with_section_analysis(response)
+    
+    stages = await run_stages_in_pool(upload, filename, translate_to, text, features, timer)
+    if analysis_cache.persistent:
+        with timer.stage("cache_persist"):
+            await asyncio.to_thread(analysis_cache.persist, file_key, filename, translate_to, stages["response"])
+    
+    return with_section_analysis(stages["response"], stages["sections"])
+
+async def run_stages_in_pool(upload: Upload, filename: str, translate_to: Optional[str], text: Optional[str],
+                             features: Optional[dict], timer: StageTimer) -> dict:
+    """Run the uncached pipeline stages in an analysis worker and cache what they produce"""
+    # Only ship the upload (its bytes, or the path of the spill file) when the text has to be extracted
+    # One slot for both tasks: a request is never turned away after its first task did the extraction
+    with timer.stage("analysis_pool"), analysis_pool.reserve() as slot:
+        try:
+            section_parts = layout = None
+            if features is None and section_cache.enabled:
+                # Key the sections first, so the analysis gets the parts of every section seen before
+                plan = await analysis_pool.run(
+                    resume_section_keys, None if text is not None else upload.payload, filename, text, slot=slot
+                )
+                timer.merge(plan["timings"])
+                text, layout = plan["text"], plan["layout"]
+                section_parts = section_cache.get_many(plan["keys"])
+            stages = await analysis_pool.run(
+                run_analysis_stages, None if text is not None else upload.payload, filename, translate_to, text, features,
+                section_parts, layout, slot=slot
+            )
+        except ResumeAnalysisError as e:
+            timer.merge(getattr(e, "timings", None))
+            raise
+    timer.merge(stages["timings"], stages["fallbacks"])
+    analysis_cache.store(upload.sha256, stages, translate_to)
+    section_cache.store(stages["section_parts"])
+    if features is None and CANDIDATE_INDEX_ENABLED:
+        # Features were computed just now, so this resume has not been indexed yet
+        with timer.stage("candidate_index"):
+            try:
+                await asyncio.to_thread(candidate_index.add, upload.sha256, filename, stages["features"])
+            except sqlite3.Error:
+                timer.fallback("candidate_index")
+    return stages
+
+def analyse_job(content: bytes, filename: str, translate_to: Optional[str], file_key: str) -> dict:
+    """Analyse a queued upload in a job worker process, using the caches like analyse_with_cache
+    
+    The worker is already off the event loop, so the stages run right here rather than in
+    the analysis pool. Its in-memory caches are its own; the persistent tier and the
+    candidate index are shared with the API process through SQLite.
+    """
+    timer = StageTimer()
+    with timer.stage("cache_lookup"):
+        text, features, response = analysis_cache.lookup(file_key, translate_to)
+        if response is None and text is None:
+            response = analysis_cache.load_persisted(file_key, translate_to)
+    if response is not None:
+        return {"response": with_section_analysis(response), "timings": timer.timings, "fallbacks": timer.fallbacks}
+    
+    section_parts = layout = None
+    if features is None and section_cache.enabled:
+        plan = resume_section_keys(None if text is not None else content, filename, text)
+        timer.merge(plan["timings"])
+        text, layout = plan["text"], plan["layout"]
+        section_parts = section_cache.get_many(plan["keys"])
+    stages = run_analysis_stages(
+        None if text is not None else content, filename, translate_to, text, features, section_parts, layout
+    )
+    timer.merge(stages["timings"], stages["fallbacks"])
+    analysis_cache.store(file_key, stages, translate_to)
+    section_cache.store(stages["section_parts"])
+    if analysis_cache.persistent:
+        with timer.stage("cache_persist"):
+            analysis_cache.persist(file_key, filename, translate_to, stages["response"])
+    if features is None and CANDIDATE_INDEX_ENABLED:
+        with timer.stage("candidate_index"):
+            try:
+                candidate_index.add(file_key, filename, stages["features"])
+            except sqlite3.Error:
+                timer.fallback("candidate_index")
+    
+    return {"response": with_section_analysis(stages["response"], stages["sections"]),
+            "timings": timer.timings, "fallbacks": timer.fallbacks}
+
+# Local job worker processes (JOB_WORKERS), each running analyse_job on the jobs it claims
+job_workers = JobWorkers(job_queue, analyse_job, initializer=warm_analysers)
+
+def queue_upload(upload: Upload, filename: str, translate_to: Optional[str], callback_url: Optional[str]) -> Tuple[str, float]:
+    """Store an upload in the job queue (a spilled upload is read back from its file)"""
+    with open_payload(upload.payload) as data:
+        content = data if isinstance(data, bytes) else data.read()
+    return job_queue.submit(filename, content, upload.sha256, translate_to, callback_url)
+
+async def resume_text_with_cache(upload: Upload, filename: str, timer: StageTimer) -> str:
+    """The resume's extracted text: from the cache, or from one pipeline run that also fills it"""
+    with timer.stage("cache_lookup"):
+        text, _, _ = analysis_cache.lookup(upload.sha256, None)
+    if text is not None:
+        return text
+    stages = await run_stages_in_pool(upload, filename, None, None, None, timer)
+    return stages["text"]
+
+async def read_batch_entry(entry: dict, budget: BatchBudget) -> bytes:
+    """Read (or decompress) a batch entry's content, charging it to the batch budget"""
+    source = entry["source"]
+    if isinstance(source, tuple):
+        content = await asyncio.to_thread(read_member, *source)
+    else:
+        content = await source.read(BATCH_MAX_ENTRY_BYTES + 1)
+        check_size(entry["filename"], len(content))
+    budget.charge(len(content))
+    return content
+
+async def analyse_batch_entry(index: int, entry: dict, translate_to: Optional[str], budget: BatchBudget) -> dict:
+    """Analyse one resume of a batch and describe the outcome as an NDJSON record"""
+    record = {"index": index, "filename": entry["filename"]}
+    if entry["error"]:
+        metrics.inc("errors_total", kind="invalid_file")
+        record.update(status="error", error=entry["error"])
+        return record
+    
+    timer = StageTimer()
+    try:
+        async with batch_slots:
+            # Read inside the slot, so only the entries being analysed are held in memory
+            try:
+                content = await read_batch_entry(entry, budget)
+            except EntryError as e:
+                metrics.inc("errors_total", kind="invalid_file")
+                record.update(status="error", error=str(e))
+                return record
+            metrics.observe("upload_size_bytes", len(content))
+            for attempt in range(5):
+                try:
+                    result = await analyse_with_cache(Upload.from_bytes(content), entry["filename"], translate_to, timer)
+                    break
+                except PoolSaturatedError:
+                    # Interactive traffic filled the queue; back off instead of failing the entry
+                    if attempt == 4:
+                        raise
+                    await asyncio.sleep(0.25 * 2 ** attempt)
+        record.update(status="ok", result=result)
+    except ResumeAnalysisError as e:
+        metrics.inc("errors_total", kind="unreadable")
+        record.update(status="error", error=e.detail)
+    except PoolSaturatedError:
+        metrics.inc("errors_total", kind="busy")
+        record.update(status="error", error="Server busy: analysis queue is full, please retry shortly")
+    except AnalysisTimeoutError:
+        metrics.inc("errors_total", kind="timeout")
+        record.update(status="error", error="Analysis timed out, please retry")
+    except Exception:
+        metrics.inc("errors_total", kind="internal")
+        record.update(status="error", error="Error processing file: Unable to analyse resume")
+    finally:
+        metrics.record_stages(timer)
+    return record
+
+async def stream_batch_results(entries: List[dict], translate_to: Optional[str], archives: List = ()):
+    """Yield one NDJSON line per entry in completion order"""
+    budget = BatchBudget()
+    tasks = [asyncio.create_task(analyse_batch_entry(index, entry, translate_to, budget))
+             for index, entry in enumerate(entries)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            record = await next_done
+            yield dumps(record) + b"\n"
+    finally:
+        # Client disconnected (or we are done): drop whatever has not started yet
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for archive in archives:
+            archive.close()
+
 @app.get("/")
 async def root():
     return {"message": "AI-Powered Resume Analyser API"}
@@ -781,358 +1292,323 @@ async def root():
 async def health_check():
     return {"status": "healthy", "service": "resume-analyzer-api"}
 
+@app.get("/metrics")
+async def prometheus_metrics():
+    # Reflects this process; worker timings are recorded here when their results come back
+    metrics.set("job_workers", job_workers.alive())
+    try:
+        # Queue depth is read from the database, so it counts the jobs of every API process
+        await asyncio.to_thread(job_queue.record_metrics)
+    except sqlite3.Error:
+        pass
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/api/cache/stats")
+async def cache_stats():
+    return {**analysis_cache.stats(), "job_descriptions": job_description_cache.stats(), "sections": section_cache.stats()}
+
+@app.get("/api/patterns/stats")
+async def pattern_stats():
+    # Reflects this process; pool workers compile and count their own copies
+    return pattern_registry.stats()
+
+@app.get("/api/candidates/search")
+async def search_candidates(q: Optional[str] = None, skills: Optional[str] = None, require: Optional[str] = None,
+                            exclude: Optional[str] = None, top: int = 10):
+    """Best-matching analysed candidates for a job description and/or weighted skills"""
+    if not CANDIDATE_INDEX_ENABLED:
+        raise HTTPException(status_code=404, detail="Candidate search is disabled")
+    if not 1 <= top <= MAX_TOP_K:
+        raise HTTPException(status_code=400, detail=f"top must be between 1 and {MAX_TOP_K}")
+    if q and len(q) > MAX_JOB_DESCRIPTION_CHARS:
+        raise HTTPException(status_code=400, detail=f"Job description too long. Maximum {MAX_JOB_DESCRIPTION_CHARS} characters")
+    
+    timer = StageTimer()
+    # Skills from a pasted job description (cached like /api/ats-match), then explicit ones (e.g. "python:2,django")
+    with timer.stage("parse_query"):
+        try:
+            weights = {skill.lower(): 1.0 for skill in job_description_cache.get(q).skills} if q else {}
+            weights.update(parse_skills(skills, weighted=True))
+            required = parse_skills(require)
+            excluded = parse_skills(exclude)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if not weights and not required:
+        raise HTTPException(status_code=400, detail="Provide a job description (q), skills or required skills")
+    
+    try:
+        with timer.stage("candidate_search"):
+            result = await asyncio.to_thread(candidate_index.search, weights, required, excluded, top)
+    except sqlite3.Error:
+        metrics.inc("errors_total", kind="internal")
+        raise HTTPException(status_code=500, detail="Candidate index unavailable")
+    
+    body = dumps({
+        "total_candidates": result.total,
+        "evaluated": result.evaluated,
+        "query": {"skills": weights, "required": sorted(required), "excluded": sorted(excluded)},
+        "results": [
+            {**candidate_index.candidates[candidate_id], "score": round(score, 4), "matched_skills": matched}
+            for candidate_id, score, matched in result.hits
+        ]
+    })
+    return Response(body, media_type="application/json", headers={"Server-Timing": timer.server_timing()})
+
 @app.post("/api/analyse-resume")
-async def analyse_resume(file: UploadFile = File(...), translate_to: Optional[str] = None):
+async def analyse_resume(file: UploadFile = File(...), translate_to: Optional[str] = None,
+                         fields: Optional[str] = None):
     # Input validation
     if not file.filename or not file.filename.lower().endswith(('.pdf', '.docx')):
         raise HTTPException(status_code=400, detail="Only PDF and DOCX files supported")
     
-    # File size validation (10MB limit)
-    if file.size and file.size > 10 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="File size too large. Maximum 10MB allowed")
+    # Comma-separated top-level sections to return, e.g. fields=compatibility_score,ats_analysis
+    try:
+        selected_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # File size validation (MAX_UPLOAD_MB, 10MB by default); also enforced while reading
+    if file.size and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=400, detail=f"File size too large. Maximum {MAX_UPLOAD_BYTES // (1024 * 1024)}MB allowed")
     
     # Validate translate_to parameter
     if translate_to and translate_to not in ['en', 'de', 'es', 'fr', 'it', 'pt', 'zh', 'ja']:
         raise HTTPException(status_code=400, detail="Invalid translation language")
     
+    timer = StageTimer()
+    upload = None
     try:
-        content = await file.read()
-        text = extract_text(content, file.filename)
-        
-        # Validate extracted text
-        if not text or "Error extracting text" in text or len(text.strip()) < 10:
-            raise HTTPException(status_code=400, detail="Could not extract readable text from file")
-        
-        # Sanitize text length (prevent memory issues)
-        if len(text) > 100000:  # 100KB limit
-            text = text[:100000]
-        
-        # Detect language
-        try:
-            language = detect(text) if len(text.strip()) > 20 else "en"
-        except:
-            language = "en"
-        
-        # AI HR-powered comprehensive analysis
-        try:
-            comprehensive_skills = hr_analyser_instance.extract_all_skills_comprehensive(text)
-            job_matches = hr_analyser_instance.analyse_job_fit_like_hr(text, comprehensive_skills)
-        except (AttributeError, KeyError, TypeError, ValueError):
-            # If AI HR analyser fails, create basic fallback
-            try:
-                # Try direct skill extraction from text
-                fallback_skills = hr_analyser_instance._extract_skills_from_text(text)
-                comprehensive_skills = {"all_skills": fallback_skills, "skills_section": [], "project_skills": [], "total_count": len(fallback_skills)}
-                # Create basic job matches
-                job_matches = [{"job_title": "Software Developer", "match_percentage": 50, "matching_skills": fallback_skills[:5], "missing_skills": ["Python", "JavaScript", "SQL"]}]
-            except (AttributeError, KeyError, TypeError):
-                comprehensive_skills = {"all_skills": [], "skills_section": [], "project_skills": [], "total_count": 0}
-                job_matches = []
-        
-        # ATS Analysis with AI precision
+        with timer.stage("read_upload"):
+            upload = await read_upload(file)
+        metrics.observe("upload_size_bytes", upload.size)
+        result = await analyse_with_cache(upload, file.filename, translate_to, timer)
+        # The cache holds the full response; selection only trims what is serialized
+        with timer.stage("serialize"):
+            body = dumps(select_fields(result, selected_fields))
+        # Already JSON: skip FastAPI's jsonable_encoder pass over the whole response
+        return Response(body, media_type="application/json", headers={"Server-Timing": timer.server_timing()})
+    
+    except UploadTooLarge as e:
+        metrics.inc("errors_total", kind="too_large")
+        raise HTTPException(status_code=400, detail=str(e))
+    except ResumeAnalysisError as e:
+        metrics.inc("errors_total", kind="unreadable")
+        raise HTTPException(status_code=400, detail=e.detail, headers={"Server-Timing": timer.server_timing()})
+    except PoolSaturatedError:
+        metrics.inc("errors_total", kind="busy")
+        raise HTTPException(status_code=503, detail="Server busy: analysis queue is full, please retry shortly")
+    except AnalysisTimeoutError:
+        metrics.inc("errors_total", kind="timeout")
+        raise HTTPException(status_code=504, detail="Analysis timed out, please retry")
+    except Exception:
+        metrics.inc("errors_total", kind="internal")
+        raise HTTPException(status_code=500, detail="Error processing file: Unable to analyse resume")
+    finally:
+        if upload is not None:
+            upload.close()
+        metrics.record_stages(timer)
+
+@app.post("/api/jobs", status_code=202)
+async def submit_job(file: UploadFile = File(...), translate_to: Optional[str] = None,
+                     callback_url: Optional[str] = None):
+    """Queue a resume for analysis and return its job id at once; poll GET /api/jobs/{job_id}"""
+    if not file.filename or not file.filename.lower().endswith(('.pdf', '.docx')):
+        raise HTTPException(status_code=400, detail="Only PDF and DOCX files supported")
+    
+    if file.size and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=400, detail=f"File size too large. Maximum {MAX_UPLOAD_BYTES // (1024 * 1024)}MB allowed")
+    
+    if translate_to and translate_to not in ['en', 'de', 'es', 'fr', 'it', 'pt', 'zh', 'ja']:
+        raise HTTPException(status_code=400, detail="Invalid translation language")
+    
+    # The result is POSTed here when the job finishes
+    if callback_url:
         try:
-            ats_analysis = ats_analyser_instance.analyse_ats_compatibility(text)
-            ats_issues = ats_analyser_instance.scan_for_ats_issues(text)
-        except Exception:
-            # Fallback ATS analysis
-            ats_analysis = {
-                'ats_score': 75,
-                'keyword_matches': {'matches': {}, 'scores': {}, 'total_score': 0},
-                'format_score': 80,
-                'readability_score': 75,
-                'job_match_score': 0,
-                'recommendations': ['Improve keyword optimization'],
-                'missing_keywords': [],
-                'ats_friendly': True
-            }
-            ats_issues = {'issues_found': 0, 'issues': [], 'ats_friendly': True}
-        
-        # Use AI HR analyser for all skill detection
-        analysis = ai_analyse_resume(text, language)
-        
-        # Extract skills from all sections for comprehensive analysis
-        all_extracted_skills = set()
-        
-        # Get skills from AI HR analyser
-        if comprehensive_skills["all_skills"]:
-            all_extracted_skills.update(comprehensive_skills["all_skills"])
-        
-        # Extract skills from projects section
-        project_text = "\n".join([p["title"] + " " + p["description"] for p in analysis["projects"]])
-        project_skills = hr_analyser_instance._extract_skills_from_text(project_text)
-        all_extracted_skills.update(project_skills)
-        
-        # Extract skills from experience section
-        experience_text = "\n".join([e["title"] + " " + e["description"] for e in analysis["experience"]])
-        experience_skills = hr_analyser_instance._extract_skills_from_text(experience_text)
-        all_extracted_skills.update(experience_skills)
-        
-        # Extract skills from achievements/awards section
-        achievement_patterns = [
-            r'(?:achievements?|awards?|accomplishments?|honors?|erfolge|auszeichnungen|leistungen|ehren|logros|premios|logros|honores|réalisations|prix|accomplissements|honneurs|risultati|premi|realizzazioni|onori|conquistas|prêmios|realizações|honras|成就|奖项|成绩|荣誉|実績|賞|成果|栄誉)(.*?)(?:experience|education|skills|projects|$)',
-            r'(?:certified|certification|certificate|zertifiziert|zertifizierung|zertifikat|certificado|certificación|certificado|certifié|certification|certificat|certificato|certificazione|certificato|certificado|certificação|certificado|认证|证书|证明|認定|認証|証明書)[:\s]*([^\n]+)',
-            r'(?:award|recognition|achievement|auszeichnung|anerkennung|erfolg|premio|reconocimiento|logro|prix|reconnaissance|réalisation|premio|riconoscimento|risultato|prêmio|reconhecimento|conquista|奖项|认可|成就|賞|認識|実績)[:\s]*([^\n]+)'
-        ]
-        
-        achievement_text = ""
-        for pattern in achievement_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.DOTALL)
-            for match in matches:
-                achievement_text += str(match) + " "
-        
-        if achievement_text:
-            achievement_skills = hr_analyser_instance._extract_skills_from_text(achievement_text)
-            all_extracted_skills.update(achievement_skills)
-        
-        # Update analysis with comprehensive skills
-        final_skills = list(all_extracted_skills)
-        analysis["skills"] = {
-            "all": final_skills,
-            "categorized": {
-                "All Skills": final_skills,
-                "From Projects": project_skills,
-                "From Experience": experience_skills,
-                "From Achievements": achievement_skills if achievement_text else []
-            }
-        }
-        
-        # Calculate overall compatibility score
-        compatibility_score = job_matches[0]["match_percentage"] if job_matches else 50
-        
-        # Simple skill recommendations
-        skill_recommendations = []
-        for job in job_matches[:3]:
-            missing_skills = job.get("missing_skills", [])
-            if missing_skills:
-                skill_recommendations.append({
-                    "job_title": job["job_title"],
-                    "priority_skills": missing_skills[:3],
-                    "current_match": job["match_percentage"],
-                    "projected_improvement": min(job["match_percentage"] + 15, 95)
-                })
+            await asyncio.to_thread(check_callback_url, callback_url)  # Resolves the host
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    upload = None
+    try:
+        upload = await read_upload(file)
+        metrics.observe("upload_size_bytes", upload.size)
+        job_id, created_at = await asyncio.to_thread(queue_upload, upload, file.filename, translate_to, callback_url)
+    except UploadTooLarge as e:
+        metrics.inc("errors_total", kind="too_large")
+        raise HTTPException(status_code=400, detail=str(e))
+    except JobQueueFull:
+        metrics.inc("errors_total", kind="busy")
+        raise HTTPException(status_code=503, detail="Server busy: analysis job queue is full, please retry shortly")
+    except sqlite3.Error:
+        metrics.inc("errors_total", kind="internal")
+        raise HTTPException(status_code=500, detail="Job queue unavailable")
+    finally:
+        if upload is not None:
+            upload.close()
+    
+    metrics.inc("jobs_total", event="submitted")
+    job_workers.notify()
+    status_url = f"/api/jobs/{job_id}"
+    body = dumps({"job_id": job_id, "status": "queued", "created_at": created_at, "status_url": status_url})
+    return Response(body, status_code=202, media_type="application/json", headers={"Location": status_url})
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str, fields: Optional[str] = None):
+    """A job's status and, once it is done, its analysis (shaped like POST /api/analyse-resume) as result"""
+    try:
+        selected_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if not re.fullmatch(r"[0-9a-f]{32}", job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    try:
+        job = await asyncio.to_thread(job_queue.get, job_id)
+    except sqlite3.Error:
+        metrics.inc("errors_total", kind="internal")
+        raise HTTPException(status_code=500, detail="Job queue unavailable")
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    status = {
+        "job_id": job["id"],
+        "status": job["status"],
+        "filename": job["filename"],
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "attempts": job["attempts"]
+    }
+    if job["started_at"] is not None:
+        status["wait_seconds"] = round(job["started_at"] - job["created_at"], 3)
+    if job["status"] == "queued":
+        status["queue_position"] = job["queue_position"]
+    if job["callback_url"]:
+        status["callback"] = job["callback_status"] or "pending"
+    if job["status"] == "failed":
+        status["error"] = job["error"]
+    if job["status"] != "done":
+        return Response(dumps(status), media_type="application/json")
+    
+    if selected_fields is None:
+        # The stored result is already JSON: splice it in rather than parse and re-serialize it
+        body = dumps(status)[:-1] + b',"result":' + job["result"].encode("utf-8") + b"}"
+    else:
+        body = dumps({**status, "result": select_fields(json.loads(job["result"]), selected_fields)})
+    return Response(body, media_type="application/json")
+
+@app.post("/api/ats-match")
+async def ats_match(file: UploadFile = File(...), job_descriptions: List[str] = Form(...),
+                    top: Optional[int] = None):
+    """Score one resume against one or many job descriptions (repeated job_descriptions fields)"""
+    if not file.filename or not file.filename.lower().endswith(('.pdf', '.docx')):
+        raise HTTPException(status_code=400, detail="Only PDF and DOCX files supported")
+    
+    if len(job_descriptions) > MAX_JOB_DESCRIPTIONS:
+        raise HTTPException(status_code=400, detail=f"Too many job descriptions. Maximum {MAX_JOB_DESCRIPTIONS} per request")
+    for index, job_description in enumerate(job_descriptions):
+        if not job_description.strip():
+            raise HTTPException(status_code=400, detail=f"Job description {index} is empty")
+        if len(job_description) > MAX_JOB_DESCRIPTION_CHARS:
+            raise HTTPException(status_code=400, detail=f"Job description {index} too long. Maximum {MAX_JOB_DESCRIPTION_CHARS} characters")
+    
+    if top is not None and top < 1:
+        raise HTTPException(status_code=400, detail="top must be a positive integer")
+    
+    if file.size and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=400, detail=f"File size too large. Maximum {MAX_UPLOAD_BYTES // (1024 * 1024)}MB allowed")
+    
+    timer = StageTimer()
+    upload = None
+    try:
+        with timer.stage("read_upload"):
+            upload = await read_upload(file)
+        metrics.observe("upload_size_bytes", upload.size)
+        # One resume extraction (usually a cache hit after the first analysis of this file)...
+        text = await resume_text_with_cache(upload, file.filename, timer)
+        # ...each job description tokenized and skill-matched only the first time it is seen...
+        with timer.stage("job_descriptions"):
+            jobs = await asyncio.to_thread(job_description_cache.get_many, job_descriptions)
+        # ...then one cheap comparison per job description
+        with timer.stage("ats_match"):
+            result = await asyncio.to_thread(ats_analyser_instance.match_job_descriptions, text, jobs)
         
-        # Professional multilingual translation
-        def translate_response_to_language(response_data, target_language):
-            if target_language == "en":
-                return response_data
+        result["matches"].sort(key=lambda match: (-match["score"], match["index"]))
+        result["job_count"] = len(jobs)
+        if top is not None:
+            result["matches"] = result["matches"][:top]
+        with timer.stage("serialize"):
+            body = dumps(result)
+        return Response(body, media_type="application/json", headers={"Server-Timing": timer.server_timing()})
+    
+    except UploadTooLarge as e:
+        metrics.inc("errors_total", kind="too_large")
+        raise HTTPException(status_code=400, detail=str(e))
+    except ResumeAnalysisError as e:
+        metrics.inc("errors_total", kind="unreadable")
+        raise HTTPException(status_code=400, detail=e.detail, headers={"Server-Timing": timer.server_timing()})
+    except PoolSaturatedError:
+        metrics.inc("errors_total", kind="busy")
+        raise HTTPException(status_code=503, detail="Server busy: analysis queue is full, please retry shortly")
+    except AnalysisTimeoutError:
+        metrics.inc("errors_total", kind="timeout")
+        raise HTTPException(status_code=504, detail="Analysis timed out, please retry")
+    except Exception:
+        metrics.inc("errors_total", kind="internal")
+        raise HTTPException(status_code=500, detail="Error matching resume: Unable to analyse resume")
+    finally:
+        if upload is not None:
+            upload.close()
+        metrics.record_stages(timer)
+
+@app.post("/api/analyse-resumes")
+async def analyse_resumes(files: List[UploadFile] = File(...), translate_to: Optional[str] = None):
+    # Validate translate_to parameter
+    if translate_to and translate_to not in ['en', 'de', 'es', 'fr', 'it', 'pt', 'zh', 'ja']:
+        raise HTTPException(status_code=400, detail="Invalid translation language")
+    
+    # Entries are only listed here; each is read (or decompressed) when it is analysed
+    entries, archives = [], []
+    try:
+        for file in files:
+            filename = file.filename or ""
+            remaining = BATCH_MAX_FILES - len(entries)
+            if remaining <= 0:
+                raise HTTPException(status_code=400, detail=f"Too many files. Maximum {BATCH_MAX_FILES} per batch")
             
-            try:
-                # Translate job titles
-                for job in response_data.get("job_matches", []):
-                    job["job_title"] = translate_text(job["job_title"], target_language)
-                
-                # Translate strengths and weaknesses
-                if "analysis" in response_data:
-                    response_data["analysis"]["strengths"] = [translate_text(s, target_language) for s in response_data["analysis"]["strengths"]]
-                    response_data["analysis"]["weaknesses"] = [translate_text(w, target_language) for w in response_data["analysis"]["weaknesses"]]
-                
-                # Translate suggestions
-                response_data["suggestions"] = [translate_text(s, target_language) for s in response_data["suggestions"]]
-                
-                # Translate skill recommendations
-                for rec in response_data.get("skill_recommendations", []):
-                    rec["job_title"] = translate_text(rec["job_title"], target_language)
-                
-            except (KeyError, AttributeError, TypeError):
-                pass  # Keep original if translation fails
+            if filename.lower().endswith('.zip'):
+                if file.size and file.size > BATCH_MAX_ARCHIVE_BYTES:
+                    raise HTTPException(status_code=400, detail="ZIP archive too large")
+                try:
+                    upload = await read_upload(file, BATCH_MAX_ARCHIVE_BYTES)
+                except UploadTooLarge:
+                    raise HTTPException(status_code=400, detail="ZIP archive too large")
+                try:
+                    # A spilled archive is opened by path; the open file outlives the unlinked spill file
+                    source = io.BytesIO(upload.payload) if not upload.spilled else upload.payload
+                    archive, archive_entries = await asyncio.to_thread(expand_archive, source, filename, remaining)
+                finally:
+                    upload.close()
+                if archive is not None:
+                    archives.append(archive)
+                entries.extend(archive_entries)
+                continue
             
-            return response_data
-        
-        # Create professional response with prominent project and contact display
-        response = {
-            "extracted_data": {
-                "name": analysis["name"],
-                "language": language,
-                "skills": analysis["skills"]["all"],
-                "projects": analysis["projects"],
-                "experience": analysis["experience"],
-                "education": analysis["education"],
-                "contact_info": {
-                    "email": analysis["contact"].get("email", ""),
-                    "phone": analysis["contact"].get("phone", ""),
-                    "linkedin": analysis["contact"].get("linkedin", ""),
-                    "github": analysis["contact"].get("github", ""),
-                    "website": analysis["contact"].get("website", ""),
-                    "twitter": analysis["contact"].get("twitter", ""),
-                    "instagram": analysis["contact"].get("instagram", ""),
-                    "behance": analysis["contact"].get("behance", "")
-                }
-            },
-            "projects_summary": {
-                "total_projects": len(analysis["projects"]),
-                "project_list": [{
-                    "title": p["title"],
-                    "description": p["description"][:100] + "..." if len(p["description"]) > 100 else p["description"],
-                    "technologies_used": p["technologies"]
-                } for p in analysis["projects"]]
-            },
-            "professional_links": {
-                "linkedin_profile": analysis["contact"].get("linkedin", ""),
-                "github_profile": analysis["contact"].get("github", ""),
-                "portfolio_website": analysis["contact"].get("website", ""),
-                "has_linkedin": bool(analysis["contact"].get("linkedin")),
-                "has_github": bool(analysis["contact"].get("github")),
-                "has_portfolio": bool(analysis["contact"].get("website"))
-            },
-            "analysis": {
-                "strengths": analysis["strengths"],
-                "weaknesses": analysis["weaknesses"],
-                "skill_analysis": {
-                    "total_skills": len(analysis["skills"]["all"]),
-                    "diversity_score": min(len(analysis["skills"]["all"]) * 3, 100),
-                    "categorized_skills": analysis["skills"]["categorized"],
-                    "skills_breakdown": {
-                        "from_projects": len(analysis["skills"]["categorized"].get("From Projects", [])),
-                        "from_experience": len(analysis["skills"]["categorized"].get("From Experience", [])),
-                        "from_achievements": len(analysis["skills"]["categorized"].get("From Achievements", []))
-                    }
-                }
-            },
-            "job_matches": job_matches,
-            "detected_categories": [{
-                "category": "Technology",
-                "confidence": float(compatibility_score),
-                "match_strength": "Strong" if compatibility_score > 70 else "Moderate" if compatibility_score > 40 else "Weak"
-            }],
-            "compatibility_score": compatibility_score,
-            "suggestions": analysis["suggestions"],
-            "improvement_recommendations": {
-                "priority_level": "high" if len(analysis["suggestions"]) > 6 else "medium" if len(analysis["suggestions"]) > 3 else "low",
-                "total_suggestions": len(analysis["suggestions"]),
-                "categories": {
-                    "technical_skills": [s for s in analysis["suggestions"] if any(word in s.lower() for word in ['skill', 'learn', 'technology', 'certification'])],
-                    "professional_presence": [s for s in analysis["suggestions"] if any(word in s.lower() for word in ['linkedin', 'github', 'portfolio', 'website', 'network'])],
-                    "content_enhancement": [s for s in analysis["suggestions"] if any(word in s.lower() for word in ['project', 'metric', 'achievement', 'description', 'keyword'])],
-                    "career_development": [s for s in analysis["suggestions"] if any(word in s.lower() for word in ['leadership', 'learning', 'open source', 'contribution'])]
-                },
-                "implementation_timeline": {
-                    "immediate": [s for s in analysis["suggestions"][:3]],
-                    "short_term": [s for s in analysis["suggestions"][3:6]],
-                    "long_term": [s for s in analysis["suggestions"][6:]]
-                }
-            },
-            "skill_recommendations": skill_recommendations,
-            "detailed_projects": analysis["projects"],
-            "contact_links": {
-                "linkedin": analysis["contact"].get("linkedin", ""),
-                "github": analysis["contact"].get("github", ""),
-                "website": analysis["contact"].get("website", ""),
-                "email": analysis["contact"].get("email", "")
-            },
-            "ats_analysis": {
-                "ats_score": ats_analysis['ats_score'],
-                "ats_friendly": ats_analysis['ats_friendly'],
-                "keyword_optimization": {
-                    "technical_keywords": len(ats_analysis['keyword_matches']['matches'].get('technical', [])),
-                    "soft_skill_keywords": len(ats_analysis['keyword_matches']['matches'].get('soft_skills', [])),
-                    "experience_keywords": len(ats_analysis['keyword_matches']['matches'].get('experience', [])),
-                    "total_keyword_score": ats_analysis['keyword_matches']['total_score']
-                },
-                "format_analysis": {
-                    "format_score": ats_analysis['format_score'],
-                    "readability_score": ats_analysis['readability_score'],
-                    "parsing_issues": ats_issues['issues_found'],
-                    "issues_list": ats_issues['issues']
-                },
-                "ats_recommendations": ats_analysis['recommendations'],
-                "missing_keywords": ats_analysis['missing_keywords'][:8],
-                "compatibility_rating": "Excellent" if ats_analysis['ats_score'] >= 85 else "Good" if ats_analysis['ats_score'] >= 70 else "Needs Improvement" if ats_analysis['ats_score'] >= 50 else "Poor"
-            }
-        }
-        
-        # Translate response to detected language for native experience
-        response = translate_response_to_language(response, language)
+            entries.append(batch_entry(filename, file, check_entry(filename, file.size or 0), file.size or 0))
         
-        # Add English translation option for international use
-        if translate_to == "en" and language != "en":
-            english_response = {
-                "extracted_data": {
-                    "name": analysis["name"],
-                    "language": language,
-                    "skills": analysis["skills"]["all"],
-                    "projects": analysis["projects"],
-                    "experience": analysis["experience"],
-                    "education": analysis["education"],
-                    "contact_info": {
-                        "email": analysis["contact"].get("email", ""),
-                        "phone": analysis["contact"].get("phone", ""),
-                        "linkedin": analysis["contact"].get("linkedin", ""),
-                        "github": analysis["contact"].get("github", ""),
-                        "website": analysis["contact"].get("website", ""),
-                        "twitter": analysis["contact"].get("twitter", ""),
-                        "instagram": analysis["contact"].get("instagram", ""),
-                        "behance": analysis["contact"].get("behance", "")
-                    }
-                },
-                "projects_summary": {
-                    "total_projects": len(analysis["projects"]),
-                    "project_list": [{
-                        "title": p["title"],
-                        "description": p["description"][:100] + "..." if len(p["description"]) > 100 else p["description"],
-                        "technologies_used": p["technologies"]
-                    } for p in analysis["projects"]]
-                },
-                "professional_links": {
-                    "linkedin_profile": analysis["contact"].get("linkedin", ""),
-                    "github_profile": analysis["contact"].get("github", ""),
-                    "portfolio_website": analysis["contact"].get("website", ""),
-                    "has_linkedin": bool(analysis["contact"].get("linkedin")),
-                    "has_github": bool(analysis["contact"].get("github")),
-                    "has_portfolio": bool(analysis["contact"].get("website"))
-                },
-                "analysis": {
-                    "strengths": [translate_to_english(s, language) for s in analysis["strengths"]],
-                    "weaknesses": [translate_to_english(w, language) for w in analysis["weaknesses"]],
-                    "skill_analysis": {
-                        "total_skills": len(analysis["skills"]["all"]),
-                        "diversity_score": min(len(analysis["skills"]["all"]) * 3, 100),
-                        "categorized_skills": analysis["skills"]["categorized"]
-                    }
-                },
-                "job_matches": [{**job, "job_title": translate_to_english(job["job_title"], language)} for job in job_matches],
-                "detected_categories": response["detected_categories"],
-                "compatibility_score": compatibility_score,
-                "suggestions": [translate_to_english(s, language) for s in analysis["suggestions"]],
-                "skill_recommendations": [{**rec, "job_title": translate_to_english(rec["job_title"], language)} for rec in skill_recommendations],
-                "detailed_projects": analysis["projects"],
-                "contact_links": {
-                    "linkedin": analysis["contact"].get("linkedin", ""),
-                    "github": analysis["contact"].get("github", ""),
-                    "website": analysis["contact"].get("website", ""),
-                    "email": analysis["contact"].get("email", "")
-                },
-                "ats_analysis": {
-                    "ats_score": ats_analysis['ats_score'],
-                    "ats_friendly": ats_analysis['ats_friendly'],
-                    "keyword_optimization": {
-                        "technical_keywords": len(ats_analysis['keyword_matches']['matches'].get('technical', [])),
-                        "soft_skill_keywords": len(ats_analysis['keyword_matches']['matches'].get('soft_skills', [])),
-                        "experience_keywords": len(ats_analysis['keyword_matches']['matches'].get('experience', [])),
-                        "total_keyword_score": ats_analysis['keyword_matches']['total_score']
-                    },
-                    "format_analysis": {
-                        "format_score": ats_analysis['format_score'],
-                        "readability_score": ats_analysis['readability_score'],
-                        "parsing_issues": ats_issues['issues_found'],
-                        "issues_list": ats_issues['issues']
-                    },
-                    "ats_recommendations": ats_analysis['recommendations'],
-                    "missing_keywords": ats_analysis['missing_keywords'][:8],
-                    "compatibility_rating": "Excellent" if ats_analysis['ats_score'] >= 85 else "Good" if ats_analysis['ats_score'] >= 70 else "Needs Improvement" if ats_analysis['ats_score'] >= 50 else "Poor"
-                },
-                "translated_to": "en",
-                "original_language": language
-            }
-            return english_response
-        
-        return response
-    
-    except HTTPException:
+        if not entries:
+            raise HTTPException(status_code=400, detail="No resumes found in upload")
+        # Declared sizes first; the bytes actually read are charged again as entries are analysed
+        if sum(entry["size"] for entry in entries if not entry["error"]) > BATCH_MAX_TOTAL_BYTES:
+            raise HTTPException(status_code=400, detail=batch_too_large())
+    except BaseException:
+        for archive in archives:
+            archive.close()
         raise
-    except Exception:
-        raise HTTPException(status_code=500, detail="Error processing file: Unable to analyse resume")
+    
+    return StreamingResponse(stream_batch_results(entries, translate_to, archives), media_type="application/x-ndjson")
 
 if __name__ == "__main__":
-    import os
+    import uvicorn
     port = int(os.environ.get("PORT", 8000))
     uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
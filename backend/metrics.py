@@ -0,0 +1,165 @@
+"""
+Pipeline stage timing and Prometheus text-format metrics
+
+StageTimer records how long each pipeline stage takes with time.perf_counter (monotonic,
+about 100 ns per reading). It is a plain dict of milliseconds, so a timer filled in an
+analysis worker travels back to the API process inside the run_analysis_stages result.
+The API process folds those timings into the process-wide MetricsRegistry, which
+/metrics renders in the Prometheus text exposition format.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Seconds; pipeline stages range from microseconds (language detection) to seconds (large PDFs)
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Bytes, up to the 10 MB upload limit
+SIZE_BUCKETS = (1024, 10 * 1024, 50 * 1024, 100 * 1024, 250 * 1024, 500 * 1024,
+                1024 * 1024, 2 * 1024 * 1024, 5 * 1024 * 1024, 10 * 1024 * 1024)
+# Seconds a queued job waits for a worker: instant when idle, minutes under a backlog
+JOB_WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+class StageTimer:
+    """Milliseconds spent per stage plus the stages that fell back to default output"""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self.fallbacks: List[str] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+
+    def add(self, name: str, milliseconds: float):
+        # A stage entered twice (e.g. per batch entry) accumulates
+        self.timings[name] = self.timings.get(name, 0.0) + milliseconds
+
+    def fallback(self, name: str):
+        self.fallbacks.append(name)
+
+    def merge(self, timings: Optional[Dict[str, float]], fallbacks: Sequence[str] = ()):
+        """Fold in timings measured elsewhere (e.g. in an analysis worker)"""
+        for name, milliseconds in (timings or {}).items():
+            self.add(name, milliseconds)
+        self.fallbacks.extend(fallbacks)
+
+    def server_timing(self) -> str:
+        """Value of the Server-Timing response header"""
+        return ", ".join(f"{name};dur={milliseconds:.3f}" for name, milliseconds in self.timings.items())
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{key}="{_escape(value)}"' for key, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self.total = 0.0
+
+    def observe(self, value: float):
+        # First bucket whose upper bound is >= value; past the last bound is +Inf
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+
+class MetricsRegistry:
+    """Thread-safe counters, gauges and histograms keyed by metric name and label set"""
+
+    def __init__(self, prefix: str = "resume_analyser"):
+        self.prefix = prefix
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._gauges: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._meta: Dict[str, Tuple[str, str, Sequence[float]]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str):
+        self._meta[name] = ("counter", help_text, ())
+        self._counters.setdefault(name, {})
+
+    def gauge(self, name: str, help_text: str):
+        self._meta[name] = ("gauge", help_text, ())
+        self._gauges.setdefault(name, {})
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float]):
+        self._meta[name] = ("histogram", help_text, buckets)
+        self._histograms.setdefault(name, {})
+
+    def inc(self, name: str, amount: float = 1, **labels: str):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters[name]
+            series[key] = series.get(key, 0) + amount
+
+    def set(self, name: str, value: float, **labels: str):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._gauges[name][key] = value
+
+    def observe(self, name: str, value: float, **labels: str):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms[name]
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self._meta[name][2])
+            histogram.observe(value)
+
+    def record_stages(self, timer: StageTimer):
+        """Add a finished request's stage timings and fallbacks"""
+        for stage, milliseconds in timer.timings.items():
+            self.observe("stage_duration_seconds", milliseconds / 1000, stage=stage)
+        for stage in timer.fallbacks:
+            self.inc("fallbacks_total", stage=stage)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+        with self._lock:
+            for name, (kind, help_text, _) in self._meta.items():
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {kind}")
+                if kind in ("counter", "gauge"):
+                    series = self._counters[name] if kind == "counter" else self._gauges[name]
+                    for labels, value in sorted(series.items()):
+                        lines.append(f"{full_name}{_format_labels(labels)} {value:g}")
+                    continue
+                for labels, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    bounds = [f"{bound:g}" for bound in histogram.buckets] + ["+Inf"]
+                    for bound, count in zip(bounds, histogram.counts):
+                        cumulative += count
+                        bucket_labels = _format_labels(labels, 'le="' + bound + '"')
+                        lines.append(f"{full_name}_bucket{bucket_labels} {cumulative}")
+                    lines.append(f"{full_name}_sum{_format_labels(labels)} {histogram.total:.6f}")
+                    lines.append(f"{full_name}_count{_format_labels(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+metrics.counter("requests_total", "HTTP requests by route and status code")
+metrics.histogram("request_duration_seconds", "HTTP request latency by route", REQUEST_BUCKETS)
+metrics.counter("errors_total", "Failed resume analyses by kind")
+metrics.counter("fallbacks_total", "Pipeline stages that fell back to default output")
+metrics.histogram("stage_duration_seconds", "Latency of each resume analysis pipeline stage", STAGE_BUCKETS)
+metrics.histogram("upload_size_bytes", "Size of uploaded resume files", SIZE_BUCKETS)
+metrics.counter("jobs_total", "Analysis jobs by event (submitted, done, failed, requeued)")
+metrics.gauge("job_queue_depth", "Analysis jobs currently queued or running, by status")
+metrics.gauge("job_oldest_queued_seconds", "Age of the oldest queued analysis job (0 when the queue is empty)")
+metrics.gauge("job_workers", "Live job worker processes of this API process")
+metrics.histogram("job_wait_seconds", "Time analysis jobs spent queued before a worker claimed them", JOB_WAIT_BUCKETS)
+metrics.histogram("job_duration_seconds", "Time job workers spent analysing a claimed job", REQUEST_BUCKETS)
@@ -0,0 +1,79 @@
+"""
+Registry of multilingual regex patterns, compiled lazily one language at a time
+"""
+import re
+import threading
+import time
+from typing import Dict, List, Pattern, Union
+
+ANY_LANGUAGE = "*"  # Key for patterns that apply to every language
+
+PatternSource = Union[str, List[str]]
+
+class PatternRegistry:
+    def __init__(self, fallback_language: str = "en"):
+        self.fallback_language = fallback_language
+        self._sources: Dict[str, Dict[str, PatternSource]] = {}
+        self._flags: Dict[str, int] = {}
+        self._compiled: Dict[str, Dict[str, Union[Pattern, List[Pattern]]]] = {}
+        self._hits: Dict[str, int] = {}
+        self._compile_ms: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, patterns: Dict[str, PatternSource], flags: int = 0):
+        """Register a pattern set keyed by language code (or ANY_LANGUAGE)"""
+        with self._lock:
+            self._sources[name] = patterns
+            self._flags[name] = flags
+            # A language compiled before this registration must pick up the new set
+            for language, compiled in self._compiled.items():
+                if language in patterns:
+                    compiled[name] = self._compile(patterns[language], flags)
+
+    def get(self, name: str, language: str = ANY_LANGUAGE) -> Union[Pattern, List[Pattern]]:
+        """Compiled pattern(s) of a set for a language, falling back like dict.get(language, en)"""
+        patterns = self._sources[name]
+        if language not in patterns:
+            language = ANY_LANGUAGE if ANY_LANGUAGE in patterns else self.fallback_language
+
+        compiled = self._compiled.get(language)
+        if compiled is None:
+            compiled = self._compile_language(language)
+
+        self._hits[language] = self._hits.get(language, 0) + 1
+        return compiled[name]
+
+    def _compile_language(self, language: str) -> Dict[str, Union[Pattern, List[Pattern]]]:
+        # Compile every set for this language at once; other languages stay untouched
+        with self._lock:
+            if language in self._compiled:
+                return self._compiled[language]
+
+            start = time.perf_counter()
+            compiled = {
+                name: self._compile(patterns[language], self._flags[name])
+                for name, patterns in self._sources.items() if language in patterns
+            }
+            self._compile_ms[language] = (time.perf_counter() - start) * 1000
+            self._compiled[language] = compiled
+            return compiled
+
+    @staticmethod
+    def _compile(source: PatternSource, flags: int) -> Union[Pattern, List[Pattern]]:
+        if isinstance(source, str):
+            return re.compile(source, flags)
+        return [re.compile(pattern, flags) for pattern in source]
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-language hit counts, compile time and number of compiled sets"""
+        return {
+            language: {
+                "hits": self._hits.get(language, 0),
+                "compile_ms": round(self._compile_ms.get(language, 0.0), 3),
+                "pattern_sets": len(self._compiled.get(language, {}))
+            }
+            for language in sorted(set(self._compiled) | set(self._hits))
+        }
+
+# Shared by every extractor in the process
+pattern_registry = PatternRegistry()
@@ -0,0 +1,116 @@
+"""
+Job profiles compiled into weight matrices for vectorized job-fit scoring
+
+Every distinct required skill gets a column. For each skill category a profile row
+counts how often the profile lists that skill, so multiplying the stacked matrix by a
+candidate's 0/1 skill-hit vector yields the core, framework, database and tools match
+counts of every profile at once. Project indicators are compiled the same way.
+"""
+import re
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+SKILL_CATEGORIES = ("core_skills", "framework_skills", "database_skills", "tools_skills")
+
+class ProfileMatrix:
+    def __init__(self, profiles: Dict[str, Dict], similar: Callable[[str, str], bool]):
+        self.titles: List[str] = list(profiles)
+        self.profiles = [profiles[title] for title in self.titles]
+        self._similar = similar
+
+        skill_ids: Dict[str, int] = {}
+        indicator_ids: Dict[str, int] = {}
+        for profile in self.profiles:
+            for category in SKILL_CATEGORIES:
+                for skill in profile[category]:
+                    skill_ids.setdefault(skill.lower(), len(skill_ids))
+            for indicator in profile["project_indicators"]:
+                indicator_ids.setdefault(indicator, len(indicator_ids))
+        self.skill_ids = skill_ids
+        self.skills: List[str] = list(skill_ids)
+
+        # Category-major blocks of profile rows: one product gives all four counts
+        count = len(self.profiles)
+        self.weights = np.zeros((len(SKILL_CATEGORIES) * count, len(self.skills)), dtype=np.int64)
+        self.indicator_weights = np.zeros((count, len(indicator_ids)), dtype=np.int64)
+        for row, profile in enumerate(self.profiles):
+            for block, category in enumerate(SKILL_CATEGORIES):
+                for skill in profile[category]:
+                    self.weights[block * count + row, skill_ids[skill.lower()]] += 1
+            for indicator in profile["project_indicators"]:
+                self.indicator_weights[row, indicator_ids[indicator]] += 1
+
+        self.skills_weight = np.array([profile["skills_weight"] for profile in self.profiles], dtype=np.float64)
+        self.projects_weight = np.array([profile["projects_weight"] for profile in self.profiles], dtype=np.float64)
+        self.experience_weight = np.array([profile["experience_weight"] for profile in self.profiles], dtype=np.float64)
+        self.min_skills = np.array([profile["min_skills"] for profile in self.profiles])
+        self.seniority: List[str] = [profile["seniority"] for profile in self.profiles]
+
+        # Same (unescaped) patterns the per-profile relevance check used
+        self._indicator_patterns = [re.compile(r'\b' + indicator + r'\b', re.IGNORECASE)
+                                    for indicator in indicator_ids]
+
+        # Candidate skill -> columns it satisfies; the vocabulary is small and repeats across requests
+        self._hit_cache: Dict[str, np.ndarray] = {}
+
+    def _skill_hits(self, candidate_skill: str) -> np.ndarray:
+        hits = self._hit_cache.get(candidate_skill)
+        if hits is None:
+            # Same fuzzy rule as the original pairwise loop: substring either way or a known alias
+            hits = np.array([
+                required in candidate_skill or candidate_skill in required or
+                self._similar(required, candidate_skill)
+                for required in self.skills
+            ], dtype=np.int64)
+            if len(self._hit_cache) >= 4096:
+                self._hit_cache.clear()
+            self._hit_cache[candidate_skill] = hits
+        return hits
+
+    def candidate_hits(self, candidate_skills: List[str]) -> np.ndarray:
+        """0/1 vector over required skills satisfied by any of the (lowercased) candidate skills"""
+        hits = np.zeros(len(self.skills), dtype=np.int64)
+        for candidate_skill in set(candidate_skills):
+            hits |= self._skill_hits(candidate_skill)
+        return hits
+
+    def skill_matches(self, hits: np.ndarray) -> np.ndarray:
+        """Match counts per category and profile, shape (4, profiles)"""
+        return (self.weights @ hits).reshape(len(SKILL_CATEGORIES), len(self.profiles))
+
+    def matching_skills(self, index: int, hits: np.ndarray) -> List[str]:
+        """Required skills of a profile the candidate has"""
+        profile = self.profiles[index]
+        matching = [skill for category in SKILL_CATEGORIES for skill in profile[category]
+                    if hits[self.skill_ids[skill.lower()]]]
+        return list(set(matching))
+
+    def missing_critical_skills(self, index: int, hits: np.ndarray) -> List[str]:
+        """Core skills and the first two frameworks of a profile the candidate lacks"""
+        profile = self.profiles[index]
+        critical_skills = profile["core_skills"] + profile["framework_skills"][:2]
+        return [skill for skill in critical_skills if not hits[self.skill_ids[skill.lower()]]][:5]
+
+    def indicator_hits(self, text: str) -> np.ndarray:
+        """0/1 vector over project indicators found in the text; no indicator spans a line, so
+        the hits of a text are the OR of the hits of its lines or sections"""
+        return np.array([1 if pattern.search(text) else 0 for pattern in self._indicator_patterns], dtype=np.int64)
+
+    def project_relevance(self, text: str, hits: Optional[np.ndarray] = None) -> np.ndarray:
+        """Number of each profile's project indicators found in the text, capped at 10"""
+        if hits is None:
+            hits = self.indicator_hits(text)
+        return np.minimum(self.indicator_weights @ hits, 10)
+
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k best scores, ties broken by profile order like a stable sort"""
+        count = len(scores)
+        k = min(k, count)
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64)
+        # Unique integer keys: higher score first, then earlier profile
+        keys = (scores.max() - scores) * count + np.arange(count)
+        top = np.argpartition(keys, k - 1)[:k] if k < count else np.arange(count)
+        return top[np.argsort(keys[top])]
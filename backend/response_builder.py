@@ -0,0 +1,293 @@
+"""
+Assembly and serialization of the /api/analyse-resume response
+
+build_analysis_response derives every translated list once and builds each top-level
+section once, in one place, for both the native-language response and the English one
+(translate_to=en). Sections reference the extracted features instead of deep-copying
+them; nothing here mutates its input. select_fields trims a response to the sections a
+client asked for with ?fields=, and JSON goes out through orjson when it is installed.
+"""
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from metrics import StageTimer
+from translator import translate_text, translate_to_english
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the standard library encoder produces the same JSON
+    orjson = None
+
+from starlette.responses import JSONResponse
+
+# Top-level sections in response order
+SECTIONS = [
+    "extracted_data", "projects_summary", "professional_links", "analysis", "job_matches",
+    "detected_categories", "compatibility_score", "suggestions", "improvement_recommendations",
+    "skill_recommendations", "detailed_projects", "contact_links", "ats_analysis", "section_analysis"
+]
+# The English response has always left out the recommendation breakdown
+ENGLISH_SECTIONS = [section for section in SECTIONS if section != "improvement_recommendations"] + [
+    "translated_to", "original_language"
+]
+FIELDS = set(SECTIONS) | set(ENGLISH_SECTIONS)
+
+CONTACT_FIELDS = ["email", "phone", "linkedin", "github", "website", "twitter", "instagram", "behance"]
+
+# Suggestion categories and the keywords that put a suggestion in them
+SUGGESTION_CATEGORIES = {
+    "technical_skills": ['skill', 'learn', 'technology', 'certification'],
+    "professional_presence": ['linkedin', 'github', 'portfolio', 'website', 'network'],
+    "content_enhancement": ['project', 'metric', 'achievement', 'description', 'keyword'],
+    "career_development": ['leadership', 'learning', 'open source', 'contribution']
+}
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with dumps(); the app's default response class"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Section names from a comma-separated ?fields= value; None means every section"""
+    if not fields:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(SECTIONS + ENGLISH_SECTIONS[-2:])}")
+    return names
+
+def select_fields(response: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """The requested top-level sections of a response, in response order"""
+    if fields is None:
+        return response
+    wanted = set(fields)
+    return {name: value for name, value in response.items() if name in wanted}
+
+def _ats_rating(score: float) -> str:
+    if score >= 85:
+        return "Excellent"
+    if score >= 70:
+        return "Good"
+    if score >= 50:
+        return "Needs Improvement"
+    return "Poor"
+
+class _ResponseParts:
+    """Values several sections share, each derived (and translated) exactly once"""
+
+    def __init__(self, features: Dict[str, Any], translate: Optional[Callable[[str], str]], timer: StageTimer):
+        self.language = features["language"]
+        self.analysis = analysis = features["analysis"]
+        self.ats_analysis = features["ats_analysis"]
+        self.ats_issues = features["ats_issues"]
+        self.contact = analysis["contact"]
+        job_matches = features["job_matches"]
+
+        # Overall compatibility score
+        self.compatibility_score = job_matches[0]["match_percentage"] if job_matches else 50
+
+        # Simple skill recommendations
+        skill_recommendations = []
+        for job in job_matches[:3]:
+            missing_skills = job.get("missing_skills", [])
+            if missing_skills:
+                skill_recommendations.append({
+                    "job_title": job["job_title"],
+                    "priority_skills": missing_skills[:3],
+                    "current_match": job["match_percentage"],
+                    "projected_improvement": min(job["match_percentage"] + 15, 95)
+                })
+
+        self.job_matches = job_matches
+        self.skill_recommendations = skill_recommendations
+        self.strengths = analysis["strengths"]
+        self.weaknesses = analysis["weaknesses"]
+        self.suggestions = analysis["suggestions"]
+        if translate is None:
+            return
+
+        with timer.stage("translation"):
+            try:
+                self.job_matches = [{**job, "job_title": translate(job["job_title"])} for job in job_matches]
+                self.skill_recommendations = [{**rec, "job_title": translate(rec["job_title"])}
+                                              for rec in skill_recommendations]
+                self.strengths = [translate(strength) for strength in analysis["strengths"]]
+                self.weaknesses = [translate(weakness) for weakness in analysis["weaknesses"]]
+                self.suggestions = [translate(suggestion) for suggestion in analysis["suggestions"]]
+            except (KeyError, AttributeError, TypeError):
+                # Keep the original text if translation fails
+                timer.fallback("translation")
+                self.job_matches = job_matches
+                self.skill_recommendations = skill_recommendations
+                self.strengths = analysis["strengths"]
+                self.weaknesses = analysis["weaknesses"]
+                self.suggestions = analysis["suggestions"]
+
+def _extracted_data(parts: _ResponseParts) -> Dict[str, Any]:
+    analysis = parts.analysis
+    return {
+        "name": analysis["name"],
+        "language": parts.language,
+        "skills": analysis["skills"]["all"],
+        "projects": analysis["projects"],
+        "experience": analysis["experience"],
+        "education": analysis["education"],
+        "contact_info": {field: parts.contact.get(field, "") for field in CONTACT_FIELDS}
+    }
+
+def _projects_summary(parts: _ResponseParts) -> Dict[str, Any]:
+    projects = parts.analysis["projects"]
+    return {
+        "total_projects": len(projects),
+        "project_list": [{
+            "title": p["title"],
+            "description": p["description"][:100] + "..." if len(p["description"]) > 100 else p["description"],
+            "technologies_used": p["technologies"]
+        } for p in projects]
+    }
+
+def _professional_links(parts: _ResponseParts) -> Dict[str, Any]:
+    contact = parts.contact
+    return {
+        "linkedin_profile": contact.get("linkedin", ""),
+        "github_profile": contact.get("github", ""),
+        "portfolio_website": contact.get("website", ""),
+        "has_linkedin": bool(contact.get("linkedin")),
+        "has_github": bool(contact.get("github")),
+        "has_portfolio": bool(contact.get("website"))
+    }
+
+def _analysis(parts: _ResponseParts, breakdown: bool) -> Dict[str, Any]:
+    skills = parts.analysis["skills"]
+    skill_analysis = {
+        "total_skills": len(skills["all"]),
+        "diversity_score": min(len(skills["all"]) * 3, 100),
+        "categorized_skills": skills["categorized"]
+    }
+    if breakdown:
+        categorized = skills["categorized"]
+        skill_analysis["skills_breakdown"] = {
+            "from_projects": len(categorized.get("From Projects", [])),
+            "from_experience": len(categorized.get("From Experience", [])),
+            "from_achievements": len(categorized.get("From Achievements", []))
+        }
+    return {"strengths": parts.strengths, "weaknesses": parts.weaknesses, "skill_analysis": skill_analysis}
+
+def _detected_categories(parts: _ResponseParts) -> List[Dict[str, Any]]:
+    score = parts.compatibility_score
+    return [{
+        "category": "Technology",
+        "confidence": float(score),
+        "match_strength": "Strong" if score > 70 else "Moderate" if score > 40 else "Weak"
+    }]
+
+def _improvement_recommendations(parts: _ResponseParts) -> Dict[str, Any]:
+    # Built from the untranslated suggestions, as it always has been
+    suggestions = parts.analysis["suggestions"]
+    count = len(suggestions)
+
+    # One pass over the suggestions, lowercasing each once
+    categories: Dict[str, List[str]] = {category: [] for category in SUGGESTION_CATEGORIES}
+    for suggestion in suggestions:
+        lowered = suggestion.lower()
+        for category, keywords in SUGGESTION_CATEGORIES.items():
+            if any(word in lowered for word in keywords):
+                categories[category].append(suggestion)
+
+    return {
+        "priority_level": "high" if count > 6 else "medium" if count > 3 else "low",
+        "total_suggestions": count,
+        "categories": categories,
+        "implementation_timeline": {
+            "immediate": suggestions[:3],
+            "short_term": suggestions[3:6],
+            "long_term": suggestions[6:]
+        }
+    }
+
+def _contact_links(parts: _ResponseParts) -> Dict[str, Any]:
+    contact = parts.contact
+    return {
+        "linkedin": contact.get("linkedin", ""),
+        "github": contact.get("github", ""),
+        "website": contact.get("website", ""),
+        "email": contact.get("email", "")
+    }
+
+def _ats_section(parts: _ResponseParts) -> Dict[str, Any]:
+    ats_analysis, ats_issues = parts.ats_analysis, parts.ats_issues
+    matches = ats_analysis['keyword_matches']['matches']
+    return {
+        "ats_score": ats_analysis['ats_score'],
+        "ats_friendly": ats_analysis['ats_friendly'],
+        "keyword_optimization": {
+            "technical_keywords": len(matches.get('technical', [])),
+            "soft_skill_keywords": len(matches.get('soft_skills', [])),
+            "experience_keywords": len(matches.get('experience', [])),
+            "total_keyword_score": ats_analysis['keyword_matches']['total_score']
+        },
+        "format_analysis": {
+            "format_score": ats_analysis['format_score'],
+            "readability_score": ats_analysis['readability_score'],
+            "parsing_issues": ats_issues['issues_found'],
+            "issues_list": ats_issues['issues']
+        },
+        "ats_recommendations": ats_analysis['recommendations'],
+        "missing_keywords": ats_analysis['missing_keywords'][:8],
+        "compatibility_rating": _ats_rating(ats_analysis['ats_score'])
+    }
+
+def build_analysis_response(features: Dict[str, Any], translate_to: Optional[str] = None,
+                            timer: Optional[StageTimer] = None) -> Dict[str, Any]:
+    """Assemble the API response from extracted features for the requested translation"""
+    timer = timer or StageTimer()
+    language = features["language"]
+    english = translate_to == "en" and language != "en"
+
+    # Native responses are translated to the detected language; translate_to=en goes back to English
+    if english:
+        translate = lambda text: translate_to_english(text, language)
+    elif language != "en":
+        translate = lambda text: translate_text(text, language)
+    else:
+        translate = None
+    parts = _ResponseParts(features, translate, timer)
+
+    builders: Dict[str, Callable[[], Any]] = {
+        "extracted_data": lambda: _extracted_data(parts),
+        "projects_summary": lambda: _projects_summary(parts),
+        "professional_links": lambda: _professional_links(parts),
+        "analysis": lambda: _analysis(parts, breakdown=not english),
+        "job_matches": lambda: parts.job_matches,
+        "detected_categories": lambda: _detected_categories(parts),
+        "compatibility_score": lambda: parts.compatibility_score,
+        "suggestions": lambda: parts.suggestions,
+        "improvement_recommendations": lambda: _improvement_recommendations(parts),
+        "skill_recommendations": lambda: parts.skill_recommendations,
+        "detailed_projects": lambda: parts.analysis["projects"],
+        "contact_links": lambda: _contact_links(parts),
+        "ats_analysis": lambda: _ats_section(parts),
+        "translated_to": lambda: "en",
+        "original_language": lambda: language
+    }
+    # section_analysis describes a single request, so it is left out of the cacheable response
+    return {name: builders[name]() for name in (ENGLISH_SECTIONS if english else SECTIONS) if name in builders}
+
+def with_section_analysis(response: Dict[str, Any], sections: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+    """A copy of a (possibly cached) response with this request's section report in place
+
+    sections lists the section kinds this request analysed and reused; a response served
+    from cached features or a cached response analysed no section, so both lists are empty.
+    """
+    if sections is None:
+        sections = {"recomputed": [], "reused": []}
+    order = ENGLISH_SECTIONS if "translated_to" in response else SECTIONS
+    return {name: sections if name == "section_analysis" else response[name] for name in order}
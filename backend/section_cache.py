@@ -0,0 +1,117 @@
+"""
+Per-section analysis parts, so a re-uploaded resume only re-analyses the sections that changed
+
+The text is cut at its section headers into consecutive segments: the preamble, then
+every header line with its content, each ending with its line break, so together they
+are exactly the text. Everything the pipeline finds with patterns that cannot cross a
+line break (skill occurrences, skill pattern matches, project indicators, contact
+candidates, ATS keyword and character counts, job and project entries of a section) is
+the same whether it is looked for in the whole text or segment by segment. Those
+findings are the segment's "parts", cached by the SHA-256 of the segment text, its kind
+and the resume language.
+
+A candidate who fixes one section and uploads again gets every other section's parts
+from the cache. Only the edited segment is scanned again; job fit, ATS scores and the
+steps that read across sections (language detection, fallback patterns, suggestions)
+are then re-aggregated over the whole text from the parts.
+"""
+import hashlib
+import os
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from analysis_cache import LRUCache, estimate_size
+from sections import ResumeSections
+
+SECTION_CACHE_MAX_BYTES = int(float(os.environ.get("SECTION_CACHE_MAX_MB", 32)) * 1024 * 1024)
+SECTION_CACHE_TTL = float(os.environ.get("SECTION_CACHE_TTL", 24 * 3600))
+
+PREAMBLE = "preamble"  # Kind of the text before the first section header
+
+class Segment:
+    """One section of the text (header line included) with the span of its content"""
+    __slots__ = ("kind", "start", "end", "content_start", "content_end", "key")
+
+    def __init__(self, kind: str, start: int, end: int, content_start: int, content_end: int, key: str):
+        self.kind = kind
+        self.start = start                  # Offset of the segment in the text
+        self.end = end                      # Offset just past it (the next header line)
+        self.content_start = content_start  # Content span, relative to the segment start
+        self.content_end = content_end
+        self.key = key
+
+    def __repr__(self) -> str:
+        return f"Segment({self.kind!r}, {self.start}:{self.end})"
+
+def segment_key(kind: str, text: str, language: str) -> str:
+    return hashlib.sha256(f"{language}\0{kind}\0{text}".encode("utf-8")).hexdigest()
+
+def text_segments(sections: ResumeSections, language: str) -> List[Segment]:
+    """The consecutive segments of the text: preamble (if any), then one per section"""
+    text = sections.source
+    segments = []
+    first = sections.spans[0].header_start if sections.spans else len(text)
+    if first > 0:
+        segments.append(Segment(PREAMBLE, 0, first, 0, first, segment_key(PREAMBLE, text[:first], language)))
+    for index, span in enumerate(sections.spans):
+        start = span.header_start
+        end = sections.spans[index + 1].header_start if index + 1 < len(sections.spans) else len(text)
+        segments.append(Segment(
+            span.kind, start, end, span.start - start, span.end - start,
+            segment_key(span.kind, text[start:end], language)
+        ))
+    return segments
+
+class SectionMatch:
+    """A pattern match kept with a segment's parts: its groups and their spans in the whole text"""
+    __slots__ = ("_groups", "_spans")
+
+    def __init__(self, groups: Tuple, spans: Sequence[Tuple[int, int]]):
+        self._groups = groups
+        self._spans = spans
+
+    def groups(self) -> Tuple:
+        return self._groups
+
+    def span(self, group: int) -> Tuple[int, int]:
+        return self._spans[group - 1]
+
+def match_record(match) -> Tuple[Tuple, List[Tuple[int, int]]]:
+    """(groups, group spans) of a re match, the form entries take in the parts"""
+    return match.groups(), [match.span(group) for group in range(1, len(match.groups()) + 1)]
+
+def shifted_matches(records: Iterable[Tuple[Tuple, List[Tuple[int, int]]]], offset: int) -> List[SectionMatch]:
+    """Stored match records of a segment as matches on the whole text"""
+    return [
+        SectionMatch(groups, [(start + offset, end + offset) if start >= 0 else (start, end) for start, end in spans])
+        for groups, spans in records
+    ]
+
+class SectionCache:
+    """LRU of segment parts by segment key (thread-safe); held by the API process and
+    shipped to the analysis workers with each uncached resume"""
+
+    def __init__(self, max_bytes: int = SECTION_CACHE_MAX_BYTES, ttl_seconds: float = SECTION_CACHE_TTL):
+        self.enabled = max_bytes > 0
+        self._cache = LRUCache(max(max_bytes, 1), ttl_seconds)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, dict]:
+        """The cached parts among the given segment keys"""
+        found = {}
+        if self.enabled:
+            for key in dict.fromkeys(keys):
+                parts = self._cache.get(key)
+                if parts is not None:
+                    found[key] = parts
+        return found
+
+    def store(self, parts_by_key: Dict[str, dict]):
+        if not self.enabled:
+            return
+        for key, parts in parts_by_key.items():
+            self._cache.set(key, parts, size=estimate_size(parts))
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> Dict:
+        return {**self._cache.stats(), "enabled": self.enabled}
@@ -0,0 +1,227 @@
+"""
+Resume section segmentation, done once per text
+
+segment_sections splits the text into lines once and classifies every line as either
+a section header or content, in any supported language at the same time. It returns
+the section spans as character offsets into the original text. Extractors read their
+section from those spans instead of each searching the text for its own headers.
+
+A line is a header when, with bullets, decoration and a trailing colon removed, it is
+one of SECTION_HEADERS. A short line that starts or ends with a header also counts if
+it is set like a heading (upper case or a trailing colon), e.g. "SKILLS & TOOLS", or if
+its other words are only connectors, numbers or header words, e.g. "Education & Awards".
+"Project Manager" stays content. For the list-like sections in INLINE_SECTIONS,
+"Skills: Python, SQL" is a header with its content on the same line.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Header keywords per section kind (all languages; matched case-insensitively)
+SECTION_HEADERS: Dict[str, List[str]] = {
+    "summary": [
+        "summary", "professional summary", "profile", "professional profile", "objective", "career objective",
+        "about me", "profil", "kurzprofil", "zusammenfassung", "über mich", "perfil", "resumen",
+        "perfil profesional", "objetivo", "sobre mí", "profil professionnel", "résumé", "objectif", "à propos",
+        "profilo", "profilo professionale", "sommario", "obiettivo", "chi sono", "resumo", "resumo profissional",
+        "sobre mim", "个人简介", "简介", "个人总结", "自我评价", "求职意向", "概要", "自己紹介", "職務要約",
+        "о себе", "профиль", "цель", "نبذة", "نبذة عني", "الملخص", "ملخص", "الهدف"
+    ],
+    "experience": [
+        "experience", "work experience", "professional experience", "relevant experience", "employment",
+        "employment history", "work history", "job history", "career history", "erfahrung",
+        "berufserfahrung", "arbeitserfahrung", "beruflicher werdegang", "werdegang", "beschäftigung",
+        "experiencia", "experiencia profesional", "experiencia laboral", "historial laboral", "empleo",
+        "trayectoria profesional", "expérience", "expériences", "expérience professionnelle",
+        "expériences professionnelles", "parcours professionnel", "emploi", "esperienza", "esperienze",
+        "esperienza professionale", "esperienze professionali", "esperienza lavorativa", "impiego",
+        "experiência", "experiência profissional", "histórico profissional", "emprego", "工作经验", "工作经历",
+        "职业经历", "实习经历", "经验", "職務経歴", "職歴", "職務経験", "経歴", "経験", "опыт", "опыт работы",
+        "профессиональный опыт", "трудовая деятельность", "карьера", "الخبرة", "الخبرات", "خبرة",
+        "الخبرة المهنية", "الخبرة العملية", "خبرة العمل"
+    ],
+    "projects": [
+        "projects", "personal projects", "side projects", "academic projects", "key projects",
+        "project experience", "portfolio", "work samples", "projekte", "persönliche projekte",
+        "projekterfahrung", "proyectos", "proyectos personales", "projets", "projets personnels", "progetti",
+        "progetti personali", "projetos", "projetos pessoais", "portfólio", "项目", "项目经验", "项目经历",
+        "作品集", "プロジェクト", "プロジェクト経験", "ポートフォリオ", "проекты", "личные проекты", "портфолио",
+        "المشاريع", "مشاريع", "المشروعات"
+    ],
+    "skills": [
+        "skills", "technical skills", "key skills", "core skills", "competencies", "core competencies",
+        "expertise", "areas of expertise", "proficiencies", "technical proficiencies",
+        "fähigkeiten", "kenntnisse", "kompetenzen", "fachkenntnisse", "it-kenntnisse", "technische fähigkeiten",
+        "habilidades", "competencias", "conocimientos", "aptitudes", "habilidades técnicas", "compétences",
+        "compétences techniques", "competenze", "competenze tecniche", "abilità", "competências",
+        "conhecimentos", "技能", "专业技能", "技术技能", "技能特长", "スキル", "技術スキル", "保有スキル",
+        "навыки", "ключевые навыки", "технические навыки", "компетенции", "المهارات", "مهارات",
+        "المهارات التقنية"
+    ],
+    "education": [
+        "education", "academic background", "academic qualifications", "studies", "ausbildung", "bildung",
+        "studium", "bildungsweg", "educación", "formación", "formación académica", "estudios", "formation",
+        "éducation", "études", "diplômes", "istruzione", "formazione", "titoli di studio", "educação",
+        "formação", "formação acadêmica", "教育背景", "教育", "教育经历", "学历", "学歴", "образование",
+        "التعليم", "المؤهلات العلمية", "التعليم الأكاديمي"
+    ],
+    "certifications": [
+        "certifications", "certification", "certificates", "licenses", "licenses and certifications",
+        "zertifikate", "zertifizierungen", "weiterbildung", "certificaciones", "certificados", "certificats",
+        "certificazioni", "certificati", "certificações", "证书", "认证", "资格证书", "資格", "認定",
+        "сертификаты", "сертификация", "الشهادات", "شهادات"
+    ],
+    "achievements": [
+        "achievements", "awards", "honors", "honours", "accomplishments", "awards and honors", "erfolge",
+        "auszeichnungen", "leistungen", "logros", "premios", "reconocimientos", "réalisations", "prix",
+        "distinctions", "risultati", "premi", "riconoscimenti", "conquistas", "prêmios", "realizações", "成就",
+        "奖项", "荣誉", "実績", "受賞歴", "достижения", "награды", "الإنجازات", "الجوائز"
+    ],
+    "languages": [
+        "languages", "language skills", "sprachen", "sprachkenntnisse", "idiomas", "langues", "lingue", "语言",
+        "语言能力", "語学", "言語", "языки", "اللغات"
+    ],
+    "references": [
+        "references", "referenzen", "referencias", "références", "referenze", "riferimenti", "referências",
+        "推荐人", "推薦者", "рекомендации", "المراجع"
+    ],
+    "contact": [
+        "contact", "contact information", "contact details", "kontakt", "contacto", "coordonnées", "contatti",
+        "contato", "联系方式", "連絡先", "контакты", "معلومات الاتصال", "الاتصال"
+    ],
+    "interests": [
+        "interests", "hobbies", "interessen", "hobbys", "intereses", "centres d'intérêt", "interessi",
+        "interesses", "兴趣爱好", "趣味", "интересы", "الاهتمامات"
+    ]
+}
+
+# Sections whose content commonly shares the header line ("Skills: Python, SQL")
+INLINE_SECTIONS = {"skills", "languages", "certifications", "achievements", "interests"}
+
+MAX_HEADER_CHARS = 50
+MAX_HEADER_WORDS = 5
+MAX_HEADER_KEYWORD_WORDS = max(len(keyword.split()) for keywords in SECTION_HEADERS.values() for keyword in keywords)
+# Words that may join a header keyword to another in a heading ("Education & Awards")
+CONNECTORS = {"&", "and", "of", "und", "y", "e", "et", "и", "و", "de", "di", "da", "des", "der"}
+
+_DECORATION = " \t#*=•·▪■◆►>_-–—|"
+_HEADER_INDEX: Dict[str, str] = {
+    keyword.casefold(): kind for kind, keywords in SECTION_HEADERS.items() for keyword in keywords
+}
+# Words a header keyword can start or end with: lines without one skip the partial match
+_FIRST_WORDS = {keyword.split()[0] for keyword in _HEADER_INDEX}
+_LAST_WORDS = {keyword.split()[-1] for keyword in _HEADER_INDEX}
+_WORD = re.compile(r"[^\s&/,()]+|&")
+
+class Section:
+    """One section: its header line and the character span of its content in the text"""
+    __slots__ = ("kind", "header", "line", "header_start", "start", "end")
+
+    def __init__(self, kind: str, header: str, line: int, header_start: int, start: int):
+        self.kind = kind
+        self.header = header
+        self.line = line                  # Index of the header line
+        self.header_start = header_start  # Offset of the header line
+        self.start = start                # Offset of the first content character
+        self.end = start                  # Offset just past the last content character
+
+    def __repr__(self) -> str:
+        return f"Section({self.kind!r}, {self.header!r}, {self.start}:{self.end})"
+
+class ResumeSections:
+    """Section spans of one resume text; spans of a kind appear in document order"""
+
+    def __init__(self, text: str, lines: List[str], spans: List[Section]):
+        self.source = text
+        self.lines = lines
+        self.spans = spans
+        self._by_kind: Dict[str, List[Section]] = {}
+        for span in spans:
+            self._by_kind.setdefault(span.kind, []).append(span)
+
+    def __reduce__(self):
+        # Sent to and from analysis workers next to the text itself: leave out the lines
+        return _unpickle_sections, (self.source, self.spans)
+
+    def __contains__(self, kind: str) -> bool:
+        return kind in self._by_kind
+
+    def get(self, kind: str) -> List[Section]:
+        return self._by_kind.get(kind, [])
+
+    def bounds(self, *kinds: str) -> List[Tuple[int, int]]:
+        """(start, end) offsets of the non-empty content of every section of the given kinds"""
+        return [(span.start, span.end) for span in self.spans if span.kind in kinds and span.end > span.start]
+
+    def text(self, *kinds: str) -> str:
+        """Content of every section of the given kinds (without the header lines)"""
+        return "\n".join(self.source[start:end] for start, end in self.bounds(*kinds))
+
+    @property
+    def preamble(self) -> str:
+        """Text before the first header: usually the name and contact details"""
+        return self.source[:self.spans[0].header_start] if self.spans else self.source
+
+def _unpickle_sections(text: str, spans: List[Section]) -> ResumeSections:
+    return ResumeSections(text, text.split("\n"), spans)
+
+def _normalize(label: str) -> str:
+    return " ".join(label.strip(_DECORATION).rstrip(":：").strip(_DECORATION).casefold().split())
+
+def _is_filler(word: str) -> bool:
+    return word in CONNECTORS or word in _HEADER_INDEX or not any(char.isalpha() for char in word)
+
+def classify_header(line: str) -> Optional[Tuple[str, int]]:
+    """(section kind, column where the section content starts) if the line is a header"""
+    stripped = line.strip()
+    if not stripped:
+        return None
+
+    # "Skills: Python, SQL": a header label with the content after the colon
+    colons = [position for position in (stripped.find(":", 0, MAX_HEADER_CHARS), stripped.find("：", 0, MAX_HEADER_CHARS))
+              if position >= 0]
+    colon = min(colons) if colons else -1
+    if 0 < colon < len(stripped) - 1:
+        kind = _HEADER_INDEX.get(_normalize(stripped[:colon]))
+        if kind not in INLINE_SECTIONS:
+            return None
+        column = line.find(stripped[colon]) + 1
+        return kind, column + len(line[column:]) - len(line[column:].lstrip())
+
+    if len(stripped) > MAX_HEADER_CHARS:
+        return None
+    normalized = _normalize(stripped)
+    kind = _HEADER_INDEX.get(normalized)
+    if kind is not None:
+        return kind, len(line) + 1
+
+    # A header keyword at the start or end of a short line, plus a few more words
+    words = _WORD.findall(normalized)
+    if not words or len(words) > MAX_HEADER_WORDS or stripped.endswith("."):
+        return None
+    if words[0] not in _FIRST_WORDS and words[-1] not in _LAST_WORDS:
+        return None
+    styled = stripped.isupper() or stripped.endswith((":", "："))
+    for size in range(min(MAX_HEADER_KEYWORD_WORDS, len(words) - 1), 0, -1):
+        for keyword, rest in ((words[:size], words[size:]), (words[-size:], words[:-size])):
+            kind = _HEADER_INDEX.get(" ".join(keyword))
+            if kind is not None and (styled or all(_is_filler(word) for word in rest)):
+                return kind, len(line) + 1
+    return None
+
+def segment_sections(text: str) -> ResumeSections:
+    """Split the text into lines once and return the spans of all recognised sections"""
+    lines = text.split("\n")
+    spans: List[Section] = []
+    offset = 0
+    for index, line in enumerate(lines):
+        header = classify_header(line)
+        if header is not None:
+            kind, column = header
+            if spans:
+                previous = spans[-1]
+                previous.end = max(offset - 1, previous.start)
+            spans.append(Section(kind, line.strip(), index, offset, min(offset + column, len(text))))
+        offset += len(line) + 1
+    if spans:
+        spans[-1].end = max(len(text), spans[-1].start)
+    return ResumeSections(text, lines, spans)
@@ -1,8 +1,5 @@
 from typing import Dict, List, Any
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
 
 class AIAnalyser:
     def __init__(self):
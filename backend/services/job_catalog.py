@@ -0,0 +1,124 @@
+"""
+Process-wide, versioned snapshot of the job catalog
+
+Readers call job_catalog.snapshot() and get an immutable CatalogSnapshot: the job roles,
+their profiles and the TF-IDF model fitted over all job profiles. A daemon
+thread polls the catalog_version row and builds a complete new snapshot off to the side
+when it changes, then swaps a single reference, so requests never wait on the database
+after the first load and never observe a half-built catalog.
+"""
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from database.models import get_job_roles, get_catalog_version
+
+CATALOG_POLL_SECONDS = float(os.environ.get("CATALOG_POLL_SECONDS", 5))
+
+def create_job_profile(job_role: Dict[str, Any]) -> str:
+    """Text a job role is matched on: required skills, description and category"""
+    profile_parts = []
+    profile_parts.extend(job_role.get('required_skills', []))
+    profile_parts.append(job_role.get('description', '') or '')
+    profile_parts.append(job_role.get('category', '') or '')
+    return ' '.join(profile_parts).lower()
+
+class CatalogSnapshot:
+    """Immutable view of the catalog at one version; never modified after construction"""
+    __slots__ = ('version', 'roles', 'profiles', 'vectorizer', 'job_matrix')
+
+    def __init__(self, version: int, job_roles: List[Dict[str, Any]]):
+        roles = []
+        for job_role in job_roles:
+            role = dict(job_role)
+            role['required_skills'] = tuple(job_role['required_skills'])
+            roles.append(role)
+
+        object.__setattr__(self, 'version', version)
+        object.__setattr__(self, 'roles', tuple(roles))
+        object.__setattr__(self, 'profiles', tuple(create_job_profile(role) for role in roles))
+
+        # Vocabulary and IDF fitted once over every job profile; rows are L2-normalised
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
+        try:
+            job_matrix = vectorizer.fit_transform(self.profiles).tocsr()
+        except ValueError:
+            # Empty catalog or no usable terms: callers fall back to keyword matching
+            vectorizer, job_matrix = None, None
+        object.__setattr__(self, 'vectorizer', vectorizer)
+        object.__setattr__(self, 'job_matrix', job_matrix)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CatalogSnapshot is immutable")
+
+    def role_dicts(self) -> List[Dict[str, Any]]:
+        """Fresh, caller-owned copies of the roles in the get_job_roles() shape"""
+        return [{**role, 'required_skills': list(role['required_skills'])} for role in self.roles]
+
+class JobCatalog:
+    def __init__(self, poll_seconds: float = CATALOG_POLL_SECONDS):
+        self.poll_seconds = poll_seconds
+        self.rebuilds = 0
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._load_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._watcher_pid: Optional[int] = None
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Current catalog; only the very first call in a process reads the database"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._load_lock:
+                if self._snapshot is None:
+                    self._snapshot = self._build()
+            snapshot = self._snapshot
+        self._ensure_watcher()
+        return snapshot
+
+    def refresh(self):
+        """Ask the watcher to check the catalog version now (e.g. right after an edit)"""
+        self._ensure_watcher()
+        self._wake.set()
+
+    def _build(self) -> CatalogSnapshot:
+        # Read the version first: a write landing during the read bumps it again,
+        # so the watcher rebuilds once more instead of keeping a stale snapshot
+        version = get_catalog_version()
+        snapshot = CatalogSnapshot(version, get_job_roles())
+        self.rebuilds += 1
+        return snapshot
+
+    def _ensure_watcher(self):
+        # Threads do not survive fork, so each worker process starts its own watcher
+        if self._watcher_pid == os.getpid():
+            return
+        with self._load_lock:
+            if self._watcher_pid == os.getpid():
+                return
+            self._watcher_pid = os.getpid()
+            self._wake = threading.Event()
+            threading.Thread(target=self._watch, name="job-catalog-watcher", daemon=True).start()
+
+    def _watch(self):
+        while True:
+            self._wake.wait(self.poll_seconds)
+            self._wake.clear()
+            try:
+                if self._snapshot is None or get_catalog_version() != self._snapshot.version:
+                    self._snapshot = self._build()
+            except Exception:
+                # Keep serving the last good snapshot; the next poll retries
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version if snapshot else None,
+            "roles": len(snapshot.roles) if snapshot else 0,
+            "rebuilds": self.rebuilds,
+            "poll_seconds": self.poll_seconds
+        }
+
+# Shared by every JobMatcher in the process
+job_catalog = JobCatalog()
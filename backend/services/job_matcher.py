@@ -1,23 +1,18 @@
 from typing import Dict, List, Any, Tuple
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
-from database.models import get_job_roles
 from .category_detector import CategoryDetector
+from .job_catalog import CatalogSnapshot, job_catalog, create_job_profile
 
 class JobMatcher:
     def __init__(self):
-        self.vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
-        self.job_roles = None
         self.category_detector = CategoryDetector()
-        self._load_job_roles()
     
-    def _load_job_roles(self):
-        self.job_roles = get_job_roles()
+    @property
+    def job_roles(self) -> Tuple[Dict[str, Any], ...]:
+        return job_catalog.snapshot().roles
     
     def find_matches(self, parsed_data: Dict[str, Any], analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
-        if not self.job_roles:
-            self._load_job_roles()
+        # One snapshot for the whole request, even if the catalog is swapped meanwhile
+        catalog = job_catalog.snapshot()
         
         # Detect candidate's likely categories
         top_categories = self.category_detector.get_top_categories(
@@ -27,19 +22,23 @@ class JobMatcher:
         )
         
         candidate_profile = self._create_candidate_profile(parsed_data)
+        similarity_scores = self._calculate_similarities(catalog, candidate_profile)
+        
+        # Boost score if job category matches detected categories
+        category_boosts = {}
+        for cat_info in top_categories:
+            category_boosts.setdefault(cat_info['category'], cat_info['confidence'] / 100 * 0.3)  # Up to 30% boost
+        
+        scored_roles = []
+        for job_role, similarity_score in zip(catalog.roles, similarity_scores):
+            category_boost = category_boosts.get(job_role['category'], 0)
+            scored_roles.append((min(similarity_score + category_boost, 1.0), category_boost, job_role))
+        
+        # Sort by final score (stable, so ties keep catalog order) and describe only the top 3
+        scored_roles.sort(key=lambda item: item[0], reverse=True)
         matches = []
         
-        for job_role in self.job_roles:
-            similarity_score = self._calculate_similarity(candidate_profile, job_role)
-            
-            # Boost score if job category matches detected categories
-            category_boost = 0
-            for cat_info in top_categories:
-                if cat_info['category'] == job_role['category']:
-                    category_boost = cat_info['confidence'] / 100 * 0.3  # Up to 30% boost
-                    break
-            
-            final_score = min(similarity_score + category_boost, 1.0)
+        for final_score, category_boost, job_role in scored_roles[:3]:
             match_reasons = self._generate_match_reasons(parsed_data, job_role)
             
             matches.append({
@@ -47,16 +46,14 @@ class JobMatcher:
                 'category': job_role['category'],
                 'similarity_score': final_score,
                 'match_percentage': int(final_score * 100),
-                'required_skills': job_role['required_skills'],
+                'required_skills': list(job_role['required_skills']),
                 'matching_skills': self._find_matching_skills(parsed_data['skills'], job_role['required_skills']),
                 'missing_skills': self._find_missing_skills(parsed_data['skills'], job_role['required_skills']),
                 'match_reasons': match_reasons,
                 'category_match': category_boost > 0
             })
         
-        # Sort by final score and return top 3
-        matches.sort(key=lambda x: x['similarity_score'], reverse=True)
-        return matches[:3]
+        return matches
     
     def _create_candidate_profile(self, parsed_data: Dict[str, Any]) -> str:
         profile_parts = []
@@ -84,34 +81,19 @@ class JobMatcher:
         
         return ' '.join(profile_parts).lower()
     
-    def _calculate_similarity(self, candidate_profile: str, job_role: Dict[str, Any]) -> float:
-        job_profile = self._create_job_profile(job_role)
-        
-        try:
-            # Create TF-IDF vectors
-            tfidf_matrix = self.vectorizer.fit_transform([candidate_profile, job_profile])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            return float(similarity)
-        except:
+    def _calculate_similarities(self, catalog: CatalogSnapshot, candidate_profile: str) -> List[float]:
+        """Cosine similarity of the candidate to every job role"""
+        if catalog.job_matrix is None:
             # Fallback to simple keyword matching
-            return self._simple_keyword_match(candidate_profile, job_role)
+            return [self._simple_keyword_match(candidate_profile, job_role) for job_role in catalog.roles]
+        
+        # Rows are L2-normalised, so one sparse matrix-vector product gives every cosine
+        candidate_vector = catalog.vectorizer.transform([candidate_profile])
+        similarities = catalog.job_matrix @ candidate_vector.T
+        return [float(score) for score in similarities.toarray().ravel()]
     
     def _create_job_profile(self, job_role: Dict[str, Any]) -> str:
-        profile_parts = []
-        
-        # Add required skills
-        required_skills = job_role.get('required_skills', [])
-        profile_parts.extend(required_skills)
-        
-        # Add job description
-        description = job_role.get('description', '')
-        profile_parts.append(description)
-        
-        # Add category
-        category = job_role.get('category', '')
-        profile_parts.append(category)
-        
-        return ' '.join(profile_parts).lower()
+        return create_job_profile(job_role)
     
     def _simple_keyword_match(self, candidate_profile: str, job_role: Dict[str, Any]) -> float:
         required_skills = job_role.get('required_skills', [])
@@ -179,9 +161,7 @@ class JobMatcher:
         return reasons[:3]  # Limit to top 3 reasons
     
     def get_all_roles(self) -> List[Dict[str, Any]]:
-        if not self.job_roles:
-            self._load_job_roles()
-        return self.job_roles
+        return job_catalog.snapshot().role_dicts()
     
     def get_detected_categories(self, parsed_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get categories detected from candidate's profile"""
@@ -1,5 +1,5 @@
 from typing import Dict, Any
-from langdetect import detect
+from language_id import detect_language
 
 class LanguageHandler:
     def __init__(self):
@@ -13,10 +13,7 @@ class LanguageHandler:
         }
     
     def detect_language(self, text: str) -> str:
-        try:
-            return detect(text)
-        except:
-            return 'en'
+        return detect_language(text)
     
     def get_language_name(self, code: str) -> str:
         return self.language_names.get(code, code.upper())
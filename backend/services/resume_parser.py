@@ -1,8 +1,7 @@
-import PyPDF2
-from docx import Document
 import re
-from typing import Dict, List, Any
-from langdetect import detect
+from typing import Dict, List, Any, Optional
+from language_id import detect_language
+from sections import ResumeSections, segment_sections
 import html
 
 class ResumeParser:
@@ -25,16 +24,17 @@ class ResumeParser:
         text = self._extract_text(content, safe_filename)
         text = self._sanitize_text(text)
         language = self._detect_language(text)
+        sections = segment_sections(text)
         
         return {
             "raw_text": text[:5000],  # Limit raw text size
             "language": language,
             "name": self._sanitize_text(self._extract_name(text))[:100],
             "contact_info": self._extract_contact_info(text),
-            "skills": [self._sanitize_text(skill)[:50] for skill in self._extract_skills(text)[:20]],
-            "projects": self._extract_projects(text)[:10],
-            "experience": self._extract_experience(text)[:10],
-            "education": self._extract_education(text)[:5]
+            "skills": [self._sanitize_text(skill)[:50] for skill in self._extract_skills(text, sections)[:20]],
+            "projects": self._extract_projects(text, sections)[:10],
+            "experience": self._extract_experience(text, sections)[:10],
+            "education": self._extract_education(text, sections)[:5]
         }
     
     def _extract_text(self, content: bytes, filename: str) -> str:
@@ -47,6 +47,7 @@ class ResumeParser:
     
     def _extract_pdf_text(self, content: bytes) -> str:
         from io import BytesIO
+        import PyPDF2
         pdf_reader = PyPDF2.PdfReader(BytesIO(content))
         text = ""
         for page in pdf_reader.pages:
@@ -55,17 +56,11 @@ class ResumeParser:
     
     def _extract_docx_text(self, content: bytes) -> str:
         from io import BytesIO
-        doc = Document(BytesIO(content))
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        return text
+        from docx_text import extract_docx_text
+        return extract_docx_text(BytesIO(content))
     
     def _detect_language(self, text: str) -> str:
-        try:
-            return detect(text)
-        except:
-            return "en"
+        return detect_language(text)
     
     def _extract_name(self, text: str) -> str:
         lines = text.split('\n')
@@ -100,8 +95,8 @@ class ResumeParser:
         
         return contact
     
-    def _extract_skills(self, text: str) -> List[str]:
-        skills_section = self._find_section(text, ['skills', 'technical skills', 'competencies'])
+    def _extract_skills(self, text: str, sections: Optional[ResumeSections] = None) -> List[str]:
+        skills_section = (sections or segment_sections(text)).text("skills")
         if not skills_section:
             return []
         
@@ -121,8 +116,8 @@ class ResumeParser:
         
         return found_skills
     
-    def _extract_projects(self, text: str) -> List[Dict[str, Any]]:
-        projects_section = self._find_section(text, ['projects', 'project experience', 'personal projects'])
+    def _extract_projects(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict[str, Any]]:
+        projects_section = (sections or segment_sections(text)).text("projects")
         if not projects_section:
             return []
         
@@ -145,8 +140,8 @@ class ResumeParser:
         
         return projects[:5]  # Limit to 5 projects
     
-    def _extract_experience(self, text: str) -> List[Dict[str, Any]]:
-        exp_section = self._find_section(text, ['experience', 'work experience', 'employment'])
+    def _extract_experience(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict[str, Any]]:
+        exp_section = (sections or segment_sections(text)).text("experience")
         if not exp_section:
             return []
         
@@ -166,8 +161,8 @@ class ResumeParser:
         
         return experiences[:5]
     
-    def _extract_education(self, text: str) -> List[Dict[str, str]]:
-        edu_section = self._find_section(text, ['education', 'academic background'])
+    def _extract_education(self, text: str, sections: Optional[ResumeSections] = None) -> List[Dict[str, str]]:
+        edu_section = (sections or segment_sections(text)).text("education")
         if not edu_section:
             return []
         
@@ -187,34 +182,6 @@ class ResumeParser:
         
         return education[:3]
     
-    def _find_section(self, text: str, keywords: List[str]) -> str:
-        lines = text.split('\n')
-        start_idx = -1
-        
-        for i, line in enumerate(lines):
-            for keyword in keywords:
-                if keyword.lower() in line.lower():
-                    start_idx = i
-                    break
-            if start_idx != -1:
-                break
-        
-        if start_idx == -1:
-            return ""
-        
-        # Find next section or end
-        end_idx = len(lines)
-        section_keywords = ['experience', 'education', 'skills', 'projects', 'certifications']
-        
-        for i in range(start_idx + 1, len(lines)):
-            line = lines[i].strip().lower()
-            if any(keyword in line for keyword in section_keywords):
-                if not any(kw in line for kw in keywords):
-                    end_idx = i
-                    break
-        
-        return '\n'.join(lines[start_idx:end_idx])
-    
     def _extract_technologies(self, text: str) -> List[str]:
         tech_keywords = [
             'Python', 'Java', 'JavaScript', 'React', 'Node.js', 'SQL', 'MongoDB',
@@ -1,11 +1,66 @@
-from googletrans import Translator
-from typing import Dict, Any, List
-import time
+from typing import Dict, Any, List, Optional
+import asyncio
+import inspect
+import os
 import html
+from database.models import init_db, get_translations, save_translations
+
+TRANSLATION_BATCH_SIZE = int(os.environ.get("TRANSLATION_BATCH_SIZE", 25))
+TRANSLATION_CONCURRENCY = int(os.environ.get("TRANSLATION_CONCURRENCY", 2))
+
+class GoogleTranslateBackend:
+    """googletrans client shared by every request (its HTTP session and connections are pooled)"""
+
+    def __init__(self):
+        self._translator = None
+
+    def _client(self):
+        if self._translator is None:
+            from googletrans import Translator
+            self._translator = Translator()
+        return self._translator
+
+    async def translate_batch(self, texts: List[str], target_lang: str) -> List[str]:
+        translator = self._client()
+        # googletrans accepts a list in one call; 4.x is async, 3.x blocks and runs in a thread
+        if inspect.iscoroutinefunction(translator.translate):
+            result = await translator.translate(texts, dest=target_lang)
+        else:
+            result = await asyncio.to_thread(translator.translate, texts, dest=target_lang)
+        if not isinstance(result, list):
+            result = [result]
+        return [item.text for item in result]
+
+    async def aclose(self):
+        client = getattr(self._translator, 'client', None)
+        if client is not None and hasattr(client, 'aclose'):
+            await client.aclose()
+
+class StubTranslationBackend:
+    """Local backend for tests and offline runs: tags each text with the target language"""
 
-class TranslationService:
     def __init__(self):
-        self.translator = Translator()
+        self.calls: List[List[str]] = []
+
+    async def translate_batch(self, texts: List[str], target_lang: str) -> List[str]:
+        self.calls.append(list(texts))
+        return [f"[{target_lang}] {text}" for text in texts]
+
+    async def aclose(self):
+        pass
+
+def create_backend(name: Optional[str] = None):
+    name = name or os.environ.get("TRANSLATION_BACKEND", "google")
+    return StubTranslationBackend() if name == "stub" else GoogleTranslateBackend()
+
+class TranslationService:
+    def __init__(self, backend=None, memory: bool = True):
+        self.backend = backend or create_backend()
+        self.memory = memory
+        self.memory_hits = 0
+        self.backend_translations = 0
+        self._db_ready = False
+        self._backend_slots = asyncio.Semaphore(max(TRANSLATION_CONCURRENCY, 1))
         self.supported_languages = {
             'en': 'English', 'es': 'Spanish', 'fr': 'French', 'de': 'German',
             'it': 'Italian', 'pt': 'Portuguese', 'ru': 'Russian', 'ja': 'Japanese',
@@ -14,50 +69,99 @@ class TranslationService:
             'nl': 'Dutch', 'sv': 'Swedish', 'no': 'Norwegian', 'fi': 'Finnish',
             'el': 'Greek'
         }
-    
-    def translate_analysis_results(self, results: Dict[str, Any], target_lang: str = 'en') -> Dict[str, Any]:
+
+    async def translate_analysis_results(self, results: Dict[str, Any], target_lang: str = 'en') -> Dict[str, Any]:
         if target_lang == results.get('extracted_data', {}).get('language', 'en'):
             return results
         
         translated = results.copy()
         
-        # Translate job matches
+        # Collect every list to translate first so the whole response is one deduplicated batch
+        targets = []
         if 'job_matches' in translated:
             for job in translated['job_matches']:
-                job['match_reasons'] = self._translate_list(job.get('match_reasons', []), target_lang)
-        
-        # Translate suggestions
+                targets.append((job, 'match_reasons', job.get('match_reasons', [])[:10]))
         if 'suggestions' in translated:
-            translated['suggestions'] = self._translate_list(translated['suggestions'], target_lang)
-        
-        # Translate analysis
+            targets.append((translated, 'suggestions', translated['suggestions'][:10]))
         if 'analysis' in translated:
             analysis = translated['analysis']
-            if 'suggestions' in analysis:
-                analysis['suggestions'] = self._translate_list(analysis['suggestions'], target_lang)
-            if 'strengths' in analysis:
-                analysis['strengths'] = self._translate_list(analysis['strengths'], target_lang)
-            if 'weaknesses' in analysis:
-                analysis['weaknesses'] = self._translate_list(analysis['weaknesses'], target_lang)
+            for field in ('suggestions', 'strengths', 'weaknesses'):
+                if field in analysis:
+                    targets.append((analysis, field, analysis[field][:10]))
+        
+        strings = [item for _, _, items in targets for item in items]
+        translations = await self.translate_many(strings, target_lang)
+        
+        position = 0
+        for container, field, items in targets:
+            container[field] = translations[position:position + len(items)]
+            position += len(items)
         
         return translated
-    
-    def _translate_list(self, items: List[str], target_lang: str) -> List[str]:
+
+    async def _translate_list(self, items: List[str], target_lang: str) -> List[str]:
+        return await self.translate_many(items[:10], target_lang)  # Limit to 10 items
+
+    async def translate_many(self, items: List[str], target_lang: str) -> List[str]:
+        """Translate a list of strings; empty or very long items are returned unchanged"""
+        # Validate target language
+        if target_lang not in self.supported_languages:
+            return items
+        
+        # Sanitize input and dedupe: each distinct string is translated at most once
+        keys = [html.escape(item.strip()) if item and item.strip() and len(item) < 500 else None for item in items]
+        unique = list(dict.fromkeys(key for key in keys if key is not None))
+        if not unique:
+            return items
+        
         try:
-            # Validate target language
-            if target_lang not in self.supported_languages:
-                return items
-            
-            translated_items = []
-            for item in items[:10]:  # Limit to 10 items
-                if item and len(item.strip()) > 0 and len(item) < 500:
-                    # Sanitize input
-                    clean_item = html.escape(item.strip())
-                    result = self.translator.translate(clean_item, dest=target_lang)
-                    translated_items.append(html.unescape(result.text))
-                    time.sleep(0.1)  # Rate limiting
-                else:
-                    translated_items.append(item)
-            return translated_items
+            translations = await self._lookup(unique, target_lang)
+            missing = [key for key in unique if key not in translations]
+            if missing:
+                fresh = await self._translate_missing(missing, target_lang)
+                translations.update(fresh)
+                if self.memory:
+                    await asyncio.to_thread(save_translations, fresh, target_lang)
         except Exception:
-            return items  # Return original if translation fails
\ No newline at end of file
+            return items  # Return original if translation fails
+        
+        return [html.unescape(translations[key]) if key is not None else item for item, key in zip(items, keys)]
+
+    async def _lookup(self, texts: List[str], target_lang: str) -> Dict[str, str]:
+        if not self.memory:
+            return {}
+        if not self._db_ready:
+            await asyncio.to_thread(init_db)
+            self._db_ready = True
+        # One indexed query for the whole batch
+        found = await asyncio.to_thread(get_translations, texts, target_lang)
+        self.memory_hits += len(found)
+        return found
+
+    async def _translate_missing(self, texts: List[str], target_lang: str) -> Dict[str, str]:
+        batches = [texts[start:start + TRANSLATION_BATCH_SIZE] for start in range(0, len(texts), TRANSLATION_BATCH_SIZE)]
+        
+        async def run(batch: List[str]) -> List[str]:
+            # A few batches in flight at once instead of sleeping between single strings
+            async with self._backend_slots:
+                return await self.backend.translate_batch(batch, target_lang)
+        
+        results = await asyncio.gather(*(run(batch) for batch in batches))
+        translations = {}
+        for batch, translated in zip(batches, results):
+            if len(translated) != len(batch):
+                raise ValueError("Translation backend returned a different number of texts")
+            translations.update(zip(batch, translated))
+        self.backend_translations += len(translations)
+        return translations
+
+    async def aclose(self):
+        await self.backend.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "memory": self.memory,
+            "memory_hits": self.memory_hits,
+            "backend_translations": self.backend_translations
+        }
@@ -0,0 +1,191 @@
+"""
+Single-pass multi-pattern skill matcher
+
+Every canonical skill name and alias is compiled once into a character trie, which is
+turned into a single trie-shaped regex alternation. One scan over the text (running in
+C) reports the longest skill at every position; skills that overlap it from the same
+position, such as "Spring" inside "Spring Boot", are recovered from a table of nested
+terms computed at build time.
+
+Word boundaries follow the semantics of re's \\b, so results are identical to running
+re.search(r'\\b' + re.escape(skill) + r'\\b', text.lower()) once per skill.
+
+locate() keeps the offset of every occurrence instead of only the set of skills, so the
+skills of any part of the text (a section, a job entry) are an interval lookup on the
+one scan of the whole text rather than another scan of the part.
+"""
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+_END = ""  # Trie key marking the end of a term (never a real character)
+
+def _is_word_char(char: str) -> bool:
+    # Same definition re uses for \b on str patterns
+    return char.isalnum() or char == "_"
+
+class SkillMatcher:
+    def __init__(self, skills: List[str], aliases: Dict[str, List[str]] = None):
+        aliases = aliases or {}
+
+        # Output order and cleanup mirror the original per-skill loop
+        self.skills: List[str] = []
+        for skill in skills:
+            skill = skill.strip()
+            if len(skill) > 1 and skill not in self.skills:
+                self.skills.append(skill)
+        # lowercase key -> (database position, skill) of the skills it names
+        self._skills_by_key: Dict[str, List[Tuple[int, str]]] = {}
+        for position, skill in enumerate(self.skills):
+            self._skills_by_key.setdefault(skill.lower(), []).append((position, skill))
+
+        # term (lowercase text to find) -> lowercase canonical skill keys it stands for
+        self._term_keys: Dict[str, set] = {}
+        canonical_keys = {skill.lower() for skill in skills}
+        for key in canonical_keys:
+            self._term_keys.setdefault(key, set()).add(key)
+        for key, variations in aliases.items():
+            if key in canonical_keys:
+                for variation in variations:
+                    self._term_keys.setdefault(variation.lower(), set()).add(key)
+
+        self._trie: dict = {}
+        for term in self._term_keys:
+            node = self._trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[_END] = term
+
+        # The regex reports the longest term at each position. Shorter terms starting at the
+        # same position are prefixes of it, and whether a word boundary follows such a prefix
+        # depends only on the longer term's own characters, so it is decided here once
+        self._nested_terms: Dict[str, List[str]] = {}
+        for term in self._term_keys:
+            self._nested_terms[term] = [
+                term[:length] for length in range(1, len(term))
+                if term[:length] in self._term_keys
+                and _is_word_char(term[length - 1]) != _is_word_char(term[length])
+            ]
+
+        # Zero-width lookahead so overlapping occurrences at later positions are all reported
+        self._pattern = re.compile(r"\b(?=(" + self._trie_regex(self._trie) + r")\b)")
+
+    def _trie_regex(self, node: dict) -> str:
+        # Longer continuations are tried first; the optional group lets the regex
+        # backtrack to a shorter term when the longer one fails the \b check
+        branches = [re.escape(char) + self._trie_regex(child)
+                    for char, child in sorted(node.items()) if char != _END]
+        if not branches:
+            return ""
+        if len(branches) == 1 and _END not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if _END in node else group
+
+    def scan(self, text_lower: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, term) for every term occurrence bounded by word boundaries"""
+        for match in self._pattern.finditer(text_lower):
+            start = match.start()
+            term = match.group(1)
+            yield start, start + len(term), term
+            for nested in self._nested_terms[term]:
+                yield start, start + len(nested), nested
+
+    def match_keys(self, text: str) -> set:
+        """Lowercase canonical keys of every skill present in the text"""
+        keys = set()
+        # findall + set keep the whole scan in C; only distinct terms are expanded
+        for term in set(self._pattern.findall(text.lower())):
+            keys.update(self._term_keys[term])
+            for nested in self._nested_terms[term]:
+                keys.update(self._term_keys[nested])
+        return keys
+
+    def find(self, text: str) -> List[str]:
+        """Canonical skills present in the text, in skill-database order"""
+        return self.ordered(self.match_keys(text))
+
+    def ordered(self, keys: set) -> List[str]:
+        """Canonical skills for a set of lowercase keys, in skill-database order"""
+        found = [entry for key in keys for entry in self._skills_by_key.get(key, ())]
+        found.sort()
+        return [skill for _, skill in found]
+
+    def locate(self, text: str) -> "SkillOccurrences":
+        """Every skill occurrence in the text with its character offsets, from a single scan"""
+        return SkillOccurrences(self, text)
+
+def _lowercase_offsets(text: str) -> Tuple[str, Optional[List[int]]]:
+    """text.lower() and, if lowering changed its length ("İ" -> "i̇"), each lowered index's source index"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered, None
+    origin = []
+    for index, char in enumerate(text):
+        origin.extend([index] * len(char.lower()))
+    origin.append(len(text))
+    return lowered, origin
+
+class SkillOccurrences:
+    """Skill occurrences of one text, sorted by start offset, queried by character interval"""
+
+    def __init__(self, matcher: SkillMatcher, text: str):
+        self.matcher = matcher
+        self.text = text
+        lowered, origin = _lowercase_offsets(text)
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.terms: List[str] = []
+        for start, end, term in matcher.scan(lowered):
+            if origin is not None:
+                start, end = origin[start], origin[end]
+            self.starts.append(start)
+            self.ends.append(end)
+            self.terms.append(term)
+
+    @classmethod
+    def joined(cls, matcher: SkillMatcher, text: str,
+               pieces: Iterable[Tuple[int, List[int], List[int], List[str]]]) -> "SkillOccurrences":
+        """Occurrences of a text from those of consecutive pieces of it, given as (offset, starts, ends, terms)
+
+        Exact when every piece starts right after a line break: no skill contains one, so
+        no occurrence crosses a piece boundary and word boundaries at the edges agree.
+        """
+        occurrences = cls.__new__(cls)
+        occurrences.matcher = matcher
+        occurrences.text = text
+        occurrences.starts, occurrences.ends, occurrences.terms = [], [], []
+        for offset, starts, ends, terms in pieces:
+            occurrences.starts.extend(start + offset for start in starts)
+            occurrences.ends.extend(end + offset for end in ends)
+            occurrences.terms.extend(terms)
+        return occurrences
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def _keys_between(self, start: int, end: int, keys: set):
+        # Occurrences lying entirely inside [start, end)
+        index = bisect_left(self.starts, start)
+        while index < len(self.starts) and self.starts[index] < end:
+            if self.ends[index] <= end:
+                keys.update(self.matcher._term_keys[self.terms[index]])
+            index += 1
+
+    def all(self) -> List[str]:
+        """Canonical skills anywhere in the text (same as SkillMatcher.find on it)"""
+        keys = set()
+        for term in set(self.terms):
+            keys.update(self.matcher._term_keys[term])
+        return self.matcher.ordered(keys)
+
+    def between(self, start: int, end: int) -> List[str]:
+        """Canonical skills occurring inside text[start:end], in skill-database order"""
+        return self.within([(start, end)])
+
+    def within(self, spans: Iterable[Tuple[int, int]]) -> List[str]:
+        """Canonical skills occurring inside any of the (start, end) spans, in skill-database order"""
+        keys = set()
+        for start, end in spans:
+            self._keys_between(start, end, keys)
+        return self.matcher.ordered(keys)
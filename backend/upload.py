@@ -0,0 +1,181 @@
+"""
+Streaming ingestion of resume uploads
+
+read_upload pulls an UploadFile in fixed-size chunks, enforcing the byte cap as it goes
+and computing the SHA-256 cache key in the same pass. Small uploads stay in memory;
+anything past UPLOAD_SPILL_BYTES is written to a temporary file, and only its path is
+sent to the analysis workers, which map it with mmap instead of receiving a pickled copy.
+
+UploadLimitMiddleware applies the cap one level lower, to the raw request body, so an
+oversized request is refused before the multipart parser has buffered it.
+"""
+import asyncio
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Union
+
+from fastapi import HTTPException
+
+MAX_UPLOAD_BYTES = int(float(os.environ.get("MAX_UPLOAD_MB", 10)) * 1024 * 1024)
+UPLOAD_SPILL_BYTES = int(os.environ.get("UPLOAD_SPILL_KB", 1024)) * 1024
+UPLOAD_TMP_DIR = os.environ.get("UPLOAD_TMP_DIR") or None  # None: the system temp directory
+CHUNK_BYTES = 256 * 1024
+# Multipart boundaries, part headers and small form fields on top of the file itself
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# What the analysis workers receive: the bytes themselves, or the path of a spilled upload
+Payload = Union[bytes, str]
+
+class UploadTooLarge(ValueError):
+    """The upload exceeded its byte cap while being read"""
+
+class Upload:
+    """A fully read upload: its content (in memory or spilled to disk) and SHA-256 digest"""
+
+    def __init__(self, payload: Payload, size: int, sha256: str):
+        self.payload = payload
+        self.size = size
+        self.sha256 = sha256
+
+    @classmethod
+    def from_bytes(cls, content: bytes) -> "Upload":
+        return cls(content, len(content), hashlib.sha256(content).hexdigest())
+
+    @property
+    def spilled(self) -> bool:
+        return isinstance(self.payload, str)
+
+    def close(self):
+        """Remove the spill file, if any; workers that still map it keep their mapping"""
+        if self.spilled:
+            try:
+                os.unlink(self.payload)
+            except FileNotFoundError:
+                pass
+
+async def read_upload(file, max_bytes: int = MAX_UPLOAD_BYTES, spill_bytes: int = UPLOAD_SPILL_BYTES) -> Upload:
+    """Read an UploadFile chunk by chunk, hashing it and spilling it to disk past spill_bytes"""
+    digest = hashlib.sha256()
+    buffer = bytearray()
+    spill = None
+    size = 0
+    try:
+        while True:
+            chunk = await file.read(CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLarge(f"File size too large. Maximum {max_bytes // (1024 * 1024)}MB allowed")
+            digest.update(chunk)
+            if spill is not None:
+                await asyncio.to_thread(spill.write, chunk)
+                continue
+            buffer += chunk
+            if len(buffer) > spill_bytes:
+                spill = tempfile.NamedTemporaryFile(prefix="upload-", dir=UPLOAD_TMP_DIR, delete=False)
+                await asyncio.to_thread(spill.write, buffer)
+                buffer = None
+    except BaseException:
+        if spill is not None:
+            spill.close()
+            os.unlink(spill.name)
+        raise
+
+    if spill is None:
+        return Upload(bytes(buffer), size, digest.hexdigest())
+    spill.close()
+    return Upload(spill.name, size, digest.hexdigest())
+
+class MappedFile(io.RawIOBase):
+    """Read-only, seekable file object over an mmap (zipfile needs seekable(), which mmap lacks before 3.13)"""
+
+    def __init__(self, mapping: mmap.mmap):
+        self._mapping = mapping
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = max(min(len(buffer), len(self._mapping) - self._position), 0)
+        buffer[:count] = self._mapping[self._position:self._position + count]
+        self._position += count
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: len(self._mapping)}[whence]
+        self._position = max(base + offset, 0)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+@contextmanager
+def open_payload(payload: Payload) -> Iterator[Union[bytes, MappedFile]]:
+    """The upload's content: the bytes as they are, or a spilled file mapped into memory"""
+    if not isinstance(payload, str):
+        yield payload
+        return
+    with open(payload, "rb") as spilled:
+        if os.fstat(spilled.fileno()).st_size == 0:
+            yield b""  # mmap cannot map an empty file
+            return
+        with mmap.mmap(spilled.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            yield MappedFile(mapping)
+
+class RequestBodyTooLarge(HTTPException):
+    """HTTPException so FastAPI passes it through its body parsing untouched"""
+
+    def __init__(self, limit: int):
+        super().__init__(status_code=413, detail=f"Request body too large. Maximum {limit // (1024 * 1024)}MB allowed")
+
+class UploadLimitMiddleware:
+    """ASGI middleware capping the request body size of selected routes while it is received"""
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit: Optional[int] = self.limits.get(scope.get("path")) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        # A declared length over the limit is refused without reading anything
+        for name, value in scope.get("headers", []):
+            if name == b"content-length" and value.isdigit() and int(value) > limit:
+                await self._reject(send, limit)
+                return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise RequestBodyTooLarge(limit)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    @staticmethod
+    async def _reject(send, limit: int):
+        body = ('{"detail":"Request body too large. Maximum %dMB allowed"}' % (limit // (1024 * 1024))).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode()),
+                        (b"connection", b"close")]
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,192 @@
+"""
+Process pool that runs the CPU-bound resume analysis pipeline off the event loop
+
+A task holds one of queue_depth slots from submission until the worker is done with it,
+not until its caller stops waiting: a request cancelled by a client disconnect leaves its
+task running, and that task still counts against the backlog. multiprocessing.Pool never
+reports a task whose worker process died, so a task that has not finished after
+ANALYSIS_TASK_TIMEOUT seconds fails its caller and gives its slot back.
+
+A request whose analysis takes several tasks in a row reserves one slot for all of them
+(with pool.reserve() as slot: ... pool.run(func, *args, slot=slot)), so it cannot be
+turned away halfway, after its first task already did work.
+"""
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+from typing import Any, Callable, Optional
+
+class PoolSaturatedError(RuntimeError):
+    """Raised when the pool already holds its maximum number of pending tasks"""
+
+class AnalysisTimeoutError(RuntimeError):
+    """Raised when a task did not finish in time (its worker may have died)"""
+
+class PoolSlot:
+    """One queue slot held across several tasks; freed once closed and none of its tasks is running"""
+
+    def __init__(self, pool: "AnalysisPool"):
+        self._pool = pool
+        self._running = 0
+        self._closed = False
+        self._freed = False
+
+    def __enter__(self) -> "PoolSlot":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """No more tasks will be run in this slot"""
+        self._closed = True
+        self._free_if_idle()
+
+    def _task_started(self):
+        self._running += 1
+
+    def _task_done(self):
+        self._running -= 1
+        self._free_if_idle()
+
+    def _free_if_idle(self):
+        if self._closed and self._running == 0 and not self._freed:
+            self._freed = True
+            self._pool.pending -= 1
+
+class AnalysisPool:
+    def __init__(self, workers: Optional[int] = None, max_tasks_per_child: Optional[int] = None,
+                 queue_depth: Optional[int] = None, initializer: Optional[Callable[[], None]] = None,
+                 task_timeout: Optional[float] = None):
+        # Configuration falls back to environment variables so deployments can tune it without code changes
+        if workers is None:
+            workers = int(os.environ.get("ANALYSIS_WORKERS", os.cpu_count() or 1))
+        if max_tasks_per_child is None:
+            max_tasks_per_child = int(os.environ.get("ANALYSIS_MAX_TASKS_PER_CHILD", 100))
+        if queue_depth is None:
+            queue_depth = int(os.environ.get("ANALYSIS_QUEUE_DEPTH", max(workers, 1) * 4))
+        if task_timeout is None:
+            task_timeout = float(os.environ.get("ANALYSIS_TASK_TIMEOUT", 120))
+
+        self.workers = max(workers, 0)
+        self.max_tasks_per_child = max_tasks_per_child if max_tasks_per_child > 0 else None
+        self.queue_depth = max(queue_depth, 1)
+        self.initializer = initializer
+        self.task_timeout = task_timeout if task_timeout > 0 else None
+        self.pending = 0
+        self.timeouts = 0
+        self._pool = None
+        self._threads: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def start(self):
+        """Spawn the worker processes (no-op in inline mode, i.e. workers == 0)"""
+        if self.workers == 0 or self._pool is not None:
+            return
+
+        # Fork keeps already-imported modules shared copy-on-write; fall back where it is unavailable
+        start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        context = multiprocessing.get_context(start_method)
+        self._pool = context.Pool(
+            processes=self.workers,
+            initializer=self.initializer,
+            maxtasksperchild=self.max_tasks_per_child
+        )
+
+    def shutdown(self):
+        """Stop accepting work and wait for the worker processes to exit"""
+        if self._threads is not None:
+            self._threads.shutdown(wait=True)
+            self._threads = None
+        if self._pool is None:
+            return
+        if self.timeouts:
+            # A task lost with its worker stays in the pool's cache, and join() after close() waits for it forever
+            self._pool.terminate()
+        else:
+            self._pool.close()
+        self._pool.join()
+        self._pool = None
+
+    def reserve(self) -> PoolSlot:
+        """Take a queue slot for one or more tasks; raises PoolSaturatedError when none is left"""
+        if self.pending >= self.queue_depth:
+            raise PoolSaturatedError("Analysis queue is full")
+        self.pending += 1
+        return PoolSlot(self)
+
+    async def run(self, func: Callable[..., Any], *args: Any, slot: Optional[PoolSlot] = None) -> Any:
+        """Run func(*args) in a worker process without blocking the event loop
+
+        The task takes a slot of its own unless it runs in one the caller reserved.
+        """
+        if slot is None:
+            with self.reserve() as own_slot:
+                return await self.run(func, *args, slot=own_slot)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        released = False
+
+        def _release():
+            # Runs on the loop: when the task finishes, or when it times out, whichever is first
+            nonlocal released
+            if not released:
+                released = True
+                slot._task_done()
+
+        def _resolve(result):
+            loop.call_soon_threadsafe(_release)
+            loop.call_soon_threadsafe(_set_future_result, future, result)
+
+        def _reject(error):
+            loop.call_soon_threadsafe(_release)
+            loop.call_soon_threadsafe(_set_future_exception, future, error)
+
+        slot._task_started()
+        try:
+            if self._pool is None:
+                # Inline mode still keeps the loop responsive by using a thread
+                if self._threads is None:
+                    self._threads = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="analysis")
+                self._threads.submit(func, *args).add_done_callback(lambda done: _settle(done, _resolve, _reject))
+            else:
+                self._pool.apply_async(func, args, callback=_resolve, error_callback=_reject)
+        except BaseException:
+            _release()
+            raise
+
+        try:
+            # Cancellation (client disconnect) only stops the waiting; the slot stays taken until the task ends
+            return await asyncio.wait_for(future, self.task_timeout)
+        except asyncio.TimeoutError:
+            _release()
+            self.timeouts += 1
+            raise AnalysisTimeoutError(f"Analysis did not finish within {self.task_timeout:g} seconds")
+
+    def stats(self) -> dict:
+        return {
+            "mode": "process" if self._pool is not None else "inline",
+            "workers": self.workers,
+            "max_tasks_per_child": self.max_tasks_per_child,
+            "queue_depth": self.queue_depth,
+            "task_timeout": self.task_timeout,
+            "pending": self.pending,
+            "timeouts": self.timeouts
+        }
+
+def _settle(done: concurrent.futures.Future, resolve: Callable[[Any], None], reject: Callable[[BaseException], None]):
+    error = done.exception()
+    if error is None:
+        resolve(done.result())
+    else:
+        reject(error)
+
+def _set_future_result(future: asyncio.Future, result: Any):
+    # The awaiting request may have been cancelled (client disconnect) before the worker finished
+    if not future.done():
+        future.set_result(result)
+
+def _set_future_exception(future: asyncio.Future, error: BaseException):
+    if not future.done():
+        future.set_exception(error)